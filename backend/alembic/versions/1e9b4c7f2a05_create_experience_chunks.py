@@ -0,0 +1,37 @@
+"""Create experience_chunks
+
+Revision ID: 1e9b4c7f2a05
+Revises: f05c8b2e6d41
+Create Date: 2026-10-19 17:46:20.583916
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+import pgvector.sqlalchemy
+
+
+# revision identifiers, used by Alembic.
+revision: str = '1e9b4c7f2a05'
+down_revision: Union[str, None] = 'f05c8b2e6d41'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # Chunks are always read for one user's experiences and scored exactly, so no vector index.
+    # Existing experiences are chunked on the fly during ranking until they are next written.
+    op.create_table('experience_chunks',
+    sa.Column('experience_id', sa.UUID(), nullable=False),
+    sa.Column('chunk_index', sa.Integer(), nullable=False),
+    sa.Column('content', sa.Text(), nullable=False),
+    sa.Column('embedding', pgvector.sqlalchemy.Vector(dim=384), nullable=False),
+    sa.Column('created_at', sa.DateTime(timezone=True), server_default=sa.text('now()'), nullable=True),
+    sa.ForeignKeyConstraint(['experience_id'], ['experiences.id'], ondelete='CASCADE'),
+    sa.PrimaryKeyConstraint('experience_id', 'chunk_index')
+    )
+
+
+def downgrade() -> None:
+    op.drop_table('experience_chunks')
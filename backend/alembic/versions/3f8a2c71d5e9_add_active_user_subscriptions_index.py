@@ -0,0 +1,33 @@
+"""Add partial index on active user_subscriptions
+
+Revision ID: 3f8a2c71d5e9
+Revises: 9b4d6f1e3a27
+Create Date: 2026-10-19 14:41:52.603918
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '3f8a2c71d5e9'
+down_revision: Union[str, None] = '9b4d6f1e3a27'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # Only active subscriptions are ever looked up by user
+    op.create_index(
+        'ix_user_subscriptions_active_user_id',
+        'user_subscriptions',
+        ['user_id'],
+        unique=False,
+        postgresql_where=sa.text("status = 'active'")
+    )
+
+
+def downgrade() -> None:
+    op.drop_index('ix_user_subscriptions_active_user_id', table_name='user_subscriptions')
@@ -0,0 +1,32 @@
+"""Add cover_letters (user_id, created_at DESC) index
+
+Revision ID: 5d2e91b0c4f7
+Revises: a08b17ce8736
+Create Date: 2026-10-19 10:03:17.264530
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '5d2e91b0c4f7'
+down_revision: Union[str, None] = 'a08b17ce8736'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # Serves the keyset-paginated cover letter listing; id breaks ties between equal timestamps
+    op.create_index(
+        'ix_cover_letters_user_id_created_at',
+        'cover_letters',
+        ['user_id', sa.text('created_at DESC'), sa.text('id DESC')],
+        unique=False
+    )
+
+
+def downgrade() -> None:
+    op.drop_index('ix_cover_letters_user_id_created_at', table_name='cover_letters')
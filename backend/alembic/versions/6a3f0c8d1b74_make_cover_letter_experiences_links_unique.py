@@ -0,0 +1,52 @@
+"""Make cover_letter_experiences (cover_letter_id, experience_id) unique
+
+Revision ID: 6a3f0c8d1b74
+Revises: 1e9b4c7f2a05
+Create Date: 2026-10-19 18:12:40.207316
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '6a3f0c8d1b74'
+down_revision: Union[str, None] = '1e9b4c7f2a05'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # Keep the earliest-ordered link of each duplicated pair before enforcing uniqueness
+    op.execute("""
+        DELETE FROM cover_letter_experiences
+        USING (
+            SELECT id, ROW_NUMBER() OVER (
+                PARTITION BY cover_letter_id, experience_id
+                ORDER BY relevance_order, created_at, id
+            ) AS position
+            FROM cover_letter_experiences
+        ) AS ranked
+        WHERE cover_letter_experiences.id = ranked.id
+          AND ranked.position > 1
+    """)
+    op.drop_index('ix_cover_letter_experiences_cover_letter_id_experience_id', table_name='cover_letter_experiences')
+    # Conflict target for adding an experience to a cover letter
+    op.create_index(
+        'uq_cover_letter_experiences_cover_letter_id_experience_id',
+        'cover_letter_experiences',
+        ['cover_letter_id', 'experience_id'],
+        unique=True
+    )
+
+
+def downgrade() -> None:
+    op.drop_index('uq_cover_letter_experiences_cover_letter_id_experience_id', table_name='cover_letter_experiences')
+    op.create_index(
+        'ix_cover_letter_experiences_cover_letter_id_experience_id',
+        'cover_letter_experiences',
+        ['cover_letter_id', 'experience_id'],
+        unique=False
+    )
@@ -0,0 +1,33 @@
+"""Add GIN full-text index on experiences content
+
+Revision ID: 7c1d9e5a0b36
+Revises: b62e0d94c1f8
+Create Date: 2026-10-19 15:52:39.740112
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '7c1d9e5a0b36'
+down_revision: Union[str, None] = 'b62e0d94c1f8'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # Must match experience_search_vector() in models/experience.py for the planner to use it
+    op.create_index(
+        'ix_experiences_content_search',
+        'experiences',
+        [sa.text("to_tsvector('english'::regconfig, content_for_embedding)")],
+        unique=False,
+        postgresql_using='gin'
+    )
+
+
+def downgrade() -> None:
+    op.drop_index('ix_experiences_content_search', table_name='experiences')
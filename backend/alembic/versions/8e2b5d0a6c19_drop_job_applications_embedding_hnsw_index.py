@@ -0,0 +1,36 @@
+"""Drop job_applications embedding HNSW index
+
+Revision ID: 8e2b5d0a6c19
+Revises: 6a3f0c8d1b74
+Create Date: 2026-10-19 18:41:05.638214
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '8e2b5d0a6c19'
+down_revision: Union[str, None] = '6a3f0c8d1b74'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # Similarity search is always per user and exact, so nothing reads the index
+    # while every embedding write still pays to maintain it
+    op.drop_index('ix_job_applications_embedding_hnsw', table_name='job_applications')
+
+
+def downgrade() -> None:
+    op.create_index(
+        'ix_job_applications_embedding_hnsw',
+        'job_applications',
+        ['embedding'],
+        unique=False,
+        postgresql_using='hnsw',
+        postgresql_with={'m': 16, 'ef_construction': 64},
+        postgresql_ops={'embedding': 'vector_cosine_ops'}
+    )
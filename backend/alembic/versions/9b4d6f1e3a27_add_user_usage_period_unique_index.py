@@ -0,0 +1,52 @@
+"""Add unique user_usage (user_id, usage_period) index
+
+Revision ID: 9b4d6f1e3a27
+Revises: e71c3a9d2b50
+Create Date: 2026-10-19 14:02:17.418305
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '9b4d6f1e3a27'
+down_revision: Union[str, None] = 'e71c3a9d2b50'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # Fold any duplicate rows for the same period into one before enforcing uniqueness
+    op.execute("""
+        WITH totals AS (
+            SELECT user_id, usage_period, SUM(COALESCE(cover_letters_generated, 0)) AS total, MIN(id::text) AS keep_id
+            FROM user_usage
+            GROUP BY user_id, usage_period
+            HAVING COUNT(*) > 1
+        ),
+        kept AS (
+            UPDATE user_usage
+            SET cover_letters_generated = totals.total
+            FROM totals
+            WHERE user_usage.id::text = totals.keep_id
+        )
+        DELETE FROM user_usage
+        USING totals
+        WHERE user_usage.user_id = totals.user_id
+          AND user_usage.usage_period = totals.usage_period
+          AND user_usage.id::text <> totals.keep_id
+    """)
+    # Conflict target for the atomic quota upsert
+    op.create_index(
+        'uq_user_usage_user_id_usage_period',
+        'user_usage',
+        ['user_id', 'usage_period'],
+        unique=True
+    )
+
+
+def downgrade() -> None:
+    op.drop_index('uq_user_usage_user_id_usage_period', table_name='user_usage')
@@ -0,0 +1,32 @@
+"""Add experiences (user_id, start_date DESC) index
+
+Revision ID: a08b17ce8736
+Revises: c3267ee127fd
+Create Date: 2026-10-19 09:12:41.508113
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'a08b17ce8736'
+down_revision: Union[str, None] = 'c3267ee127fd'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # Serves the keyset-paginated experience listing; id breaks ties between equal start dates
+    op.create_index(
+        'ix_experiences_user_id_start_date',
+        'experiences',
+        ['user_id', sa.text('start_date DESC'), sa.text('id DESC')],
+        unique=False
+    )
+
+
+def downgrade() -> None:
+    op.drop_index('ix_experiences_user_id_start_date', table_name='experiences')
@@ -0,0 +1,99 @@
+"""Seed skill vocabulary and index experience_skills by skill
+
+Revision ID: b62e0d94c1f8
+Revises: 3f8a2c71d5e9
+Create Date: 2026-10-19 15:17:08.271644
+
+"""
+from typing import Sequence, Union
+import uuid
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'b62e0d94c1f8'
+down_revision: Union[str, None] = '3f8a2c71d5e9'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+# Initial vocabulary for skill extraction. Names that are also ordinary words
+# (C, R, Go, Swift, Spring, Express, REST) are left out or qualified.
+SKILLS = {
+    "language": [
+        "Python", "Java", "JavaScript", "TypeScript", "C++", "C#", "Golang", "Rust", "Ruby", "PHP",
+        "Kotlin", "Scala", "SQL", "Bash", "MATLAB", "Objective-C", "Dart", "Elixir", "Haskell",
+    ],
+    "framework": [
+        "FastAPI", "Django", "Flask", "Spring Boot", "Node.js", "Express.js", "React", "Angular",
+        "Vue.js", "Next.js", "Svelte", "Ruby on Rails", ".NET", "ASP.NET", "Laravel", "Flutter",
+        "React Native", "SQLAlchemy", "GraphQL", "gRPC", "REST API",
+    ],
+    "data": [
+        "PostgreSQL", "MySQL", "SQLite", "MongoDB", "Redis", "Elasticsearch", "Cassandra", "DynamoDB",
+        "Snowflake", "BigQuery", "Redshift", "Apache Spark", "Kafka", "Airflow", "dbt", "Hadoop",
+        "Pandas", "NumPy", "Tableau", "Power BI", "ETL", "Data Warehousing",
+    ],
+    "ml": [
+        "Machine Learning", "Deep Learning", "TensorFlow", "PyTorch", "scikit-learn", "NLP",
+        "Computer Vision", "LLM", "Hugging Face", "MLOps", "Data Science", "Statistics",
+    ],
+    "cloud": [
+        "AWS", "Azure", "GCP", "Google Cloud", "Docker", "Kubernetes", "Terraform", "Ansible", "Helm",
+        "CI/CD", "Jenkins", "GitHub Actions", "GitLab CI", "Linux", "Serverless", "AWS Lambda",
+        "Microservices", "Prometheus", "Grafana", "OpenTelemetry",
+    ],
+    "practice": [
+        "Agile", "Scrum", "Kanban", "TDD", "Unit Testing", "System Design", "Distributed Systems",
+        "Performance Optimization", "Security", "OAuth", "Git", "Code Review",
+    ],
+    "design": ["Figma", "Sketch", "UX Research", "UI Design", "Prototyping", "Accessibility"],
+    "business": [
+        "Product Management", "Project Management", "Stakeholder Management", "Technical Writing",
+        "Mentoring", "Leadership", "Communication", "Customer Success", "Sales", "Marketing", "SEO",
+    ],
+}
+
+
+def upgrade() -> None:
+    op.create_index('ix_experience_skills_skill_id', 'experience_skills', ['skill_id'], unique=False)
+
+    skills = sa.table(
+        'skills',
+        sa.column('id', sa.UUID()),
+        sa.column('name', sa.String()),
+        sa.column('category', sa.String())
+    )
+    rows = [
+        {"id": uuid.uuid4(), "name": name, "category": category}
+        for category, names in SKILLS.items()
+        for name in names
+    ]
+    op.execute(
+        postgresql.insert(skills)
+        .values(rows)
+        .on_conflict_do_nothing(index_elements=['name'])
+    )
+
+    # Tag existing experiences so skill overlap works before they are next edited.
+    # Whole-word, case-insensitive match with the skill name's regex metacharacters escaped.
+    op.execute(r"""
+        INSERT INTO experience_skills (experience_id, skill_id)
+        SELECT e.id, s.id
+        FROM experiences e
+        JOIN skills s
+          ON e.content_for_embedding ~* (
+              '(^|[^[:alnum:]])'
+              || regexp_replace(s.name, '([.+*?^$()\[\]{}|\\])', '\\\1', 'g')
+              || '([^[:alnum:]]|$)'
+          )
+        ON CONFLICT DO NOTHING
+    """)
+
+
+def downgrade() -> None:
+    # Seeded skills are left in place; they may be referenced by user data by now
+    op.drop_index('ix_experience_skills_skill_id', table_name='experience_skills')
@@ -0,0 +1,58 @@
+"""Resize job_applications.embedding to 384 dimensions and add HNSW index
+
+Revision ID: d4a7f3b8e912
+Revises: 7c1d9e5a0b36
+Create Date: 2026-10-19 16:24:11.352870
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+import pgvector.sqlalchemy
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'd4a7f3b8e912'
+down_revision: Union[str, None] = '7c1d9e5a0b36'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # The column was never written; embeddings now come from all-MiniLM-L6-v2 (384 dimensions)
+    op.alter_column(
+        'job_applications',
+        'embedding',
+        type_=pgvector.sqlalchemy.Vector(dim=384),
+        existing_type=pgvector.sqlalchemy.Vector(dim=1536),
+        postgresql_using='NULL::vector(384)'
+    )
+    # HNSW needs pgvector 0.5.0 or later
+    op.create_index(
+        'ix_job_applications_embedding_hnsw',
+        'job_applications',
+        ['embedding'],
+        unique=False,
+        postgresql_using='hnsw',
+        postgresql_with={'m': 16, 'ef_construction': 64},
+        postgresql_ops={'embedding': 'vector_cosine_ops'}
+    )
+    op.create_index(
+        'ix_job_applications_user_id_created_at',
+        'job_applications',
+        ['user_id', sa.text('created_at DESC')],
+        unique=False
+    )
+
+
+def downgrade() -> None:
+    op.drop_index('ix_job_applications_user_id_created_at', table_name='job_applications')
+    op.drop_index('ix_job_applications_embedding_hnsw', table_name='job_applications')
+    op.alter_column(
+        'job_applications',
+        'embedding',
+        type_=pgvector.sqlalchemy.Vector(dim=1536),
+        existing_type=pgvector.sqlalchemy.Vector(dim=384),
+        postgresql_using='NULL::vector(1536)'
+    )
@@ -0,0 +1,32 @@
+"""Add cover_letter_experiences (cover_letter_id, experience_id) index
+
+Revision ID: e71c3a9d2b50
+Revises: 5d2e91b0c4f7
+Create Date: 2026-10-19 11:26:54.930182
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'e71c3a9d2b50'
+down_revision: Union[str, None] = '5d2e91b0c4f7'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # Serves the selectin load of a cover letter's links and the membership existence check
+    op.create_index(
+        'ix_cover_letter_experiences_cover_letter_id_experience_id',
+        'cover_letter_experiences',
+        ['cover_letter_id', 'experience_id'],
+        unique=False
+    )
+
+
+def downgrade() -> None:
+    op.drop_index('ix_cover_letter_experiences_cover_letter_id_experience_id', table_name='cover_letter_experiences')
@@ -0,0 +1,28 @@
+"""Add simhash to job_applications
+
+Revision ID: f05c8b2e6d41
+Revises: d4a7f3b8e912
+Create Date: 2026-10-19 17:03:45.118274
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'f05c8b2e6d41'
+down_revision: Union[str, None] = 'd4a7f3b8e912'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # Compared in the application against the user's recent rows, which
+    # ix_job_applications_user_id_created_at already serves, so no index here
+    op.add_column('job_applications', sa.Column('simhash', sa.BigInteger(), nullable=True))
+
+
+def downgrade() -> None:
+    op.drop_column('job_applications', 'simhash')
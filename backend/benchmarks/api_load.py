@@ -0,0 +1,284 @@
+"""
+Load-test the API in-process against a local database, with stubbed LLM and search providers.
+
+The app is driven through httpx's ASGI transport, so no server or network is
+involved: Bedrock, SerpAPI and the embedding model are replaced on app.state by
+the stubs in benchmarks/stubs.py. Requests authenticate with the DEV_MODE test
+token, so only DATABASE_URL (a disposable, migrated Postgres) is needed. The
+test user is subscribed to an unlimited tier, so generation scenarios measure
+generation rather than monthly quota rejections.
+
+Each scenario runs at every concurrency level and reports throughput and
+p50/p95/p99 latency. Reports are written as JSON keyed by git commit so runs
+can be compared across commits.
+
+Usage (from the backend directory):
+    DATABASE_URL=postgresql://localhost/coverletter_bench python benchmarks/api_load.py \\
+        [--concurrency 1,8,32] [--requests 200] [--experiences 20] \\
+        [--llm-latency 0.05] [--search-latency 0.02] [--compare benchmarks/results/<sha>.json]
+"""
+import argparse
+import asyncio
+import json
+import os
+import statistics
+import subprocess
+import sys
+import time
+import uuid
+from datetime import date, datetime, timezone
+
+BACKEND_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+RESULTS_DIR = os.path.join(BACKEND_DIR, "benchmarks", "results")
+
+# Must be in place before config.settings is imported
+os.environ.setdefault("DEV_MODE", "true")
+os.environ.setdefault("TEST_USER_ID", "benchmark-user")
+os.environ.setdefault("TEST_USER_EMAIL", "benchmark@example.com")
+os.environ.setdefault("TEST_USER_NAME", "Benchmark User")
+os.environ.setdefault("LOG_LEVEL", "WARNING")
+os.environ.setdefault("OTEL_TRACES_EXPORTER", "none")
+sys.path.insert(0, BACKEND_DIR)
+
+import httpx  # noqa: E402
+
+from benchmarks.stubs import StubBedrockClient, StubSearchClient, StubEmbeddingModel  # noqa: E402
+
+AUTH_HEADERS = {"Authorization": "Bearer dev_test_token"}
+BENCHMARK_TIER = "Benchmark (unlimited)"
+JOB_DESCRIPTION = (
+    "We are hiring a backend engineer to build Python APIs with FastAPI and PostgreSQL, "
+    "own performance and reliability, and mentor other engineers."
+)
+
+
+def git_sha() -> str:
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"],
+            cwd=BACKEND_DIR, capture_output=True, text=True, check=True
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return "unknown"
+
+
+def scenarios():
+    """Name -> (method, path, json body) for each benchmarked endpoint."""
+    return {
+        "list_experiences": ("GET", "/api/experiences/", None),
+        "list_cover_letters": ("GET", "/api/cover-letters", None),
+        "generate": ("POST", "/api/cover-letters/generate", {
+            "company_name": "Acme",
+            "hiring_manager": "Jordan Lee",
+            "job_description": JOB_DESCRIPTION,
+            "experiences": [{
+                "title": "Software Engineer",
+                "description": "Built Python services handling 2k requests per second.",
+                "skills": ["Python", "FastAPI", "PostgreSQL"],
+                "duration": "2 years"
+            }]
+        }),
+        "company_search": ("POST", "/api/company-search", {
+            "company_name": "Acme",
+            "job_description": JOB_DESCRIPTION
+        }),
+    }
+
+
+async def grant_unlimited_tier(user_id: uuid.UUID) -> None:
+    """Subscribe the user to a tier without a monthly cover letter limit."""
+    from sqlalchemy import select
+    from database import SessionLocal
+    from models.subscription import SubscriptionTier, UserSubscription
+
+    async with SessionLocal() as db:
+        tier = (await db.execute(
+            select(SubscriptionTier).where(SubscriptionTier.name == BENCHMARK_TIER)
+        )).scalars().first()
+        if tier is None:
+            tier = SubscriptionTier(
+                name=BENCHMARK_TIER,
+                price=0,
+                features="Unlimited cover letters for load tests",
+                max_cover_letters=0
+            )
+            db.add(tier)
+            await db.flush()
+        # The user's most recent active subscription decides the tier
+        current_tier_id = await db.scalar(
+            select(UserSubscription.tier_id)
+            .where(UserSubscription.user_id == user_id, UserSubscription.status == "active")
+            .order_by(UserSubscription.start_date.desc())
+            .limit(1)
+        )
+        if current_tier_id != tier.id:
+            db.add(UserSubscription(user_id=user_id, tier_id=tier.id, status="active"))
+        await db.commit()
+
+
+async def seed(client: httpx.AsyncClient, experiences: int) -> None:
+    """
+    Make sure the test user has an unlimited tier, `experiences` experiences
+    and at least one cover letter.
+    """
+    response = await client.post("/api/auth/register", json={"full_name": "Benchmark User"})
+    response.raise_for_status()
+    await grant_unlimited_tier(uuid.UUID(response.json()["id"]))
+
+    existing = await client.get("/api/experiences/", params={"limit": 500, "fields": "id"})
+    existing.raise_for_status()
+    for i in range(len(existing.json()), experiences):
+        response = await client.post("/api/experiences/", json={
+            "company_name": f"Company {i}",
+            "title": "Software Engineer",
+            "location": "Remote",
+            "start_date": date(2015 + i % 10, 1 + i % 12, 1).isoformat(),
+            "is_current": False,
+            "description": f"Built Python APIs and data pipelines, project {i}."
+        })
+        response.raise_for_status()
+
+    letters = await client.get("/api/cover-letters", params={"limit": 1})
+    letters.raise_for_status()
+    if not letters.json():
+        response = await client.post("/api/cover-letters", json={
+            "job_title": "Backend Engineer",
+            "company_name": "Acme",
+            "job_description": JOB_DESCRIPTION,
+            "tone": "professional",
+            "max_length": 400
+        })
+        response.raise_for_status()
+
+
+def percentile(sorted_values, pct: float) -> float:
+    if not sorted_values:
+        return 0.0
+    index = min(len(sorted_values) - 1, max(0, round(pct / 100 * len(sorted_values)) - 1))
+    return sorted_values[index]
+
+
+async def run_scenario(client: httpx.AsyncClient, method: str, path: str, body, concurrency: int, total: int):
+    """Issue `total` requests from `concurrency` workers; return the latency summary."""
+    latencies = []
+    errors = 0
+    remaining = total
+
+    async def worker():
+        nonlocal remaining, errors
+        while remaining > 0:
+            remaining -= 1
+            started = time.perf_counter()
+            response = await client.request(method, path, json=body)
+            latencies.append(time.perf_counter() - started)
+            if response.status_code >= 400:
+                errors += 1
+
+    started = time.perf_counter()
+    await asyncio.gather(*(worker() for _ in range(concurrency)))
+    elapsed = time.perf_counter() - started
+
+    latencies.sort()
+    return {
+        "requests": len(latencies),
+        "errors": errors,
+        "throughput_rps": round(len(latencies) / elapsed, 2),
+        "mean_ms": round(statistics.fmean(latencies) * 1000, 2),
+        "p50_ms": round(percentile(latencies, 50) * 1000, 2),
+        "p95_ms": round(percentile(latencies, 95) * 1000, 2),
+        "p99_ms": round(percentile(latencies, 99) * 1000, 2),
+    }
+
+
+async def run(args) -> dict:
+    from main import app
+    from database import engine
+
+    # Replace the lifespan-managed providers; the lifespan itself would initialize Firebase
+    app.state.bedrock_client = StubBedrockClient(args.llm_latency)
+    app.state.search_client = StubSearchClient(args.search_latency)
+    app.state.embedding_model = StubEmbeddingModel()
+
+    levels = [int(level) for level in args.concurrency.split(",")]
+    selected = set(args.scenarios.split(",")) if args.scenarios else None
+    results = {}
+
+    transport = httpx.ASGITransport(app=app)
+    try:
+        async with httpx.AsyncClient(transport=transport, base_url="http://bench", headers=AUTH_HEADERS, timeout=60) as client:
+            await seed(client, args.experiences)
+            for name, (method, path, body) in scenarios().items():
+                if selected and name not in selected:
+                    continue
+                # Warm caches and the connection pool before measuring
+                await run_scenario(client, method, path, body, 1, args.warmup)
+                results[name] = {}
+                for level in levels:
+                    summary = await run_scenario(client, method, path, body, level, args.requests)
+                    results[name][str(level)] = summary
+                    print(
+                        f"{name:20s} c={level:<4d} {summary['throughput_rps']:9.1f} req/s  "
+                        f"p50 {summary['p50_ms']:8.2f} ms  p95 {summary['p95_ms']:8.2f} ms  "
+                        f"p99 {summary['p99_ms']:8.2f} ms  errors {summary['errors']}"
+                    )
+    finally:
+        await engine.dispose()
+
+    return {
+        "git_sha": git_sha(),
+        "timestamp": datetime.now(timezone.utc).isoformat(),
+        "python": sys.version.split()[0],
+        "config": {
+            "requests": args.requests,
+            "experiences": args.experiences,
+            "llm_latency": args.llm_latency,
+            "search_latency": args.search_latency,
+        },
+        "results": results,
+    }
+
+
+def compare(current: dict, baseline: dict) -> None:
+    """Print throughput and p95 deltas against a previous report."""
+    print(f"\nCompared with {baseline['git_sha']} ({baseline['timestamp']}):")
+    for name, levels in current["results"].items():
+        for level, summary in levels.items():
+            previous = baseline.get("results", {}).get(name, {}).get(level)
+            if not previous:
+                continue
+            rps_change = (summary["throughput_rps"] / previous["throughput_rps"] - 1) * 100 if previous["throughput_rps"] else 0.0
+            p95_change = (summary["p95_ms"] / previous["p95_ms"] - 1) * 100 if previous["p95_ms"] else 0.0
+            print(f"  {name:20s} c={level:<4s} throughput {rps_change:+6.1f}%  p95 {p95_change:+6.1f}%")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--concurrency", default="1,8,32", help="Comma-separated concurrency levels")
+    parser.add_argument("--requests", type=int, default=200, help="Requests per scenario and level")
+    parser.add_argument("--warmup", type=int, default=10)
+    parser.add_argument("--experiences", type=int, default=20, help="Experiences to seed for the test user")
+    parser.add_argument("--llm-latency", type=float, default=0.05, help="Seconds each stub Bedrock call blocks")
+    parser.add_argument("--search-latency", type=float, default=0.02, help="Seconds each stub SerpAPI call blocks")
+    parser.add_argument("--scenarios", default="", help="Comma-separated subset of: " + ", ".join(scenarios()))
+    parser.add_argument("--output", help="Report path (default: benchmarks/results/<git sha>.json)")
+    parser.add_argument("--compare", help="Previous report to compare against")
+    args = parser.parse_args()
+
+    if not os.getenv("DATABASE_URL"):
+        raise SystemExit("DATABASE_URL must point at a migrated, disposable Postgres database")
+
+    report = asyncio.run(run(args))
+
+    output = args.output or os.path.join(RESULTS_DIR, f"{report['git_sha']}.json")
+    os.makedirs(os.path.dirname(output), exist_ok=True)
+    with open(output, "w") as f:
+        json.dump(report, f, indent=2)
+    print(f"\nReport written to {output}")
+
+    if args.compare:
+        with open(args.compare) as f:
+            compare(report, json.load(f))
+
+
+if __name__ == "__main__":
+    main()
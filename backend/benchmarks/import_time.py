@@ -0,0 +1,71 @@
+"""
+Measure how long it takes to import the backend application.
+
+Each run starts a fresh interpreter with ``-X importtime`` and imports ``main``
+(no lifespan runs, so no credentials or network are needed). Reports the wall
+time per run and the slowest top-level imports.
+
+Usage (from the backend directory):
+    python benchmarks/import_time.py [--runs 5] [--module main] [--top 15]
+"""
+import argparse
+import os
+import re
+import statistics
+import subprocess
+import sys
+import time
+
+BACKEND_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+IMPORT_LINE = re.compile(r"import time:\s+(\d+)\s+\|\s+(\d+)\s+\|(\s*)(\S+)")
+
+
+def run_once(module: str):
+    """Import module in a fresh interpreter, returning wall seconds and per-package cumulative microseconds."""
+    started = time.perf_counter()
+    completed = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        cwd=BACKEND_DIR,
+        capture_output=True,
+        text=True,
+    )
+    elapsed = time.perf_counter() - started
+    if completed.returncode != 0:
+        sys.stderr.write(completed.stderr)
+        raise SystemExit(f"Importing {module} failed")
+
+    cumulative = {}
+    for line in completed.stderr.splitlines():
+        match = IMPORT_LINE.match(line)
+        # Only keep imports made directly by the application (least indented)
+        if match and len(match.group(3)) <= 1:
+            cumulative[match.group(4)] = int(match.group(2))
+    return elapsed, cumulative
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--runs", type=int, default=5)
+    parser.add_argument("--module", default="main")
+    parser.add_argument("--top", type=int, default=15)
+    args = parser.parse_args()
+
+    timings = []
+    slowest = {}
+    for _ in range(args.runs):
+        elapsed, cumulative = run_once(args.module)
+        timings.append(elapsed)
+        for name, micros in cumulative.items():
+            slowest[name] = max(slowest.get(name, 0), micros)
+
+    print(f"import {args.module}: {args.runs} runs")
+    print(f"  min    {min(timings) * 1000:8.1f} ms")
+    print(f"  median {statistics.median(timings) * 1000:8.1f} ms")
+    print(f"  max    {max(timings) * 1000:8.1f} ms")
+    print(f"\nSlowest top-level imports (cumulative, worst run):")
+    for name, micros in sorted(slowest.items(), key=lambda item: item[1], reverse=True)[:args.top]:
+        print(f"  {micros / 1000:8.1f} ms  {name}")
+
+
+if __name__ == "__main__":
+    main()
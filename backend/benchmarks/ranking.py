@@ -0,0 +1,156 @@
+"""
+Microbenchmark experience ranking on synthetic corpora.
+
+For each corpus size this generates a synthetic user's experiences, chunks them
+as write_experience_chunks does, and measures the two halves of
+get_top_experiences separately: batch-encoding the chunks and scoring them with
+rank_experience_chunks (chunk scores, max aggregation and a synthetic skill
+boost; full-text fusion needs the database and is left out). It also records
+the peak memory allocated across both (tracemalloc) and the top-k recall of
+rank_experience_chunks against an exact float64 search with a full sort.
+
+The stub embedding model (default) keeps runs fast and deterministic. Use
+--model real to time all-MiniLM-L6-v2 encoding as well.
+
+Usage (from the backend directory):
+    python benchmarks/ranking.py [--sizes 10,100,1000,10000] [--top-k 5] [--repeats 5] [--model stub|real] [--output report.json]
+"""
+import argparse
+import json
+import os
+import random
+import statistics
+import sys
+import time
+import tracemalloc
+
+BACKEND_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, BACKEND_DIR)
+# Importing the service builds the (unconnected) database engine, which needs a URL
+os.environ.setdefault("DATABASE_URL", "postgresql://localhost/unused")
+os.environ.setdefault("LOG_LEVEL", "WARNING")
+
+import numpy as np  # noqa: E402
+
+from benchmarks.stubs import StubEmbeddingModel  # noqa: E402
+from config.settings import settings  # noqa: E402
+from services.experience_service import get_embedding_model, rank_experience_chunks  # noqa: E402
+from utils.text_chunking import chunk_text  # noqa: E402
+
+TITLES = ["Software Engineer", "Data Scientist", "Product Manager", "DevOps Engineer", "Designer", "Analyst"]
+SKILLS = [
+    "python", "fastapi", "postgresql", "kubernetes", "terraform", "react", "typescript", "spark",
+    "airflow", "pytorch", "aws", "gcp", "docker", "graphql", "redis", "kafka", "figma", "sql",
+]
+VERBS = ["built", "led", "designed", "migrated", "scaled", "optimized", "launched", "maintained"]
+JOB_DESCRIPTION = (
+    "Backend engineer to build python fastapi services on postgresql and aws, "
+    "scale kafka pipelines and mentor the team."
+)
+
+
+def synthetic_chunks(count: int, seed: int = 0):
+    """
+    Deterministic experience chunks shaped like experience_chunk_texts, with their owners.
+    
+    Descriptions vary in length, so longer experiences span several chunks.
+    """
+    rng = random.Random(seed)
+    texts, owners = [], []
+    for i in range(count):
+        skills = rng.sample(SKILLS, 4)
+        sentences = [
+            f"{rng.choice(VERBS).capitalize()} {' and '.join(rng.sample(skills, 2))} systems for the platform team."
+            for _ in range(rng.randint(3, 40))
+        ]
+        description = " ".join(sentences) + f" Used {', '.join(skills)}."
+        for chunk in chunk_text(description, settings.EMBEDDING_CHUNK_WORDS):
+            texts.append(f"Company {i} {rng.choice(TITLES)} Remote {chunk}")
+            owners.append(i)
+    return texts, owners
+
+
+def synthetic_boosts(count: int, seed: int = 0):
+    """Skill-match boosts as get_top_experiences computes them, for a job asking for four skills."""
+    rng = random.Random(seed)
+    return [settings.SKILL_MATCH_BOOST * rng.randint(0, 4) / 4 for _ in range(count)]
+
+
+def exact_top_k(job_embedding, chunk_embeddings, owners, count: int, boosts, top_k: int):
+    """Reference ranking: float64 cosine similarity per chunk, best chunk per experience and a full sort."""
+    query = np.asarray(job_embedding, dtype=np.float64)
+    scores = [0.0] * count
+    seen = set()
+    for owner, row in zip(owners, np.asarray(chunk_embeddings, dtype=np.float64)):
+        score = float(np.dot(query, row) / (np.linalg.norm(query) * np.linalg.norm(row)))
+        scores[owner] = score if owner not in seen else max(scores[owner], score)
+        seen.add(owner)
+    scores = [score + boost for score, boost in zip(scores, boosts)]
+    return sorted(range(count), key=lambda index: scores[index], reverse=True)[:top_k]
+
+
+def benchmark_size(model, size: int, top_k: int, repeats: int) -> dict:
+    texts, owners = synthetic_chunks(size)
+    boosts = synthetic_boosts(size)
+    job_embedding = model.encode(JOB_DESCRIPTION)
+
+    encode_times, score_times = [], []
+    for _ in range(repeats):
+        started = time.perf_counter()
+        embeddings = model.encode(texts)
+        encode_times.append(time.perf_counter() - started)
+
+        started = time.perf_counter()
+        ranked, _, _ = rank_experience_chunks(job_embedding, embeddings, owners, size, top_k, boosts=boosts)
+        score_times.append(time.perf_counter() - started)
+
+    tracemalloc.start()
+    embeddings = model.encode(texts)
+    rank_experience_chunks(job_embedding, embeddings, owners, size, top_k, boosts=boosts)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    expected = set(exact_top_k(job_embedding, embeddings, owners, size, boosts, top_k))
+    recall = len(expected & set(ranked)) / len(expected) if expected else 1.0
+
+    return {
+        "experiences": size,
+        "chunks": len(texts),
+        "encode_ms": round(statistics.median(encode_times) * 1000, 3),
+        "score_ms": round(statistics.median(score_times) * 1000, 3),
+        "peak_memory_kb": round(peak / 1024, 1),
+        "recall_at_k": round(recall, 4),
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--sizes", default="10,100,1000,10000")
+    parser.add_argument("--top-k", type=int, default=5)
+    parser.add_argument("--repeats", type=int, default=5)
+    parser.add_argument("--model", choices=["stub", "real"], default="stub")
+    parser.add_argument("--min-recall", type=float, default=1.0, help="Exit non-zero if recall drops below this")
+    parser.add_argument("--output", help="Write the results as JSON")
+    args = parser.parse_args()
+
+    model = get_embedding_model() if args.model == "real" else StubEmbeddingModel()
+    results = []
+    print(f"{'experiences':>12s} {'chunks':>8s} {'encode ms':>12s} {'score ms':>10s} {'peak KiB':>10s} {'recall@k':>9s}")
+    for size in (int(size) for size in args.sizes.split(",")):
+        result = benchmark_size(model, size, args.top_k, args.repeats)
+        results.append(result)
+        print(
+            f"{result['experiences']:12d} {result['chunks']:8d} {result['encode_ms']:12.3f} {result['score_ms']:10.3f} "
+            f"{result['peak_memory_kb']:10.1f} {result['recall_at_k']:9.4f}"
+        )
+
+    if args.output:
+        with open(args.output, "w") as f:
+            json.dump({"model": args.model, "top_k": args.top_k, "results": results}, f, indent=2)
+
+    if any(result["recall_at_k"] < args.min_recall for result in results):
+        raise SystemExit(f"Recall fell below {args.min_recall}")
+
+
+if __name__ == "__main__":
+    main()
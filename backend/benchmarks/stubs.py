@@ -0,0 +1,74 @@
+"""
+Stand-ins for the external providers, for benchmarks that must not hit the network.
+
+Each stub mimics the slice of the real client's interface the services use and
+blocks for a fixed latency, so timings still include the worker-thread hop.
+"""
+import hashlib
+import io
+import json
+import time
+
+import numpy as np
+
+STUB_COVER_LETTER = {
+    "cover_letter": "Dear Hiring Manager,\n\nI am excited to apply for this role.\n\nSincerely,\nCandidate",
+    "chances": "High",
+    "chances_explanation": "The candidate's experience closely matches the job requirements."
+}
+
+
+class StubBedrockClient:
+    """Returns a canned Llama response from invoke_model after `latency` seconds."""
+
+    def __init__(self, latency: float = 0.0):
+        self.latency = latency
+
+    def invoke_model(self, modelId: str, body: str, **kwargs):
+        if self.latency:
+            time.sleep(self.latency)
+        payload = {
+            "generation": json.dumps(STUB_COVER_LETTER),
+            "completion": "A paragraph about the company's mission and culture."
+        }
+        return {"body": io.BytesIO(json.dumps(payload).encode())}
+
+    def close(self):
+        pass
+
+
+class StubSearchClient:
+    """Returns canned SerpAPI-style text from run after `latency` seconds."""
+
+    def __init__(self, latency: float = 0.0):
+        self.latency = latency
+
+    def run(self, query: str) -> str:
+        if self.latency:
+            time.sleep(self.latency)
+        return f"Search results for {query}: founded in 2010, builds developer tools, values ownership."
+
+
+class StubEmbeddingModel:
+    """
+    Deterministic bag-of-words embeddings with the same shape as all-MiniLM-L6-v2.
+
+    Texts sharing words get similar vectors, which is enough to exercise ranking
+    without loading torch.
+    """
+
+    def __init__(self, dimension: int = 384):
+        self.dimension = dimension
+
+    def _encode_one(self, text: str) -> np.ndarray:
+        vector = np.zeros(self.dimension, dtype=np.float32)
+        for word in text.lower().split():
+            digest = hashlib.blake2b(word.encode(), digest_size=8).digest()
+            seed = int.from_bytes(digest, "little")
+            vector += np.random.default_rng(seed).standard_normal(self.dimension, dtype=np.float32)
+        return vector
+
+    def encode(self, sentences, batch_size: int = 32, **kwargs):
+        if isinstance(sentences, str):
+            return self._encode_one(sentences)
+        return np.stack([self._encode_one(text) for text in sentences]) if sentences else np.zeros((0, self.dimension), dtype=np.float32)
@@ -11,15 +11,56 @@ class Settings(BaseSettings):
     AWS_ACCESS_KEY_ID: str = os.getenv("AWS_ACCESS_KEY_ID")
     AWS_SECRET_ACCESS_KEY: str = os.getenv("AWS_SECRET_ACCESS_KEY")
     AWS_REGION: str = os.getenv("AWS_REGION", "us-east-1")
+    BEDROCK_MAX_POOL_CONNECTIONS: int = int(os.getenv("BEDROCK_MAX_POOL_CONNECTIONS", "50"))
+    BEDROCK_MAX_ATTEMPTS: int = int(os.getenv("BEDROCK_MAX_ATTEMPTS", "4"))
+    BEDROCK_CONNECT_TIMEOUT: int = int(os.getenv("BEDROCK_CONNECT_TIMEOUT", "5"))  # Seconds
+    BEDROCK_READ_TIMEOUT: int = int(os.getenv("BEDROCK_READ_TIMEOUT", "60"))  # Seconds
     DATABASE_URL: str = os.getenv("DATABASE_URL")
+    DB_POOL_SIZE: int = int(os.getenv("DB_POOL_SIZE", "5"))
+    DB_MAX_OVERFLOW: int = int(os.getenv("DB_MAX_OVERFLOW", "10"))
+    DB_POOL_TIMEOUT: int = int(os.getenv("DB_POOL_TIMEOUT", "30"))  # Seconds to wait for a connection
+    DB_POOL_RECYCLE: int = int(os.getenv("DB_POOL_RECYCLE", "1800"))  # Seconds before a connection is replaced
+    DB_POOL_PRE_PING: bool = parse_bool(os.getenv("DB_POOL_PRE_PING", "true"))
+    DB_STATEMENT_TIMEOUT_MS: int = int(os.getenv("DB_STATEMENT_TIMEOUT_MS", "30000"))  # 0 disables the timeout
+    DB_APPLICATION_NAME: str = os.getenv("DB_APPLICATION_NAME", "coverletter-ai-backend")
     CORS_ORIGINS: list = ["http://localhost:3000"]
     FIREBASE_SERVICE_ACCOUNT_PATH: str = os.environ.get("FIREBASE_SERVICE_ACCOUNT_PATH")
+    FIREBASE_PROJECT_ID: str = os.getenv("FIREBASE_PROJECT_ID")
+    FIREBASE_VERIFY_TOKENS_LOCALLY: bool = parse_bool(os.getenv("FIREBASE_VERIFY_TOKENS_LOCALLY", "true"))
+    FIREBASE_KEY_REFRESH_MIN_INTERVAL: int = int(os.getenv("FIREBASE_KEY_REFRESH_MIN_INTERVAL", "60"))  # Seconds between refetches for unknown key IDs
+    AUTH_TOKEN_CACHE_SIZE: int = int(os.getenv("AUTH_TOKEN_CACHE_SIZE", "10000"))
+    AUTH_USER_CACHE_SIZE: int = int(os.getenv("AUTH_USER_CACHE_SIZE", "10000"))
+    AUTH_USER_CACHE_TTL: int = int(os.getenv("AUTH_USER_CACHE_TTL", "60"))  # Seconds
     DEV_MODE: bool = parse_bool(os.getenv("DEV_MODE", "false"))
+    LOG_LEVEL: str = os.getenv("LOG_LEVEL", "INFO")
+    LOG_FORMAT: str = os.getenv("LOG_FORMAT", "json")  # json or text
+    LOG_LEVELS: str = os.getenv("LOG_LEVELS", "")  # Per-logger levels, e.g. "services.auth_service=DEBUG,sqlalchemy.engine=WARNING"
+    LOG_HOT_PATH_RATE: float = float(os.getenv("LOG_HOT_PATH_RATE", "1"))  # Records per second per message on hot paths; 0 disables
+    LOG_HOT_PATH_BURST: int = int(os.getenv("LOG_HOT_PATH_BURST", "10"))
     TEST_USER_ID: str = os.getenv("TEST_USER_ID")
     TEST_USER_EMAIL: str = os.getenv("TEST_USER_EMAIL")
     TEST_USER_NAME: str = os.getenv("TEST_USER_NAME")
     HF_TOKEN: str = os.getenv("HF_TOKEN")
     SERPAPI_API_KEY: str = os.getenv("SERPAPI_API_KEY")
+    DEFAULT_SUBSCRIPTION_TIER: str = os.getenv("DEFAULT_SUBSCRIPTION_TIER", "Free")  # Tier for users without an active subscription
+    DEFAULT_MAX_COVER_LETTERS: int = int(os.getenv("DEFAULT_MAX_COVER_LETTERS", "5"))  # Monthly limit if the default tier is missing; 0 means unlimited
+    SUBSCRIPTION_TIER_CACHE_TTL: int = int(os.getenv("SUBSCRIPTION_TIER_CACHE_TTL", "300"))  # Seconds
+    SKILL_VOCABULARY_TTL: int = int(os.getenv("SKILL_VOCABULARY_TTL", "3600"))  # Seconds before the skills table is reloaded
+    SKILL_MATCH_BOOST: float = float(os.getenv("SKILL_MATCH_BOOST", "0.1"))  # Added to similarity when all job skills match
+    HYBRID_RETRIEVAL_ENABLED: bool = parse_bool(os.getenv("HYBRID_RETRIEVAL_ENABLED", "true"))  # Fuse full-text rank into experience ranking
+    HYBRID_RRF_K: int = int(os.getenv("HYBRID_RRF_K", "60"))  # Reciprocal rank fusion constant
+    NEAR_DUPLICATE_MAX_DISTANCE: int = int(os.getenv("NEAR_DUPLICATE_MAX_DISTANCE", "6"))  # Max SimHash bits apart for a near-duplicate posting
+    NEAR_DUPLICATE_CANDIDATES: int = int(os.getenv("NEAR_DUPLICATE_CANDIDATES", "200"))  # Most recent applications compared
+    EMBEDDING_CHUNK_WORDS: int = int(os.getenv("EMBEDDING_CHUNK_WORDS", "120"))  # Max words per experience chunk
+    CHUNK_SCORE_AGGREGATION: str = os.getenv("CHUNK_SCORE_AGGREGATION", "max")  # max or mean of an experience's chunk scores
+    EMBEDDING_CACHE_SIZE: int = int(os.getenv("EMBEDDING_CACHE_SIZE", "1000"))  # Users whose chunk embeddings are kept in memory
+    EMBEDDING_CACHE_TTL: int = int(os.getenv("EMBEDDING_CACHE_TTL", "900"))  # Seconds
+    EMBEDDING_CACHE_DTYPE: str = os.getenv("EMBEDDING_CACHE_DTYPE", "float32")  # float32 or float16 (half the memory)
+    JOB_DESCRIPTION_CACHE_SIZE: int = int(os.getenv("JOB_DESCRIPTION_CACHE_SIZE", "1024"))
+    JOB_DESCRIPTION_CACHE_TTL: int = int(os.getenv("JOB_DESCRIPTION_CACHE_TTL", "3600"))  # Seconds
+    OTEL_TRACES_EXPORTER: str = os.getenv("OTEL_TRACES_EXPORTER", "none")  # none, console or otlp
+    OTEL_SERVICE_NAME: str = os.getenv("OTEL_SERVICE_NAME", "coverletter-ai-backend")
+    OTEL_EXPORTER_OTLP_ENDPOINT: str = os.getenv("OTEL_EXPORTER_OTLP_ENDPOINT", "http://localhost:4318/v1/traces")
 
     class Config:
         env_file = ".env"
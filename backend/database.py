@@ -1,17 +1,85 @@
-from sqlalchemy import create_engine
+from sqlalchemy.engine import make_url
+from sqlalchemy.ext.asyncio import create_async_engine, async_sessionmaker, AsyncSession
 from sqlalchemy.ext.declarative import declarative_base
-from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import AsyncAdaptedQueuePool
 from config.settings import settings
+from utils.metrics import DB_POOL_WAIT
+from utils.tracing import tracer
+import threading
+import time
 
-SQLALCHEMY_DATABASE_URL = settings.DATABASE_URL
+# DATABASE_URL is shared with alembic and start.sh, which use the sync psycopg2 driver
+SQLALCHEMY_DATABASE_URL = make_url(settings.DATABASE_URL).set(drivername="postgresql+asyncpg")
 
-engine = create_engine(SQLALCHEMY_DATABASE_URL)
-SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+server_settings = {"application_name": settings.DB_APPLICATION_NAME}
+if settings.DB_STATEMENT_TIMEOUT_MS > 0:
+    server_settings["statement_timeout"] = str(settings.DB_STATEMENT_TIMEOUT_MS)
+
+# Cumulative connection wait statistics, read by get_pool_metrics()
+_pool_wait_lock = threading.Lock()
+_pool_wait = {"count": 0, "total_seconds": 0.0, "max_seconds": 0.0}
+
+
+def _record_pool_wait(seconds: float) -> None:
+    with _pool_wait_lock:
+        _pool_wait["count"] += 1
+        _pool_wait["total_seconds"] += seconds
+        _pool_wait["max_seconds"] = max(_pool_wait["max_seconds"], seconds)
+    DB_POOL_WAIT.observe(seconds)
+
+
+class TimedQueuePool(AsyncAdaptedQueuePool):
+    """Queue pool that records how long each checkout waits for a connection."""
+
+    def _do_get(self):
+        started = time.perf_counter()
+        try:
+            return super()._do_get()
+        finally:
+            _record_pool_wait(time.perf_counter() - started)
+
+
+# Pool sizes are per process, so size them per uvicorn worker
+engine = create_async_engine(
+    SQLALCHEMY_DATABASE_URL,
+    pool_size=settings.DB_POOL_SIZE,
+    max_overflow=settings.DB_MAX_OVERFLOW,
+    pool_timeout=settings.DB_POOL_TIMEOUT,
+    pool_recycle=settings.DB_POOL_RECYCLE,
+    pool_pre_ping=settings.DB_POOL_PRE_PING,
+    poolclass=TimedQueuePool,
+    connect_args={"server_settings": server_settings},
+)
+# expire_on_commit=False keeps attributes loaded after commit, since lazy loads are not allowed under asyncio
+SessionLocal = async_sessionmaker(bind=engine, class_=AsyncSession, autoflush=False, expire_on_commit=False)
 Base = declarative_base()
 
-def get_db():
-    db = SessionLocal()
+
+def get_pool_metrics() -> dict:
+    """Return a snapshot of the connection pool state and checkout wait times."""
+    pool = engine.sync_engine.pool
+    with _pool_wait_lock:
+        wait = dict(_pool_wait)
+    return {
+        "pool_size": pool.size(),
+        "checked_out": pool.checkedout(),
+        "checked_in": pool.checkedin(),
+        "overflow": pool.overflow(),
+        "max_overflow": settings.DB_MAX_OVERFLOW,
+        "wait_count": wait["count"],
+        "wait_seconds_total": wait["total_seconds"],
+        "wait_seconds_max": wait["max_seconds"],
+    }
+
+
+async def get_db():
+    # The span is ended explicitly rather than made current, since dependency
+    # setup and teardown may not run in the same context
+    span = tracer.start_span("db.session")
     try:
-        yield db
+        # The session connects on its first query, so routes that never query hold no
+        # pooled connection; checkout waits are recorded by TimedQueuePool
+        async with SessionLocal() as db:
+            yield db
     finally:
-        db.close()
\ No newline at end of file
+        span.end()
@@ -1,18 +1,54 @@
-from fastapi import FastAPI
+from contextlib import asynccontextmanager
+from fastapi import FastAPI, Request, Response
 from fastapi.middleware.cors import CORSMiddleware
-from database import engine
-from routers import auth, experiences, cover_letters, company_search
+from database import engine, get_pool_metrics
+from routers import auth, experiences, cover_letters, company_search, job_applications
+from services.auth_service import clear_auth_caches
+from services.subscription_service import clear_tier_cache
+from services.experience_service import clear_embedding_cache, get_embedding_model
+from utils.clients import create_bedrock_client, create_search_client
+from utils.firebase import get_firebase_app
+from utils.metrics import REQUEST_LATENCY, instrument_engine, register_pool_metrics, render_metrics
+from utils.tracing import setup_tracing
+from utils.logging_config import configure_logging, request_id_var
+import asyncio
 import logging
+import time
+import uuid
 
 # Configure logging
-logging.basicConfig(
-    level=logging.INFO,
-    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
-)
+configure_logging()
 logger = logging.getLogger(__name__)
 
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """
+    Own the process-wide resources: external clients and the embedding model are
+    created once at startup and shared through dependencies; the database engine
+    and caches are released on shutdown.
+    """
+    tracer_provider = setup_tracing()
+    get_firebase_app()
+    app.state.bedrock_client = create_bedrock_client()
+    app.state.search_client = create_search_client()
+    # Loading the model takes seconds, keep it off the event loop
+    app.state.embedding_model = await asyncio.to_thread(get_embedding_model)
+    logger.info("Shared resources initialized")
+    try:
+        yield
+    finally:
+        app.state.bedrock_client.close()
+        clear_auth_caches()
+        clear_tier_cache()
+        clear_embedding_cache()
+        await engine.dispose()
+        if tracer_provider is not None:
+            # Flush spans still queued in the batch processor
+            tracer_provider.shutdown()
+        logger.info("Shared resources released")
+
 # Create FastAPI app
-app = FastAPI(title="Cover Letter AI API")
+app = FastAPI(title="Cover Letter AI API", lifespan=lifespan)
 
 # Configure CORS
 app.add_middleware(
@@ -21,14 +57,61 @@ app.add_middleware(
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
+    expose_headers=["X-Next-Cursor", "X-Request-ID"],
 )
 
+# Export DB query timings and pool state on /metrics
+instrument_engine(engine)
+register_pool_metrics(get_pool_metrics)
+
+@app.middleware("http")
+async def record_request_latency(request: Request, call_next):
+    """Observe the latency of every request, labelled by route template."""
+    started = time.perf_counter()
+    status_code = 500
+    try:
+        response = await call_next(request)
+        status_code = response.status_code
+        return response
+    finally:
+        # Label by the matched route template, not the raw path, to keep cardinality bounded
+        route = request.scope.get("route")
+        REQUEST_LATENCY.labels(
+            request.method,
+            route.path if route is not None else "unmatched",
+            str(status_code)
+        ).observe(time.perf_counter() - started)
+
+@app.middleware("http")
+async def assign_request_id(request: Request, call_next):
+    """Tag the request's log lines with an ID, taken from X-Request-ID when the caller sends one."""
+    request_id = request.headers.get("X-Request-ID") or uuid.uuid4().hex
+    token = request_id_var.set(request_id)
+    try:
+        response = await call_next(request)
+        response.headers["X-Request-ID"] = request_id
+        return response
+    finally:
+        request_id_var.reset(token)
+
 # Include routers
 app.include_router(auth.router)
 app.include_router(experiences.router)
 app.include_router(cover_letters.router)
 app.include_router(company_search.router)
+app.include_router(job_applications.router)
 
 @app.get("/")
 async def root():
-    return {"message": "Welcome to Cover Letter AI API"}
\ No newline at end of file
+    return {"message": "Welcome to Cover Letter AI API"}
+
+@app.get("/metrics/db-pool")
+async def db_pool_metrics():
+    """Connection pool usage for sizing the pool per worker."""
+    return get_pool_metrics()
+
+@app.get("/metrics", include_in_schema=False)
+async def metrics():
+    """Prometheus metrics: request latency per route, stage latency and pool state."""
+    body, content_type = render_metrics()
+    return Response(content=body, media_type=content_type)
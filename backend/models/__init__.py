@@ -1,7 +1,7 @@
 from .auth import User, Waitlist
 from .profile import UserProfile
 from .skills import Skill, UserSkill
-from .experience import Experience, ExperienceSkill
+from .experience import Experience, ExperienceSkill, ExperienceChunk
 from .application import JobApplication, JobApplicationExperience, JobApplicationSkill
 from .cover_letter import CoverLetter, CoverLetterExperience
 from .subscription import SubscriptionTier, UserSubscription, UserUsage
@@ -14,6 +14,7 @@ __all__ = [
     "UserSkill",
     "Experience",
     "ExperienceSkill",
+    "ExperienceChunk",
     "JobApplication",
     "JobApplicationExperience",
     "JobApplicationSkill",
@@ -1,4 +1,4 @@
-from sqlalchemy import Column, String, DateTime, ForeignKey, Text, Integer, Float
+from sqlalchemy import Column, String, DateTime, ForeignKey, Text, Integer, Float, Index, BigInteger
 from sqlalchemy.dialects.postgresql import UUID
 from pgvector.sqlalchemy import Vector
 from sqlalchemy.orm import relationship
@@ -16,8 +16,10 @@ class JobApplication(Base):
     job_description = Column(Text, nullable=False)
     # Store combined text for embedding generation (job title + description)
     content_for_embedding = Column(Text, nullable=False)
-    # Store the embedding vector
-    embedding = Column(Vector(dim=1536))
+    # Embedding of content_for_embedding from the shared sentence transformer (all-MiniLM-L6-v2)
+    embedding = Column(Vector(dim=384))
+    # 64-bit SimHash of content_for_embedding for near-duplicate posting detection
+    simhash = Column(BigInteger)
     cover_letter = Column(Text)
     status = Column(String(50), default='draft')
     created_at = Column(DateTime(timezone=True), server_default=func.now())
@@ -25,6 +27,9 @@ class JobApplication(Base):
 
     user = relationship("User", backref="job_applications")
 
+# Serves listing a user's applications and the exact similarity search over them
+Index("ix_job_applications_user_id_created_at", JobApplication.user_id, JobApplication.created_at.desc())
+
 class JobApplicationExperience(Base):
     __tablename__ = "job_application_experiences"
     
@@ -1,4 +1,4 @@
-from sqlalchemy import Column, String, Text, ForeignKey, DateTime, Integer
+from sqlalchemy import Column, String, Text, ForeignKey, DateTime, Integer, Index
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.orm import relationship
 from sqlalchemy.sql import func
@@ -25,6 +25,20 @@ class CoverLetter(Base):
     user = relationship("User", backref="cover_letters")
     selected_experiences = relationship("CoverLetterExperience", back_populates="cover_letter")
 
+    @property
+    def experiences(self):
+        """Experiences linked to this cover letter, in relevance order."""
+        links = sorted(self.selected_experiences, key=lambda link: link.relevance_order)
+        return [link.experience for link in links]
+
+# Serves the keyset-paginated listing of a user's cover letters
+Index(
+    "ix_cover_letters_user_id_created_at",
+    CoverLetter.user_id,
+    CoverLetter.created_at.desc(),
+    CoverLetter.id.desc()
+)
+
 class CoverLetterExperience(Base):
     __tablename__ = "cover_letter_experiences"
     
@@ -36,4 +50,12 @@ class CoverLetterExperience(Base):
     
     # Relationships
     cover_letter = relationship("CoverLetter", back_populates="selected_experiences")
-    experience = relationship("Experience")
\ No newline at end of file
+    experience = relationship("Experience")
+
+# One link per cover letter and experience, so adding an experience can insert it atomically
+Index(
+    "uq_cover_letter_experiences_cover_letter_id_experience_id",
+    CoverLetterExperience.cover_letter_id,
+    CoverLetterExperience.experience_id,
+    unique=True
+)
@@ -1,7 +1,7 @@
-from sqlalchemy import Column, String, Boolean, DateTime, Date, ForeignKey, Text
+from sqlalchemy import Column, String, Boolean, DateTime, Date, ForeignKey, Text, Integer, Index, func, literal_column
 from sqlalchemy.dialects.postgresql import UUID
 from pgvector.sqlalchemy import Vector
-from sqlalchemy.orm import relationship
+from sqlalchemy.orm import backref, relationship
 from sqlalchemy.sql import func
 import uuid
 from database import Base
@@ -27,6 +27,25 @@ class Experience(Base):
 
     user = relationship("User", backref="experiences")
 
+# Text search configuration for experience content; queries must use the same one to hit the index
+TEXT_SEARCH_CONFIG = "english"
+
+def text_search_config():
+    """TEXT_SEARCH_CONFIG as a regconfig literal, so index and query expressions are identical."""
+    return literal_column(f"'{TEXT_SEARCH_CONFIG}'::regconfig")
+
+def experience_search_vector():
+    """tsvector over content_for_embedding, matching the expression of its GIN index."""
+    return func.to_tsvector(text_search_config(), Experience.content_for_embedding)
+
+# Serves the keyset-paginated listing of a user's experiences
+Index(
+    "ix_experiences_user_id_start_date",
+    Experience.user_id,
+    Experience.start_date.desc(),
+    Experience.id.desc()
+)
+
 class ExperienceSkill(Base):
     __tablename__ = "experience_skills"
     
@@ -34,5 +53,29 @@ class ExperienceSkill(Base):
     skill_id = Column(UUID(as_uuid=True), ForeignKey("skills.id", ondelete="CASCADE"), primary_key=True)
     created_at = Column(DateTime(timezone=True), server_default=func.now())
 
-    experience = relationship("Experience", backref="skills")
-    skill = relationship("Skill")
\ No newline at end of file
+    # Tags are removed with their experience by the ON DELETE CASCADE, without loading them
+    experience = relationship("Experience", backref=backref("skills", cascade="all, delete-orphan", passive_deletes=True))
+    skill = relationship("Skill")
+
+# Serves full-text matching of experience content
+Index(
+    "ix_experiences_content_search",
+    experience_search_vector(),
+    postgresql_using="gin"
+)
+
+class ExperienceChunk(Base):
+    __tablename__ = "experience_chunks"
+    
+    experience_id = Column(UUID(as_uuid=True), ForeignKey("experiences.id", ondelete="CASCADE"), primary_key=True)
+    chunk_index = Column(Integer, primary_key=True)
+    content = Column(Text, nullable=False)
+    # Embedding from the shared sentence transformer (all-MiniLM-L6-v2); each chunk fits its input limit
+    embedding = Column(Vector(dim=384), nullable=False)
+    created_at = Column(DateTime(timezone=True), server_default=func.now())
+
+    # Chunks are removed with their experience by the ON DELETE CASCADE, without loading them
+    experience = relationship("Experience", backref=backref("chunks", cascade="all, delete-orphan", passive_deletes=True))
+
+# Serves lookups of experiences by skill; the primary key covers lookups by experience
+Index("ix_experience_skills_skill_id", ExperienceSkill.skill_id)
@@ -1,4 +1,4 @@
-from sqlalchemy import Column, String, Boolean, DateTime, ForeignKey, Integer, Numeric
+from sqlalchemy import Column, String, Boolean, DateTime, ForeignKey, Integer, Numeric, Index, text
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.orm import relationship
 from sqlalchemy.sql import func
@@ -12,7 +12,7 @@ class SubscriptionTier(Base):
     name = Column(String(50), nullable=False, unique=True)  #"Free", "Premium"
     price = Column(Numeric(10, 2), nullable=False)  # Monthly price
     features = Column(String(255), nullable=False)  # Feature list or limitations
-    max_cover_letters = Column(Integer, nullable=False)  # Monthly limit
+    max_cover_letters = Column(Integer, nullable=False)  # Monthly limit; 0 means unlimited
     is_active = Column(Boolean, default=True)  # To disable tiers without deleting
     created_at = Column(DateTime(timezone=True), server_default=func.now())
     updated_at = Column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now())
@@ -44,4 +44,20 @@ class UserUsage(Base):
     created_at = Column(DateTime(timezone=True), server_default=func.now())
     updated_at = Column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now())
 
-    user = relationship("User", backref="usage_records")
\ No newline at end of file
+    user = relationship("User", backref="usage_records")
+
+# One usage row per user and period, so quota consumption can upsert it atomically
+Index(
+    "uq_user_usage_user_id_usage_period",
+    UserUsage.user_id,
+    UserUsage.usage_period,
+    unique=True
+)
+
+
+# Serves the active-subscription lookup on every generation; cancelled and expired rows are left out
+Index(
+    "ix_user_subscriptions_active_user_id",
+    UserSubscription.user_id,
+    postgresql_where=text("status = 'active'")
+)
@@ -1,12 +1,12 @@
 from fastapi import APIRouter, HTTPException, Depends, Header, Body, Request, status
-from sqlalchemy.orm import Session
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncSession
 from database import get_db
 from models.auth import User
-from services.auth_service import get_or_create_user_from_firebase
+from services.auth_service import get_or_create_user_from_firebase, get_current_user_data, invalidate_user_cache
 import logging
 
 # Configure logging
-logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
 router = APIRouter(
@@ -17,18 +17,18 @@ router = APIRouter(
 
 # Quick debugging route (temporary)
 @router.get("/debug-db-connection")
-async def debug_db(db: Session = Depends(get_db)):
+async def debug_db(db: AsyncSession = Depends(get_db)):
     try:
-        result = db.execute("SELECT 1").scalar()
+        result = (await db.execute(text("SELECT 1"))).scalar()
         return {"db_connected": result == 1}
     except Exception as e:
         return {"db_connected": False, "error": str(e)}
 
 
 @router.get("/me")
-async def get_current_user(request: Request, db: Session = Depends(get_db)):
+async def get_current_user(request: Request, db: AsyncSession = Depends(get_db)):
     """Get current authenticated user"""
-    logger.info("Me endpoint called")
+    logger.debug("Me endpoint called")
     try:
         # Get token from header
         auth_header = request.headers.get('Authorization')
@@ -40,7 +40,6 @@ async def get_current_user(request: Request, db: Session = Depends(get_db)):
             )
         
         token = auth_header.split(' ')[1]
-        logger.info(f"Token received") 
         
         # Process the token and get user
         user = await get_or_create_user_from_firebase(db, token)
@@ -52,11 +51,11 @@ async def get_current_user(request: Request, db: Session = Depends(get_db)):
             "full_name": user.full_name,
             "is_active": user.is_active
         }
-        logger.info(f"Current user data retrieved: {user.email}")
+        logger.debug("Current user data retrieved: %s", user.id)
         return user_data
         
     except Exception as e:
-        logger.error(f"Error in me endpoint: {str(e)}")
+        logger.error("Error in me endpoint: %s", e)
         if isinstance(e, HTTPException):
             raise e
         raise HTTPException(
@@ -65,9 +64,8 @@ async def get_current_user(request: Request, db: Session = Depends(get_db)):
         )
 
 # Dependency for other routes
-async def get_current_user_dependency(request: Request, db: Session = Depends(get_db)):
+async def get_current_user_dependency(request: Request, db: AsyncSession = Depends(get_db)):
     """Dependency to get current authenticated user for API routes"""
-    logger.info("Auth dependency called")
     try:
         # Get token from header
         auth_header = request.headers.get('Authorization')
@@ -79,25 +77,14 @@ async def get_current_user_dependency(request: Request, db: Session = Depends(ge
             )
         
         token = auth_header.split(' ')[1]
-        logger.info(f"Token received in dependency") 
         
-        # Process the token and get user
-        user = await get_or_create_user_from_firebase(db, token)
-        
-        # Return user data with uid field (important for other services)
-        user_data = {
-            "id": str(user.id),
-            "uid": str(user.id),  # Add this for compatibility
-            "firebase_uid": user.firebase_uid,
-            "email": user.email,
-            "full_name": user.full_name,
-            "is_active": user.is_active
-        }
-        logger.info(f"Current user retrieved in dependency: {user.email}")
+        # Process the token and get user data (with uid field, important for other services)
+        user_data = await get_current_user_data(db, token)
+        logger.debug("Current user retrieved in dependency: %s", user_data["id"])
         return user_data
         
     except Exception as e:
-        logger.error(f"Error in auth dependency: {str(e)}")
+        logger.error("Error in auth dependency: %s", e)
         if isinstance(e, HTTPException):
             raise e
         raise HTTPException(
@@ -106,9 +93,9 @@ async def get_current_user_dependency(request: Request, db: Session = Depends(ge
         )
 
 @router.post("/register")
-async def register_user(request: Request, db: Session = Depends(get_db)):
+async def register_user(request: Request, db: AsyncSession = Depends(get_db)):
     """Register or authenticate a user with Firebase token"""
-    logger.info("Register endpoint called")
+    logger.debug("Register endpoint called")
     try:
         # Get token from header
         auth_header = request.headers.get('Authorization')
@@ -120,11 +107,9 @@ async def register_user(request: Request, db: Session = Depends(get_db)):
             )
         
         token = auth_header.split(' ')[1]
-        logger.info(f"Token received: {token[:10]}...")  # Log first few chars for debugging
         
         # Additional data from request body
         body = await request.json()
-        logger.info(f"Request body: {body}")
         
         # Process the token and create/get user
         user = await get_or_create_user_from_firebase(db, token)
@@ -132,10 +117,11 @@ async def register_user(request: Request, db: Session = Depends(get_db)):
         # Update user with additional data if provided
         if body and isinstance(body, dict):
             if 'full_name' in body and body['full_name']:
-                logger.info(f"Updating full name for user: {user.email}")
+                logger.info("Updating full name for user: %s", user.id)
                 user.full_name = body['full_name']
-                db.commit()
-                db.refresh(user)
+                await db.commit()
+                await db.refresh(user)
+                invalidate_user_cache(user.firebase_uid)
         
         # Return user data
         user_data = {
@@ -144,11 +130,11 @@ async def register_user(request: Request, db: Session = Depends(get_db)):
             "full_name": user.full_name,
             "is_active": user.is_active
         }
-        logger.info(f"User registered/authenticated successfully: {user.email}")
+        logger.info("User registered/authenticated successfully: %s", user.id)
         return user_data
         
     except Exception as e:
-        logger.error(f"Error in register endpoint: {str(e)}")
+        logger.error("Error in register endpoint: %s", e)
         if isinstance(e, HTTPException):
             raise e
         raise HTTPException(
@@ -1,10 +1,12 @@
 from fastapi import APIRouter, HTTPException, Depends, status
-from sqlalchemy.orm import Session
+from sqlalchemy.ext.asyncio import AsyncSession
 from typing import Dict, Any
 from database import get_db
 from schemas.company_search import CompanySearchRequest, CompanySearchResponse
 from services import company_search_service
+from services.job_description_service import clean_job_description
 from routers.auth import get_current_user_dependency
+from utils.clients import get_bedrock_client_dependency, get_search_client_dependency
 import logging
 
 # Configure logging
@@ -19,7 +21,9 @@ router = APIRouter(
 @router.post("", response_model=CompanySearchResponse)
 async def search_company(
     request: CompanySearchRequest,
-    current_user: dict = Depends(get_current_user_dependency)
+    current_user: dict = Depends(get_current_user_dependency),
+    bedrock_client=Depends(get_bedrock_client_dependency),
+    search_client=Depends(get_search_client_dependency)
 ):
     """
     Search for company information and generate a summary.
@@ -29,12 +33,16 @@ async def search_company(
             # If job description is provided, get comprehensive context
             result = await company_search_service.get_company_context_for_cover_letter(
                 company_name=request.company_name,
-                job_description=request.job_description
+                job_description=clean_job_description(request.job_description),
+                search_client=search_client,
+                bedrock_client=bedrock_client
             )
         else:
             # Otherwise, just get basic company information
             result = await company_search_service.search_company_info(
-                company_name=request.company_name
+                company_name=request.company_name,
+                search_client=search_client,
+                bedrock_client=bedrock_client
             )
         
         return CompanySearchResponse(
@@ -45,7 +53,7 @@ async def search_company(
             error=result.get("error")
         )
     except Exception as e:
-        logger.error(f"Error searching for company: {str(e)}")
+        logger.error("Error searching for company: %s", e)
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail=f"Error searching for company: {str(e)}"
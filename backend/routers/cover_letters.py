@@ -1,13 +1,24 @@
-from fastapi import APIRouter, HTTPException, Depends, status
-from sqlalchemy.orm import Session
-from typing import List
+from fastapi import APIRouter, HTTPException, Depends, Query, Response, status
+from sqlalchemy.ext.asyncio import AsyncSession
+from typing import List, Optional
 from uuid import UUID
 from database import get_db
 from models.request_models import CoverLetterRequest
-from schemas.cover_letter import CoverLetterCreate, CoverLetter, CoverLetterUpdate, CoverLetterOutput
-from services import cover_letter_service
+from schemas.cover_letter import (
+    CoverLetterCreate,
+    CoverLetter,
+    CoverLetterUpdate,
+    CoverLetterOutput,
+    CoverLetterGenerateRequest,
+    CoverLetterSummary
+)
+from services import cover_letter_service, subscription_service
 from routers.auth import get_current_user_dependency
-import boto3
+from utils.clients import (
+    get_bedrock_client_dependency,
+    get_search_client_dependency,
+    get_embedding_model_dependency
+)
 import uuid
 import logging
 
@@ -20,19 +31,65 @@ router = APIRouter(
     responses={404: {"description": "Not found"}},
 )
 
-bedrock = boto3.client(
-    service_name='bedrock-runtime',
-    region_name='us-east-1' 
-)
-
 @router.post("/generate")
-async def generate_cover_letter_content(request: CoverLetterRequest):
+async def generate_cover_letter_content(
+    request: CoverLetterRequest,
+    db: AsyncSession = Depends(get_db),
+    current_user: dict = Depends(get_current_user_dependency),
+    bedrock_client=Depends(get_bedrock_client_dependency),
+    search_client=Depends(get_search_client_dependency)
+):
     """
-    Generate cover letter content using AI.
+    Generate cover letter content using AI, counted against the user's monthly limit.
     """
     try:
-        response = await cover_letter_service.generate_cover_letter(request, bedrock)
+        async with subscription_service.cover_letter_quota(db, current_user["id"]):
+            response = await cover_letter_service.generate_cover_letter(request, bedrock_client, search_client)
         return response  
+    except HTTPException:
+        raise
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=str(e))
+
+
+@router.post("/generate-and-save")
+async def generate_and_save_cover_letter(
+    request: CoverLetterGenerateRequest,
+    db: AsyncSession = Depends(get_db),
+    current_user: dict = Depends(get_current_user_dependency),
+    bedrock_client=Depends(get_bedrock_client_dependency),
+    search_client=Depends(get_search_client_dependency),
+    embedding_model=Depends(get_embedding_model_dependency)
+):
+    """
+    Generate cover letter content from the user's most relevant experiences
+    and save it, along with the selected experiences, in one transaction.
+    Counted against the user's monthly limit, unless an earlier letter for a
+    near-duplicate posting at the same company is reused.
+    """
+    try:
+        near_duplicate = await cover_letter_service.find_near_duplicate(db, current_user["id"], request)
+        if cover_letter_service.near_duplicate_strategy(request, near_duplicate) == "reuse":
+            return await cover_letter_service.reuse_cover_letter(
+                db=db,
+                user_id=current_user["id"],
+                request=request,
+                near_duplicate=near_duplicate,
+                embedding_model=embedding_model
+            )
+
+        async with subscription_service.cover_letter_quota(db, current_user["id"]):
+            return await cover_letter_service.generate_and_save_cover_letter(
+                db=db,
+                user_id=current_user["id"],
+                request=request,
+                bedrock_client=bedrock_client,
+                search_client=search_client,
+                embedding_model=embedding_model,
+                near_duplicate=near_duplicate
+            )
+    except HTTPException:
+        raise
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
@@ -40,7 +97,7 @@ async def generate_cover_letter_content(request: CoverLetterRequest):
 @router.post("", response_model=CoverLetterOutput)
 async def create_cover_letter(
     cover_letter: CoverLetterCreate,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_db),
     current_user: dict = Depends(get_current_user_dependency)
 ):
     """Create a new cover letter."""
@@ -53,20 +110,48 @@ async def create_cover_letter(
 
 @router.get("", response_model=List[CoverLetterOutput])
 async def get_cover_letters(
-    db: Session = Depends(get_db),
+    response: Response,
+    limit: int = Query(50, ge=1, le=200),
+    cursor: Optional[str] = Query(None, description="Cursor from the X-Next-Cursor header of the previous page"),
+    db: AsyncSession = Depends(get_db),
     current_user: dict = Depends(get_current_user_dependency)
 ):
-    """Get all cover letters for the current user."""
-    return await cover_letter_service.get_cover_letters(
+    """Get a page of cover letters for the current user, newest first."""
+    cover_letters, next_cursor = await cover_letter_service.get_cover_letters(
         db=db,
-        user_id=current_user["id"]
+        user_id=current_user["id"],
+        limit=limit,
+        cursor=cursor
+    )
+    if next_cursor:
+        response.headers["X-Next-Cursor"] = next_cursor
+    return cover_letters
+
+
+@router.get("/summaries", response_model=List[CoverLetterSummary])
+async def get_cover_letter_summaries(
+    response: Response,
+    limit: int = Query(50, ge=1, le=200),
+    cursor: Optional[str] = Query(None, description="Cursor from the X-Next-Cursor header of the previous page"),
+    db: AsyncSession = Depends(get_db),
+    current_user: dict = Depends(get_current_user_dependency)
+):
+    """Get a page of cover letter summaries without the full job description and content."""
+    summaries, next_cursor = await cover_letter_service.get_cover_letter_summaries(
+        db=db,
+        user_id=current_user["id"],
+        limit=limit,
+        cursor=cursor
     )
+    if next_cursor:
+        response.headers["X-Next-Cursor"] = next_cursor
+    return summaries
 
 
 @router.get("/{cover_letter_id}", response_model=CoverLetterOutput)
 async def get_cover_letter(
     cover_letter_id: UUID,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_db),
     current_user: dict = Depends(get_current_user_dependency)
 ):
     """Get a specific cover letter by ID."""
@@ -81,7 +166,7 @@ async def get_cover_letter(
 async def update_cover_letter(
     cover_letter_id: UUID,
     cover_letter: CoverLetterUpdate,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_db),
     current_user: dict = Depends(get_current_user_dependency)
 ):
     """Update a cover letter."""
@@ -96,7 +181,7 @@ async def update_cover_letter(
 @router.delete("/{cover_letter_id}", status_code=status.HTTP_204_NO_CONTENT)
 async def delete_cover_letter(
     cover_letter_id: UUID,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_db),
     current_user: dict = Depends(get_current_user_dependency)
 ):
     """Delete a cover letter."""
@@ -111,7 +196,8 @@ async def delete_cover_letter(
 async def add_experience_to_cover_letter(
     cover_letter_id: UUID,
     experience_id: UUID,
-    db: Session = Depends(get_db),
+    relevance_order: Optional[int] = Query(None, ge=1),
+    db: AsyncSession = Depends(get_db),
     current_user: dict = Depends(get_current_user_dependency)
 ):
     """Add an experience to a cover letter."""
@@ -119,7 +205,8 @@ async def add_experience_to_cover_letter(
         db=db,
         cover_letter_id=cover_letter_id,
         experience_id=experience_id,
-        user_id=current_user["id"]
+        user_id=current_user["id"],
+        relevance_order=relevance_order
     )
 
 
@@ -127,7 +214,7 @@ async def add_experience_to_cover_letter(
 async def remove_experience_from_cover_letter(
     cover_letter_id: UUID,
     experience_id: UUID,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_db),
     current_user: dict = Depends(get_current_user_dependency)
 ):
     """Remove an experience from a cover letter."""
@@ -1,8 +1,9 @@
-from fastapi import APIRouter, Depends, HTTPException, status
-from sqlalchemy.orm import Session
-from typing import List
+from fastapi import APIRouter, Depends, HTTPException, Query, Response, status
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+from typing import List, Optional
 from database import get_db
-from schemas.experience import ExperienceCreate, Experience, ExperienceUpdate
+from schemas.experience import ExperienceCreate, Experience, ExperienceUpdate, ExperienceListItem
 from services.experience_service import (
     create_experience, 
     get_user_experiences, 
@@ -12,6 +13,7 @@ from services.experience_service import (
 )
 from models.experience import Experience as ExperienceModel
 from routers.auth import get_current_user_dependency
+from utils.clients import get_embedding_model_dependency
 import uuid
 import logging
 
@@ -28,8 +30,9 @@ router = APIRouter(
 @router.post("/", response_model=Experience, status_code=status.HTTP_201_CREATED)
 async def add_experience(
     experience: ExperienceCreate,
-    db: Session = Depends(get_db),
-    current_user: dict = Depends(get_current_user_dependency)
+    db: AsyncSession = Depends(get_db),
+    current_user: dict = Depends(get_current_user_dependency),
+    embedding_model=Depends(get_embedding_model_dependency)
 ):
     """
     Create a new experience for the logged-in user.
@@ -55,17 +58,23 @@ async def add_experience(
         start_date=experience.start_date,
         end_date=experience.end_date,
         is_current=experience.is_current,
-        description=experience.description
+        description=experience.description,
+        model=embedding_model
     )
 
 
-@router.get("/", response_model=List[Experience])
+@router.get("/", response_model=List[ExperienceListItem], response_model_exclude_unset=True)
 async def get_experiences(
-    db: Session = Depends(get_db),
+    response: Response,
+    limit: int = Query(100, ge=1, le=500),
+    cursor: Optional[str] = Query(None, description="Cursor from the X-Next-Cursor header of the previous page"),
+    fields: Optional[str] = Query(None, description="Comma-separated list of fields to return"),
+    db: AsyncSession = Depends(get_db),
     current_user: dict = Depends(get_current_user_dependency)
 ):
     """
-    Retrieve all experiences for the logged-in user.
+    Retrieve a page of experiences for the logged-in user, most recent first.
+    The cursor for the next page is returned in the X-Next-Cursor header.
     """
     user_id = current_user.get("uid")
     
@@ -79,13 +88,22 @@ async def get_experiences(
                 detail="Invalid user ID format"
             )
     
-    return await get_user_experiences(db=db, user_id=user_id)
+    experiences, next_cursor = await get_user_experiences(
+        db=db,
+        user_id=user_id,
+        limit=limit,
+        cursor=cursor,
+        fields=[field.strip() for field in fields.split(",") if field.strip()] if fields else None
+    )
+    if next_cursor:
+        response.headers["X-Next-Cursor"] = next_cursor
+    return experiences
 
 
 @router.get("/{experience_id}", response_model=Experience)
 async def get_single_experience(
     experience_id: uuid.UUID,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_db),
     current_user: dict = Depends(get_current_user_dependency)
 ):
     """
@@ -110,8 +128,9 @@ async def get_single_experience(
 async def modify_experience(
     experience_id: uuid.UUID,
     experience_update: ExperienceUpdate,
-    db: Session = Depends(get_db),
-    current_user: dict = Depends(get_current_user_dependency)
+    db: AsyncSession = Depends(get_db),
+    current_user: dict = Depends(get_current_user_dependency),
+    embedding_model=Depends(get_embedding_model_dependency)
 ):
     """
     Update a specific experience by ID for the logged-in user.
@@ -138,14 +157,15 @@ async def modify_experience(
         start_date=experience_update.start_date,
         end_date=experience_update.end_date,
         is_current=experience_update.is_current,
-        description=experience_update.description
+        description=experience_update.description,
+        model=embedding_model
     )
 
 
 @router.delete("/{experience_id}", status_code=status.HTTP_204_NO_CONTENT)
 async def remove_experience(
     experience_id: uuid.UUID,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_db),
     current_user: dict = Depends(get_current_user_dependency)
 ):
     """
@@ -170,14 +190,15 @@ async def remove_experience(
 
 # Debug endpoint - for temporary use only
 @router.get("/debug/all", tags=["debug"])
-async def debug_get_all_experiences(db: Session = Depends(get_db)):
+async def debug_get_all_experiences(db: AsyncSession = Depends(get_db)):
     """
     Debug endpoint to get all experiences in the database.
     For development use only.
     """
     # Get all experiences
-    experiences = db.query(ExperienceModel).all()
-    logger.info(f"DEBUG: Found {len(experiences)} total experiences in database")
+    result = await db.execute(select(ExperienceModel))
+    experiences = result.scalars().all()
+    logger.debug("Found %d total experiences in database", len(experiences))
     
     # Return simplified version of all experiences
     return [
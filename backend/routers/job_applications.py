@@ -0,0 +1,108 @@
+from fastapi import APIRouter, Depends, Query, status
+from sqlalchemy.ext.asyncio import AsyncSession
+from typing import List
+from uuid import UUID
+from database import get_db
+from schemas.job_application import (
+    JobApplicationCreate,
+    JobApplication,
+    SimilarJobApplicationsRequest,
+    SimilarJobApplication
+)
+from services import job_application_service
+from routers.auth import get_current_user_dependency
+from utils.clients import get_embedding_model_dependency
+import asyncio
+import logging
+
+# Configure logging
+logger = logging.getLogger(__name__)
+
+router = APIRouter(
+    prefix="/api/job-applications",
+    tags=["job-applications"],
+    responses={404: {"description": "Not found"}},
+)
+
+
+@router.post("", response_model=JobApplication, status_code=status.HTTP_201_CREATED)
+async def create_job_application(
+    job_application: JobApplicationCreate,
+    db: AsyncSession = Depends(get_db),
+    current_user: dict = Depends(get_current_user_dependency),
+    embedding_model=Depends(get_embedding_model_dependency)
+):
+    """Record a job application, embedding it for similar-job lookups."""
+    return await job_application_service.create_job_application(
+        db=db,
+        user_id=current_user["id"],
+        company_name=job_application.company_name,
+        job_title=job_application.job_title,
+        job_description=job_application.job_description,
+        cover_letter=job_application.cover_letter,
+        status=job_application.status,
+        model=embedding_model
+    )
+
+
+@router.post("/similar", response_model=List[SimilarJobApplication])
+async def find_similar_job_applications(
+    request: SimilarJobApplicationsRequest,
+    db: AsyncSession = Depends(get_db),
+    current_user: dict = Depends(get_current_user_dependency),
+    embedding_model=Depends(get_embedding_model_dependency)
+):
+    """
+    Find the user's past applications most similar to a job posting,
+    so their cover letters and experience selections can be reused.
+    """
+    embedding = await asyncio.to_thread(
+        job_application_service.embed_job_application,
+        request.job_title,
+        request.job_description,
+        embedding_model
+    )
+    return await job_application_service.find_similar_job_applications(
+        db=db,
+        user_id=current_user["id"],
+        embedding=embedding,
+        limit=request.limit
+    )
+
+
+@router.get("/{job_application_id}", response_model=JobApplication)
+async def get_job_application(
+    job_application_id: UUID,
+    db: AsyncSession = Depends(get_db),
+    current_user: dict = Depends(get_current_user_dependency)
+):
+    """Get a specific job application by ID."""
+    return await job_application_service.get_job_application(
+        db=db,
+        job_application_id=job_application_id,
+        user_id=current_user["id"]
+    )
+
+
+@router.get("/{job_application_id}/similar", response_model=List[SimilarJobApplication])
+async def get_similar_job_applications(
+    job_application_id: UUID,
+    limit: int = Query(5, ge=1, le=50),
+    db: AsyncSession = Depends(get_db),
+    current_user: dict = Depends(get_current_user_dependency)
+):
+    """Find the user's other applications most similar to a saved one."""
+    application = await job_application_service.get_job_application(
+        db=db,
+        job_application_id=job_application_id,
+        user_id=current_user["id"]
+    )
+    if application.embedding is None:
+        return []
+    return await job_application_service.find_similar_job_applications(
+        db=db,
+        user_id=current_user["id"],
+        embedding=list(application.embedding),
+        limit=limit,
+        exclude_id=application.id
+    )
@@ -1,6 +1,6 @@
-from pydantic import BaseModel, UUID4, Field
-from typing import List, Optional
-from datetime import datetime
+from pydantic import AliasChoices, BaseModel, UUID4, Field
+from typing import List, Literal, Optional
+from datetime import date, datetime
 from uuid import UUID
 
 
@@ -27,6 +27,26 @@ class CoverLetterUpdate(BaseModel):
     max_length: Optional[int] = Field(None, description="Maximum length of the cover letter in words", ge=100, le=1000)
 
 
+class CoverLetterGenerateRequest(BaseModel):
+    """Schema for generating a cover letter and saving it in one request."""
+    job_title: str = Field(..., description="The title of the job being applied for")
+    company_name: str = Field(..., description="The name of the company")
+    hiring_manager: Optional[str] = Field(None, description="Name of the hiring manager, if known")
+    job_description: str = Field(..., description="The full job description")
+    tone: str = Field("professional", description="The desired tone of the cover letter")
+    max_length: int = Field(500, description="Maximum length of the cover letter in words", ge=100, le=1000)
+    top_k: int = Field(2, description="Number of ranked experiences to include", ge=1, le=10)
+    duplicate_strategy: Optional[Literal["reuse", "edit"]] = Field(
+        None,
+        description=(
+            "What to do when an earlier application by the user has a near-duplicate posting: "
+            "'reuse' saves its cover letter without generating if it was for the same company (otherwise it is edited), "
+            "'edit' revises it with one cheaper model call, "
+            "and no value generates as usual and reports the near duplicate in the response"
+        )
+    )
+
+
 class CoverLetterExperienceLink(BaseModel):
     experience_id: UUID4
     relevance_order: int
@@ -47,18 +67,20 @@ class ExperienceInCoverLetter(BaseModel):
     """Schema for an experience included in a cover letter."""
     id: UUID
     title: str
-    company: str
-    start_date: datetime
-    end_date: Optional[datetime]
-    description: str
-    key_achievements: List[str]
+    company_name: str
+    start_date: date
+    end_date: Optional[date] = None
+    description: Optional[str] = None
+
+    class Config:
+        from_attributes = True
 
 
 class CoverLetterOutput(CoverLetterBase):
     """Schema for cover letter response data."""
     id: UUID
     user_id: UUID
-    content: str
+    content: Optional[str] = Field(None, validation_alias=AliasChoices("content", "generated_content"))
     created_at: datetime
     updated_at: datetime
     experiences: List[ExperienceInCoverLetter] = Field(default_factory=list)
@@ -67,5 +89,16 @@ class CoverLetterOutput(CoverLetterBase):
         from_attributes = True
 
 
+class CoverLetterSummary(BaseModel):
+    """Lightweight cover letter listing entry without the large text columns."""
+    id: UUID
+    job_title: str
+    company_name: str
+    status: Optional[str] = None
+    created_at: Optional[datetime] = None
+    updated_at: Optional[datetime] = None
+    content_preview: Optional[str] = Field(None, description="Beginning of the generated content")
+
+
 class CoverLetterInDB(CoverLetterOutput):
     pass 
\ No newline at end of file
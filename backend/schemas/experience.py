@@ -49,4 +49,19 @@ class Experience(ExperienceBase):
     updated_at: Optional[datetime] = None
     
     class Config:
-        from_attributes = True 
\ No newline at end of file
+        from_attributes = True
+
+
+class ExperienceListItem(BaseModel):
+    """Experience in a listing; only the requested fields are returned."""
+    id: UUID4
+    user_id: Optional[UUID4] = None
+    company_name: Optional[str] = None
+    title: Optional[str] = None
+    location: Optional[str] = None
+    start_date: Optional[date] = None
+    end_date: Optional[date] = None
+    is_current: Optional[bool] = None
+    description: Optional[str] = None
+    created_at: Optional[datetime] = None
+    updated_at: Optional[datetime] = None
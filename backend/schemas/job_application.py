@@ -0,0 +1,42 @@
+from pydantic import BaseModel, UUID4, Field
+from typing import List, Optional
+from datetime import datetime
+
+
+class JobApplicationBase(BaseModel):
+    """Base schema for job application data."""
+    company_name: str = Field(..., description="The name of the company")
+    job_title: str = Field(..., description="The title of the job being applied for")
+    job_description: str = Field(..., description="The full job description")
+
+
+class JobApplicationCreate(JobApplicationBase):
+    """Schema for recording a job application."""
+    cover_letter: Optional[str] = Field(None, description="The cover letter sent with the application")
+    status: str = Field("draft", description="Application status (e.g., draft, applied, interviewing)")
+
+
+class JobApplication(JobApplicationBase):
+    """Schema for job application response data."""
+    id: UUID4
+    user_id: UUID4
+    cover_letter: Optional[str] = None
+    status: Optional[str] = None
+    created_at: Optional[datetime] = None
+    updated_at: Optional[datetime] = None
+
+    class Config:
+        from_attributes = True
+
+
+class SimilarJobApplicationsRequest(BaseModel):
+    """Schema for looking up past applications similar to a job posting."""
+    job_title: str = Field("", description="The title of the job being applied for")
+    job_description: str = Field(..., description="The full job description")
+    limit: int = Field(5, description="Maximum number of applications to return", ge=1, le=50)
+
+
+class SimilarJobApplication(JobApplication):
+    """A past application with its similarity to the looked-up posting."""
+    similarity: float = Field(..., description="Cosine similarity between the postings, from -1 to 1")
+    experience_ids: List[UUID4] = Field(default_factory=list, description="Experiences used for the application, most relevant first")
@@ -1,21 +1,28 @@
 from datetime import datetime, timedelta
-from typing import Optional
+from typing import Optional, Dict, Any
+import hashlib
+import time
+import uuid
 from passlib.context import CryptContext
 from fastapi import HTTPException, status
-from sqlalchemy.orm import Session
+from sqlalchemy import select
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.ext.asyncio import AsyncSession
 from models.auth import User
 import os
 from dotenv import load_dotenv
 import logging
 
 # Import Firebase for authentication
-from utils.firebase import firebase_auth
+from utils.firebase import get_firebase_auth
+from utils.firebase_tokens import FirebaseTokenVerifier, GoogleCertKeySource, resolve_project_id
 from config.settings import settings
+from utils.cache import TTLCache
 
 load_dotenv()
 
 # Configure logging
-logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
 # Password hashing for local accounts (if needed)
@@ -24,10 +31,47 @@ pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
 # Use settings instead of directly accessing environment variables
 DEV_TEST_TOKEN = "dev_test_token"  # Special token for development mode
 
+# Verified tokens keyed by token hash; each entry expires with the token itself
+_token_cache = TTLCache(maxsize=settings.AUTH_TOKEN_CACHE_SIZE)
+# User data keyed by firebase_uid, kept briefly so repeated requests skip the database
+_user_cache = TTLCache(maxsize=settings.AUTH_USER_CACHE_SIZE, ttl=settings.AUTH_USER_CACHE_TTL)
+
+def _token_cache_key(token: str) -> str:
+    return hashlib.sha256(token.encode()).hexdigest()
+
+_token_verifier: Optional[FirebaseTokenVerifier] = None
+_token_verifier_resolved = False
+
+def get_token_verifier() -> Optional[FirebaseTokenVerifier]:
+    """
+    Local ID token verifier, or None to fall back to the Firebase Admin SDK.
+
+    Local verification needs the Firebase project ID, from settings or the service account file.
+    """
+    global _token_verifier, _token_verifier_resolved
+    if not _token_verifier_resolved:
+        _token_verifier_resolved = True
+        project_id = resolve_project_id() if settings.FIREBASE_VERIFY_TOKENS_LOCALLY else None
+        if project_id:
+            _token_verifier = FirebaseTokenVerifier(
+                project_id,
+                GoogleCertKeySource(min_forced_interval=settings.FIREBASE_KEY_REFRESH_MIN_INTERVAL)
+            )
+        elif settings.FIREBASE_VERIFY_TOKENS_LOCALLY:
+            logger.warning("Firebase project ID not configured, verifying tokens with the Admin SDK")
+    return _token_verifier
+
+def set_token_verifier(verifier: Optional[FirebaseTokenVerifier]) -> None:
+    """Replace the token verifier, e.g. with one backed by a StaticKeySource in tests."""
+    global _token_verifier, _token_verifier_resolved
+    _token_verifier = verifier
+    _token_verifier_resolved = True
+    _token_cache.clear()
+
 async def verify_firebase_token(token: str):
     """Verify Firebase ID token and return user info"""
     try:
-        logger.info("Verifying Firebase token")
+        logger.debug("Verifying Firebase token")
         
         # Development mode bypass for testing
         if settings.DEV_MODE and token == DEV_TEST_TOKEN:
@@ -39,21 +83,35 @@ async def verify_firebase_token(token: str):
                 "name": settings.TEST_USER_NAME
             }
             
-        # Normal production flow - verify the Firebase token
-        decoded_token = firebase_auth.verify_id_token(token)
-        logger.info(f"Token verified successfully for user: {decoded_token.get('email')}")
+        cache_key = _token_cache_key(token)
+        cached_token = _token_cache.get(cache_key)
+        if cached_token is not None:
+            return cached_token
+            
+        # Normal production flow - verify the Firebase token, locally when possible
+        verifier = get_token_verifier()
+        if verifier is not None:
+            decoded_token = await verifier.verify(token)
+        else:
+            decoded_token = get_firebase_auth().verify_id_token(token)
+        logger.debug("Token verified successfully for uid: %s", decoded_token.get("uid"))
+        
+        # Never serve a cached token past its own expiry
+        expires_at = decoded_token.get("exp")
+        if expires_at:
+            _token_cache.set(cache_key, decoded_token, ttl=expires_at - time.time())
         return decoded_token
     except Exception as e:
-        logger.error(f"Firebase token verification failed: {str(e)}")
+        logger.error("Firebase token verification failed: %s", e)
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail=f"Invalid Firebase token: {str(e)}"
         )
 
-async def get_or_create_user_from_firebase(db: Session, token: str):
+async def get_or_create_user_from_firebase(db: AsyncSession, token: str):
     """Get or create user from Firebase token"""
     try:
-        logger.info("Processing user from Firebase token")
+        logger.debug("Processing user from Firebase token")
         # Verify the token
         decoded_token = await verify_firebase_token(token)
         
@@ -62,8 +120,6 @@ async def get_or_create_user_from_firebase(db: Session, token: str):
         email = decoded_token.get("email")
         display_name = decoded_token.get("name", "")
         
-        logger.info(f"Firebase UID: {firebase_uid}, Email: {email}")
-        
         if not firebase_uid or not email:
             logger.error("Missing user information in token")
             raise HTTPException(
@@ -71,42 +127,80 @@ async def get_or_create_user_from_firebase(db: Session, token: str):
                 detail="Invalid token: missing user information"
             )
         
-        # Find user by firebase_uid
-        user = db.query(User).filter(User.firebase_uid == firebase_uid).first()
-        
-        # If not found by firebase_uid, try by email
-        if not user:
-            logger.info(f"User not found by firebase_uid, searching by email: {email}")
-            user = db.query(User).filter(User.email == email).first()
-            
-            # If found by email but firebase_uid doesn't match, update it
-            if user and user.firebase_uid != firebase_uid:
-                logger.info(f"Updating firebase_uid for existing user: {email}")
-                user.firebase_uid = firebase_uid
-                db.commit()
-        
-        # If user still not found, create a new one
-        if not user:
-            logger.info(f"Creating new user with email: {email}")
-            import uuid
-            user = User(
-                id=uuid.uuid4(),
-                email=email,
-                firebase_uid=firebase_uid,
-                full_name=display_name,
-                is_active=True
-            )
-            db.add(user)
-            db.commit()
-            db.refresh(user)
-            logger.info(f"New user created successfully: {email}")
-        else:
-            logger.info(f"Existing user found: {email}")
+        # Create the user, or claim the existing row with the same email, in one round trip.
+        # Concurrent first logins resolve in the database instead of racing on separate lookups.
+        insert_user = pg_insert(User).values(
+            id=uuid.uuid4(),
+            email=email,
+            firebase_uid=firebase_uid,
+            full_name=display_name,
+            is_active=True
+        )
+        # The update only applies when the uid actually changes, so returning users
+        # neither write nor lock their row; RETURNING is then empty and the row is read
+        upsert = insert_user.on_conflict_do_update(
+            index_elements=[User.email],
+            set_={"firebase_uid": insert_user.excluded.firebase_uid},
+            where=User.firebase_uid.is_distinct_from(insert_user.excluded.firebase_uid)
+        ).returning(User)
+        try:
+            result = await db.scalars(upsert, execution_options={"populate_existing": True})
+            user = result.one_or_none()
+            await db.commit()
+            if user is None:
+                result = await db.execute(select(User).where(User.email == email))
+                user = result.scalars().one()
+        except IntegrityError:
+            # The firebase_uid already belongs to a row with another email,
+            # e.g. the user changed their email in Firebase
+            await db.rollback()
+            logger.info("firebase_uid already linked to another email, loading existing user")
+            result = await db.execute(select(User).where(User.firebase_uid == firebase_uid))
+            user = result.scalars().first()
+            if user is None:
+                raise
         
         return user
     except Exception as e:
-        logger.error(f"Error in get_or_create_user_from_firebase: {str(e)}")
+        logger.error("Error in get_or_create_user_from_firebase: %s", e)
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail=f"Authentication failed: {str(e)}"
-        )
\ No newline at end of file
+        )
+
+def _user_to_dict(user: User) -> Dict[str, Any]:
+    return {
+        "id": str(user.id),
+        "uid": str(user.id),  # Add this for compatibility
+        "firebase_uid": user.firebase_uid,
+        "email": user.email,
+        "full_name": user.full_name,
+        "is_active": user.is_active
+    }
+
+async def get_current_user_data(db: AsyncSession, token: str) -> Dict[str, Any]:
+    """
+    Resolve the user for a Firebase token, using the token and user caches.
+
+    Returns a plain dict so cached entries never hold session-bound ORM objects.
+    """
+    decoded_token = await verify_firebase_token(token)
+    firebase_uid = decoded_token.get("uid")
+    
+    user_data = _user_cache.get(firebase_uid) if firebase_uid else None
+    if user_data is None:
+        user = await get_or_create_user_from_firebase(db, token)
+        user_data = _user_to_dict(user)
+        _user_cache.set(user.firebase_uid, user_data)
+    
+    # Callers get their own copy so the cached entry cannot be mutated
+    return dict(user_data)
+
+def invalidate_user_cache(firebase_uid: str) -> None:
+    """Drop the cached user data after the user record changes."""
+    _user_cache.pop(firebase_uid)
+
+def clear_auth_caches() -> None:
+    """Drop all cached tokens and users, e.g. on application shutdown."""
+    _token_cache.clear()
+    _user_cache.clear()
@@ -1,58 +1,159 @@
-from typing import List, Optional
+from typing import List, Optional, Dict, Any, Tuple
+import asyncio
 import json
 from models.request_models import CoverLetterRequest, CoverLetterOutput
+from models.request_models import Experience as ExperienceInput
 from langchain_core.output_parsers import PydanticOutputParser
 from langchain_core.prompts import PromptTemplate
 import re
-from sqlalchemy.orm import Session
+from sqlalchemy.ext.asyncio import AsyncSession
 from models.cover_letter import CoverLetter, CoverLetterExperience
-from sqlalchemy import and_
+from sqlalchemy import and_, delete, exists, func, insert, select, tuple_
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.orm import selectinload
 from fastapi import HTTPException, status
 import uuid
 from datetime import datetime
 from sqlalchemy.exc import IntegrityError
+import logging
 
 from models.experience import Experience
-from schemas.cover_letter import CoverLetterCreate, CoverLetterUpdate
+from schemas.cover_letter import CoverLetterCreate, CoverLetterUpdate, CoverLetterGenerateRequest
 from services.experience_service import get_top_experiences
+from services.job_application_service import (
+    add_job_application,
+    embed_job_application,
+    find_near_duplicate_application,
+    normalize_company_name
+)
 from services.company_search_service import get_company_context_for_cover_letter
+from services.job_description_service import clean_job_description, preprocess_job_description
+from utils.pagination import encode_cursor, decode_cursor
+from utils.metrics import track_stage
+from utils.tracing import tracer, estimate_token_count
+
+# Configure logging
+logger = logging.getLogger(__name__)
 
 # Parser for the generated cover letter
 parser = PydanticOutputParser(pydantic_object=CoverLetterOutput)
 
 # CRUD Operations for Cover Letters
-async def create_cover_letter(db: Session, user_id: uuid.UUID, cover_letter_data: CoverLetterCreate) -> CoverLetter:
+async def create_cover_letter(db: AsyncSession, user_id: uuid.UUID, cover_letter_data: CoverLetterCreate) -> CoverLetter:
     """Create a new cover letter for a user."""
     try:
-        # Create a new cover letter instance
+        # Create a new cover letter instance; it starts with no experiences,
+        # so the collection is initialized empty instead of being loaded later
         cover_letter = CoverLetter(
             user_id=user_id,
+            selected_experiences=[],
             **cover_letter_data.model_dump()
         )
         
         # Add to database
         db.add(cover_letter)
-        db.commit()
-        db.refresh(cover_letter)
+        await db.commit()
+        # Only reload the server-generated columns
+        await db.refresh(cover_letter, attribute_names=["created_at", "updated_at"])
         
         return cover_letter
     except IntegrityError:
-        db.rollback()
+        await db.rollback()
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail="Failed to create cover letter. Please check your input."
         )
 
-async def get_cover_letters(db: Session, user_id: uuid.UUID) -> List[CoverLetter]:
-    """Get all cover letters for a user."""
-    return db.query(CoverLetter).filter(CoverLetter.user_id == user_id).all()
+def _paginate_cover_letters(query, limit: int, cursor: Optional[str]):
+    """Order a cover letter query newest first and apply the keyset cursor."""
+    query = query.order_by(CoverLetter.created_at.desc(), CoverLetter.id.desc()).limit(limit + 1)
+    if cursor:
+        created_at, cover_letter_id = decode_cursor(cursor, 2)
+        try:
+            cursor_key = (datetime.fromisoformat(created_at), uuid.UUID(cover_letter_id))
+        except ValueError:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail="Invalid pagination cursor"
+            )
+        query = query.where(tuple_(CoverLetter.created_at, CoverLetter.id) < tuple_(*cursor_key))
+    return query
+
+def _next_cover_letter_cursor(rows: list, limit: int) -> Tuple[list, Optional[str]]:
+    """Trim the extra lookahead row and build the cursor for the next page."""
+    if len(rows) <= limit:
+        return rows, None
+    rows = rows[:limit]
+    last = rows[-1]
+    if isinstance(last, CoverLetter):
+        return rows, encode_cursor(last.created_at.isoformat(), last.id)
+    return rows, encode_cursor(last["created_at"].isoformat(), last["id"])
 
-async def get_cover_letter(db: Session, cover_letter_id: uuid.UUID, user_id: uuid.UUID) -> CoverLetter:
+async def get_cover_letters(
+    db: AsyncSession,
+    user_id: uuid.UUID,
+    limit: int = 50,
+    cursor: Optional[str] = None
+) -> Tuple[List[CoverLetter], Optional[str]]:
+    """Get a page of cover letters for a user, newest first, and the next page cursor."""
+    query = _paginate_cover_letters(
+        _with_experiences(select(CoverLetter).where(CoverLetter.user_id == user_id)), limit, cursor
+    )
+    result = await db.execute(query)
+    return _next_cover_letter_cursor(result.scalars().all(), limit)
+
+async def get_cover_letter_summaries(
+    db: AsyncSession,
+    user_id: uuid.UUID,
+    limit: int = 50,
+    cursor: Optional[str] = None,
+    preview_length: int = 200
+) -> Tuple[List[Dict[str, Any]], Optional[str]]:
+    """
+    Get a page of lightweight cover letter summaries for a user.
+
+    The job description and generated content columns are not loaded; only a
+    short preview of the generated content is computed in the database.
+    """
+    query = _paginate_cover_letters(
+        select(
+            CoverLetter.id,
+            CoverLetter.job_title,
+            CoverLetter.company_name,
+            CoverLetter.status,
+            CoverLetter.created_at,
+            CoverLetter.updated_at,
+            func.left(CoverLetter.generated_content, preview_length).label("content_preview")
+        ).where(CoverLetter.user_id == user_id),
+        limit,
+        cursor
+    )
+    result = await db.execute(query)
+    rows, next_cursor = _next_cover_letter_cursor(result.mappings().all(), limit)
+    return [dict(row) for row in rows], next_cursor
+
+def _with_experiences(query):
+    """Eager load the cover letter's experience links and their experiences."""
+    return query.options(
+        selectinload(CoverLetter.selected_experiences).selectinload(CoverLetterExperience.experience)
+    )
+
+async def get_cover_letter(
+    db: AsyncSession,
+    cover_letter_id: uuid.UUID,
+    user_id: uuid.UUID,
+    with_experiences: bool = True
+) -> CoverLetter:
     """Get a specific cover letter by ID."""
-    cover_letter = db.query(CoverLetter).filter(
+    query = select(CoverLetter).where(
         CoverLetter.id == cover_letter_id,
         CoverLetter.user_id == user_id
-    ).first()
+    )
+    if with_experiences:
+        # populate_existing refreshes links that changed earlier in this session
+        query = _with_experiences(query).execution_options(populate_existing=True)
+    result = await db.execute(query)
+    cover_letter = result.scalars().first()
     
     if not cover_letter:
         raise HTTPException(
@@ -63,7 +164,7 @@ async def get_cover_letter(db: Session, cover_letter_id: uuid.UUID, user_id: uui
     return cover_letter
 
 async def update_cover_letter(
-    db: Session,
+    db: AsyncSession,
     cover_letter_id: uuid.UUID,
     user_id: uuid.UUID,
     cover_letter_data: CoverLetterUpdate
@@ -77,118 +178,367 @@ async def update_cover_letter(
         setattr(cover_letter, field, value)
     
     try:
-        db.commit()
-        db.refresh(cover_letter)
+        await db.commit()
+        # Only reload the server-generated column; the eagerly loaded experiences are unchanged
+        await db.refresh(cover_letter, attribute_names=["updated_at"])
         return cover_letter
     except IntegrityError:
-        db.rollback()
+        await db.rollback()
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail="Failed to update cover letter. Please check your input."
         )
 
-async def delete_cover_letter(db: Session, cover_letter_id: uuid.UUID, user_id: uuid.UUID) -> None:
+async def delete_cover_letter(db: AsyncSession, cover_letter_id: uuid.UUID, user_id: uuid.UUID) -> None:
     """Delete a cover letter."""
-    cover_letter = await get_cover_letter(db, cover_letter_id, user_id)
+    cover_letter = await get_cover_letter(db, cover_letter_id, user_id, with_experiences=False)
     
     try:
-        db.delete(cover_letter)
-        db.commit()
+        await db.delete(cover_letter)
+        await db.commit()
     except IntegrityError:
-        db.rollback()
+        await db.rollback()
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail="Failed to delete cover letter."
         )
 
+async def _verify_experience_owner(db: AsyncSession, experience_id: uuid.UUID, user_id: uuid.UUID) -> None:
+    """Raise 404 unless the experience exists and belongs to the user."""
+    owned = await db.scalar(
+        select(
+            exists().where(
+                Experience.id == experience_id,
+                Experience.user_id == user_id
+            )
+        )
+    )
+    if not owned:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Experience not found"
+        )
+
 async def add_experience_to_cover_letter(
-    db: Session,
+    db: AsyncSession,
     cover_letter_id: uuid.UUID,
     experience_id: uuid.UUID,
-    user_id: uuid.UUID
+    user_id: uuid.UUID,
+    relevance_order: Optional[int] = None
 ) -> CoverLetter:
     """Add an experience to a cover letter."""
     # Verify cover letter exists and belongs to user
-    cover_letter = await get_cover_letter(db, cover_letter_id, user_id)
+    await get_cover_letter(db, cover_letter_id, user_id, with_experiences=False)
     
     # Verify experience exists and belongs to user
-    experience = db.query(Experience).filter(
-        Experience.id == experience_id,
-        Experience.user_id == user_id
-    ).first()
+    await _verify_experience_owner(db, experience_id, user_id)
     
-    if not experience:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail="Experience not found"
+    if relevance_order is None:
+        # Append after the existing links
+        relevance_order = (
+            select(func.coalesce(func.max(CoverLetterExperience.relevance_order), 0) + 1)
+            .where(CoverLetterExperience.cover_letter_id == cover_letter_id)
+            .scalar_subquery()
         )
     
-    # Add experience to cover letter if not already added
-    if experience not in cover_letter.experiences:
-        cover_letter.experiences.append(experience)
-        db.commit()
-        db.refresh(cover_letter)
+    # Add experience to cover letter if not already added; the unique index makes
+    # concurrent adds of the same experience settle on a single link
+    result = await db.execute(
+        pg_insert(CoverLetterExperience)
+        .values(
+            cover_letter_id=cover_letter_id,
+            experience_id=experience_id,
+            relevance_order=relevance_order
+        )
+        .on_conflict_do_nothing(
+            index_elements=[CoverLetterExperience.cover_letter_id, CoverLetterExperience.experience_id]
+        )
+    )
+    if result.rowcount:
+        await db.commit()
     
-    return cover_letter
+    return await get_cover_letter(db, cover_letter_id, user_id)
 
 async def remove_experience_from_cover_letter(
-    db: Session,
+    db: AsyncSession,
     cover_letter_id: uuid.UUID,
     experience_id: uuid.UUID,
     user_id: uuid.UUID
 ) -> CoverLetter:
     """Remove an experience from a cover letter."""
     # Verify cover letter exists and belongs to user
-    cover_letter = await get_cover_letter(db, cover_letter_id, user_id)
-    
-    # Find the experience in the cover letter
-    experience = db.query(Experience).filter(
-        Experience.id == experience_id,
-        Experience.user_id == user_id
-    ).first()
+    await get_cover_letter(db, cover_letter_id, user_id, with_experiences=False)
     
-    if not experience:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail="Experience not found"
-        )
+    # Verify experience exists and belongs to user
+    await _verify_experience_owner(db, experience_id, user_id)
     
     # Remove experience from cover letter if it exists
-    if experience in cover_letter.experiences:
-        cover_letter.experiences.remove(experience)
-        db.commit()
-        db.refresh(cover_letter)
+    result = await db.execute(
+        delete(CoverLetterExperience).where(
+            CoverLetterExperience.cover_letter_id == cover_letter_id,
+            CoverLetterExperience.experience_id == experience_id
+        )
+    )
+    if result.rowcount:
+        await db.commit()
     
-    return cover_letter
+    return await get_cover_letter(db, cover_letter_id, user_id)
+
+def _format_duration(experience: Dict[str, Any]) -> str:
+    """Format an experience's date range for the generation prompt."""
+    start = experience["start_date"].strftime("%b %Y") if experience.get("start_date") else ""
+    if experience.get("is_current"):
+        end = "Present"
+    else:
+        end = experience["end_date"].strftime("%b %Y") if experience.get("end_date") else ""
+    return f"{start} - {end}".strip(" -")
+
+async def _get_experiences_by_id(
+    db: AsyncSession,
+    user_id: uuid.UUID,
+    experience_ids: List[uuid.UUID]
+) -> List[Dict[str, Any]]:
+    """Load the user's experiences with the given IDs, in the given order, as ranking-style dicts."""
+    if not experience_ids:
+        return []
+    result = await db.execute(
+        select(Experience).where(Experience.user_id == user_id, Experience.id.in_(experience_ids))
+    )
+    experiences = {exp.id: exp for exp in result.scalars().all()}
+    return [
+        {
+            "id": str(exp.id),
+            "company_name": exp.company_name,
+            "title": exp.title,
+            "location": exp.location,
+            "start_date": exp.start_date,
+            "end_date": exp.end_date,
+            "is_current": exp.is_current,
+            "description": exp.description,
+            "similarity_score": None
+        }
+        for exp in (experiences.get(experience_id) for experience_id in experience_ids)
+        if exp is not None
+    ]
+
+async def _save_generated_cover_letter(
+    db: AsyncSession,
+    user_id: uuid.UUID,
+    request: CoverLetterGenerateRequest,
+    generated_content: Optional[str],
+    experiences: List[Dict[str, Any]],
+    embedding_model=None
+) -> Tuple[CoverLetter, Any]:
+    """
+    Save a cover letter, its experience links and the matching job application in one transaction.
+    """
+    cover_letter = CoverLetter(
+        id=uuid.uuid4(),
+        user_id=user_id,
+        job_title=request.job_title,
+        company_name=request.company_name,
+        hiring_manager=request.hiring_manager,
+        job_description=request.job_description,
+        tone=request.tone,
+        max_length=request.max_length,
+        generated_content=generated_content
+    )
+    selected_experiences = [
+        {
+            "cover_letter_id": cover_letter.id,
+            "experience_id": uuid.UUID(exp["id"]),
+            "relevance_order": order
+        }
+        for order, exp in enumerate(experiences, start=1)
+    ]
+
+    # Encoding is CPU-bound, so it runs in a worker thread to keep the event loop free
+    application_embedding = await asyncio.to_thread(
+        embed_job_application, request.job_title, request.job_description, embedding_model
+    )
 
-# Existing function for generating cover letter content
-async def generate_cover_letter(request: CoverLetterRequest, bedrock_client):
-    # Get company context if company name is provided
-    company_context = ""
-    if request.company_name:
-        try:
-            company_info = await get_company_context_for_cover_letter(
-                company_name=request.company_name,
-                job_description=request.job_description
-            )
-            if "context" in company_info and company_info["context"]:
-                company_context = f"\n\nCompany Context:\n{company_info['context']}"
-        except Exception as e:
-            # Log the error but continue without company context
-            print(f"Error getting company context: {str(e)}")
-    
-    prompt = construct_prompt(request, company_context)
-    
     try:
-        response = bedrock_client.invoke_model(
-            modelId="us.meta.llama3-2-3b-instruct-v1:0",
-            body=json.dumps({
-                "prompt": prompt,
-                "temperature": 0.7,
-                "top_p": 0.9
-            })
+        db.add(cover_letter)
+        # Flush the parent row so the links can reference it within the same transaction
+        await db.flush()
+        if selected_experiences:
+            await db.execute(insert(CoverLetterExperience), selected_experiences)
+        job_application = await add_job_application(
+            db,
+            user_id=user_id,
+            company_name=request.company_name,
+            job_title=request.job_title,
+            job_description=request.job_description,
+            cover_letter=generated_content,
+            selected_experiences=[
+                {
+                    "experience_id": uuid.UUID(exp["id"]),
+                    "relevance_order": order,
+                    "similarity_score": exp["similarity_score"]
+                }
+                for order, exp in enumerate(experiences, start=1)
+            ],
+            embedding=application_embedding
         )
-        
+        await db.commit()
+    except IntegrityError:
+        await db.rollback()
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Failed to save generated cover letter. Please check your input."
+        )
+
+    return cover_letter, job_application
+
+def _selected_experiences_response(experiences: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    return [
+        {
+            "experience_id": exp["id"],
+            "relevance_order": order,
+            "similarity_score": exp["similarity_score"]
+        }
+        for order, exp in enumerate(experiences, start=1)
+    ]
+
+async def find_near_duplicate(
+    db: AsyncSession,
+    user_id: uuid.UUID,
+    request: CoverLetterGenerateRequest
+) -> Optional[Dict[str, Any]]:
+    """
+    Find an earlier application by the user for a nearly identical posting, if any.
+
+    The result's same_company flag tells whether it was for the same company;
+    the posting fingerprint alone cannot, since companies share posting templates.
+    """
+    near_duplicate = await find_near_duplicate_application(db, user_id, request.job_title, request.job_description)
+    if near_duplicate:
+        near_duplicate["same_company"] = (
+            normalize_company_name(near_duplicate["company_name"]) == normalize_company_name(request.company_name)
+        )
+    return near_duplicate
+
+def near_duplicate_strategy(
+    request: CoverLetterGenerateRequest,
+    near_duplicate: Optional[Dict[str, Any]]
+) -> Optional[str]:
+    """
+    How to handle a near-duplicate earlier application: "reuse", "edit" or None.
+
+    A letter is only reused verbatim for the same company; for another company
+    "reuse" falls back to "edit", so the letter is readdressed rather than sent
+    with the earlier company's name in it.
+    """
+    if not near_duplicate or not request.duplicate_strategy:
+        return None
+    if request.duplicate_strategy == "reuse" and not near_duplicate["same_company"]:
+        return "edit"
+    return request.duplicate_strategy
+
+async def reuse_cover_letter(
+    db: AsyncSession,
+    user_id: uuid.UUID,
+    request: CoverLetterGenerateRequest,
+    near_duplicate: Dict[str, Any],
+    embedding_model=None
+) -> Dict[str, Any]:
+    """
+    Save the cover letter of a near-duplicate earlier application for a new posting, without generating.
+    """
+    experiences = await _get_experiences_by_id(db, user_id, near_duplicate["experience_ids"])
+    cover_letter, job_application = await _save_generated_cover_letter(
+        db, user_id, request, near_duplicate["cover_letter"], experiences, embedding_model
+    )
+    return {
+        "cover_letter": near_duplicate["cover_letter"],
+        "chances": None,
+        "chances_explanation": None,
+        "id": str(cover_letter.id),
+        "job_application_id": str(job_application.id),
+        "reused_from": str(near_duplicate["id"]),
+        "selected_experiences": _selected_experiences_response(experiences)
+    }
+
+async def generate_and_save_cover_letter(
+    db: AsyncSession,
+    user_id: uuid.UUID,
+    request: CoverLetterGenerateRequest,
+    bedrock_client,
+    search_client,
+    embedding_model=None,
+    near_duplicate: Optional[Dict[str, Any]] = None
+) -> Dict[str, Any]:
+    """
+    Generate a cover letter from the user's top ranked experiences and persist it.
+
+    The cover letter row and all of its experience links are written in a single
+    transaction, with the links inserted in one bulk statement. The posting is
+    also recorded as an embedded job application so later, similar postings can
+    find it.
+
+    With a near-duplicate earlier application and the "edit" strategy (or "reuse"
+    for another company), the earlier letter is revised in a single model call
+    using its experiences, skipping ranking and the company research. Otherwise
+    the near duplicate is only reported in the response, so the client can offer
+    to reuse it.
+    """
+    if near_duplicate_strategy(request, near_duplicate) == "edit":
+        experiences = await _get_experiences_by_id(db, user_id, near_duplicate["experience_ids"])
+        generated = await edit_cover_letter(request, near_duplicate, bedrock_client)
+    else:
+        experiences = await get_top_experiences(
+            db, user_id, request.job_description, top_k=request.top_k, model=embedding_model
+        )
+        generation_request = CoverLetterRequest(
+            company_name=request.company_name,
+            hiring_manager=request.hiring_manager,
+            job_description=request.job_description,
+            experiences=[
+                ExperienceInput(
+                    title=exp["title"],
+                    description=exp["description"] or "",
+                    skills=[],
+                    duration=_format_duration(exp)
+                )
+                for exp in experiences
+            ]
+        )
+        generated = await generate_cover_letter(generation_request, bedrock_client, search_client)
+
+    cover_letter, job_application = await _save_generated_cover_letter(
+        db, user_id, request, generated.get("cover_letter"), experiences, embedding_model
+    )
+
+    response = {
+        **generated,
+        "id": str(cover_letter.id),
+        "job_application_id": str(job_application.id),
+        "selected_experiences": _selected_experiences_response(experiences)
+    }
+    if near_duplicate:
+        response["near_duplicate"] = {
+            "job_application_id": str(near_duplicate["id"]),
+            "similarity": near_duplicate["similarity"],
+            "same_company": near_duplicate["same_company"],
+            "created_at": near_duplicate["created_at"]
+        }
+    return response
+
+async def _invoke_cover_letter_model(bedrock_client, prompt: str, stage: str) -> Dict[str, Any]:
+    """Run a cover letter prompt through Bedrock and parse the JSON object it returns."""
+    try:
+        # Run the blocking call in a worker thread so other requests keep being served
+        with track_stage(stage):
+            response = await asyncio.to_thread(
+                bedrock_client.invoke_model,
+                modelId="us.meta.llama3-2-3b-instruct-v1:0",
+                body=json.dumps({
+                    "prompt": prompt,
+                    "temperature": 0.7,
+                    "top_p": 0.9
+                })
+            )
+    
         response_body = json.loads(response['body'].read())
 
         try:
@@ -205,13 +555,54 @@ async def generate_cover_letter(request: CoverLetterRequest, bedrock_client):
                 return parsed_output  # Ensure it's a valid dict
             except json.JSONDecodeError as e:
                 raise Exception(f"Failed to decode JSON: {str(e)}\nExtracted JSON: {clean_json}")
-            
+        
         except Exception as parse_error:
             raise Exception(f"Failed to parse model output as JSON. Raw output: {response_body['generation']}")
-            
+        
     except Exception as e:
         raise Exception(f"Error generating cover letter: {str(e)}")
 
+async def edit_cover_letter(request: CoverLetterGenerateRequest, near_duplicate: Dict[str, Any], bedrock_client):
+    """
+    Revise an earlier cover letter for a nearly identical posting with a single model call.
+    """
+    with tracer.start_as_current_span("edit_cover_letter") as span:
+        span.set_attribute("company.name", request.company_name)
+        span.set_attribute("near_duplicate.similarity", near_duplicate["similarity"])
+        prompt = construct_edit_prompt(request, near_duplicate)
+        span.set_attribute("llm.prompt_tokens_estimate", estimate_token_count(prompt))
+        return await _invoke_cover_letter_model(bedrock_client, prompt, "bedrock_cover_letter_edit")
+
+# Existing function for generating cover letter content
+async def generate_cover_letter(request: CoverLetterRequest, bedrock_client, search_client):
+    with tracer.start_as_current_span("generate_cover_letter") as span:
+        span.set_attribute("company.name", request.company_name)
+        span.set_attribute("experience.count", len(request.experiences))
+        # Prompts get the cleaned description: no markup, benefits or EEO boilerplate
+        processed = preprocess_job_description(request.job_description)
+        span.set_attribute("job_description.original_length", processed["original_length"])
+        span.set_attribute("job_description.cleaned_length", processed["cleaned_length"])
+        request = request.model_copy(update={"job_description": processed["cleaned"]})
+        # Get company context if company name is provided
+        company_context = ""
+        if request.company_name:
+            try:
+                company_info = await get_company_context_for_cover_letter(
+                    company_name=request.company_name,
+                    job_description=request.job_description,
+                    search_client=search_client,
+                    bedrock_client=bedrock_client
+                )
+                if "context" in company_info and company_info["context"]:
+                    company_context = f"\n\nCompany Context:\n{company_info['context']}"
+            except Exception as e:
+                # Log the error but continue without company context
+                logger.warning("Error getting company context: %s", e)
+    
+        prompt = construct_prompt(request, company_context)
+        span.set_attribute("llm.prompt_tokens_estimate", estimate_token_count(prompt))
+        return await _invoke_cover_letter_model(bedrock_client, prompt, "bedrock_cover_letter")
+
 
 def construct_prompt(request: CoverLetterRequest, company_context: str = "") -> str:
     experiences_text = "\n".join([
@@ -264,4 +655,44 @@ def construct_prompt(request: CoverLetterRequest, company_context: str = "") ->
         experiences=experiences_text,
         hiring_manager_text=hiring_manager_text,
         company_context=company_context
-    )
\ No newline at end of file
+    )
+
+def construct_edit_prompt(request: CoverLetterGenerateRequest, near_duplicate: Dict[str, Any]) -> str:
+    hiring_manager_text = f"Hiring Manager: {request.hiring_manager}" if request.hiring_manager else ""
+    company_text = ""
+    if not near_duplicate.get("same_company", True):
+        company_text = (
+            f"The previous cover letter was written for {near_duplicate['company_name']}. "
+            f"Address {request.company_name} throughout and remove every mention of {near_duplicate['company_name']}."
+        )
+    
+    return f"""You are a professional cover letter writer. The candidate already has a cover letter for a job posting that is nearly identical to a new one. Your task is to revise it for the new posting.
+
+        Company: {request.company_name}
+        {company_text}
+
+        Previous Job Description:
+        {clean_job_description(near_duplicate["job_description"])}
+
+        New Job Description:
+        {clean_job_description(request.job_description)}
+
+        {hiring_manager_text}
+
+        Previous Cover Letter:
+        {near_duplicate["cover_letter"]}
+
+        Requirements:
+        1. Keep the previous cover letter wherever it still fits, and change only what the differences between the postings require
+        2. Address the hiring manager personally (if provided)
+        3. Keep the length to approximately 300-400 words
+
+        Provide:
+        - The revised cover letter
+        - A percentage chance of getting the job
+        - A brief explanation (100-150 words) of why the candidate is a good fit
+
+        Return ONLY a valid JSON response with the keys "cover_letter", "chances" and "chances_explanation". Do NOT include any extra text, explanations, or comments. Do NOT use Markdown formatting (e.g., no ```json).
+
+        Your response MUST start with an open curly bracket and end with closed curly bracket. Do not include any text outside the JSON block.
+        """
@@ -1,20 +1,54 @@
-from typing import List, Optional, Dict, Any
-from sqlalchemy.orm import Session
-from models.experience import Experience
+from typing import List, Optional, Dict, Any, Tuple
+from sqlalchemy.ext.asyncio import AsyncSession
+from models.experience import Experience, ExperienceChunk, experience_search_vector, text_search_config
+from utils.pagination import encode_cursor, decode_cursor
+from utils.metrics import track_stage
+from utils.tracing import tracer
+from services.skill_service import extract_skill_ids, get_experience_skill_overlap, tag_experience_skills
+from services.job_description_service import job_requirements
+from config.settings import settings
+from utils.text_chunking import chunk_text
+from utils.cache import TTLCache
 import uuid
 from datetime import date
 from fastapi import HTTPException
-from sqlalchemy import and_, text
+from sqlalchemy import Text, and_, cast, delete, func, insert, literal, select, tuple_
+from sqlalchemy.dialects.postgresql import TSQUERY
+import asyncio
 import logging
-from sentence_transformers import SentenceTransformer, CrossEncoder
+import threading
 import numpy as np
 
 # Configure logging
 logger = logging.getLogger(__name__)
 
+EMBEDDING_MODEL_NAME = 'all-MiniLM-L6-v2'
+
+_embedding_model = None
+_embedding_model_lock = threading.Lock()
+
+# Chunk embedding matrices of recently ranked users, keyed by user id
+_embedding_matrix_cache = TTLCache(maxsize=settings.EMBEDDING_CACHE_SIZE, ttl=settings.EMBEDDING_CACHE_TTL)
+
+
+def get_embedding_model():
+    """
+    Return the shared sentence transformer, loading it on first use.
+
+    sentence_transformers (and torch) are imported here rather than at module
+    import, which keeps app startup and test collection fast.
+    """
+    global _embedding_model
+    if _embedding_model is None:
+        with _embedding_model_lock:
+            if _embedding_model is None:
+                from sentence_transformers import SentenceTransformer
+                _embedding_model = SentenceTransformer(EMBEDDING_MODEL_NAME)
+    return _embedding_model
+
 
 async def create_experience(
-    db: Session,
+    db: AsyncSession,
     user_id: uuid.UUID,
     company_name: str,
     title: str,
@@ -22,10 +56,11 @@ async def create_experience(
     start_date: date,
     end_date: Optional[date],
     is_current: bool,
-    description: str
+    description: str,
+    model=None
 ):
     """
-    Create a new experience entry for a user.
+    Create a new experience entry for a user, with its skill tags and chunk embeddings.
     """
     # Create content for embedding (combine all fields for better semantic search)
     content_for_embedding = f"{company_name} {title} {location or ''} {description}"
@@ -44,54 +79,108 @@ async def create_experience(
     )
     
     db.add(experience)
-    db.commit()
-    db.refresh(experience)
+    await db.flush()
+    await tag_experience_skills(db, experience)
+    await write_experience_chunks(db, experience, model)
+    await db.commit()
+    await db.refresh(experience)
+    invalidate_embedding_cache(user_id)
     
     return experience
 
 
+# Columns that can be requested from the experience listing
+EXPERIENCE_LIST_FIELDS = (
+    "id",
+    "user_id",
+    "company_name",
+    "title",
+    "location",
+    "start_date",
+    "end_date",
+    "is_current",
+    "description",
+    "created_at",
+    "updated_at",
+)
+
+
 async def get_user_experiences(
-    db: Session,
-    user_id: uuid.UUID
-) -> List[Experience]:
+    db: AsyncSession,
+    user_id: uuid.UUID,
+    limit: int = 100,
+    cursor: Optional[str] = None,
+    fields: Optional[List[str]] = None
+) -> Tuple[List[Dict[str, Any]], Optional[str]]:
     """
-    Retrieve all experiences for a user.
+    Retrieve a page of experiences for a user, most recent first.
+
+    Pages are keyset paginated on (start_date, id) so each page is a single
+    index range scan. Only the requested fields are selected; the embedding
+    columns are never loaded.
+
+    Returns:
+        The page of experiences and the cursor for the next page (None on the last page)
     """
-    logger.info(f"Fetching experiences for user_id: {user_id}, type: {type(user_id)}")
+    logger.debug("Fetching experiences for user_id: %s", user_id)
     
     # Check if user_id is None and handle it
     if user_id is None:
         logger.error("User ID is None, cannot fetch experiences")
-        return []
-        
-    experiences = db.query(Experience).filter(Experience.user_id == user_id).all()
-    logger.info(f"Found {len(experiences)} experiences")
-    
-    # Use SQLAlchemy text() for raw SQL queries
-    try:
-        raw_query = text(f"SELECT * FROM experiences WHERE user_id = :user_id")
-        raw_experiences = db.execute(raw_query, {"user_id": str(user_id)}).fetchall()
-        logger.info(f"Raw SQL query found {len(raw_experiences)} experiences")
-    except Exception as e:
-        logger.error(f"Error executing raw SQL query: {str(e)}")
-    
-    return experiences
+        return [], None
+
+    output_fields = list(fields) if fields else list(EXPERIENCE_LIST_FIELDS)
+    unknown = [field for field in output_fields if field not in EXPERIENCE_LIST_FIELDS]
+    if unknown:
+        raise HTTPException(status_code=400, detail=f"Unknown fields: {', '.join(unknown)}")
+    if "id" not in output_fields:
+        output_fields.insert(0, "id")
+
+    # The sort key is always selected so the next cursor can be built
+    selected_fields = output_fields + [field for field in ("start_date",) if field not in output_fields]
+    query = (
+        select(*[getattr(Experience, field) for field in selected_fields])
+        .where(Experience.user_id == user_id)
+        .order_by(Experience.start_date.desc(), Experience.id.desc())
+        .limit(limit + 1)
+    )
+
+    if cursor:
+        start_date, experience_id = decode_cursor(cursor, 2)
+        try:
+            cursor_key = (date.fromisoformat(start_date), uuid.UUID(experience_id))
+        except ValueError:
+            raise HTTPException(status_code=400, detail="Invalid pagination cursor")
+        query = query.where(tuple_(Experience.start_date, Experience.id) < tuple_(*cursor_key))
+
+    rows = (await db.execute(query)).mappings().all()
+    logger.debug("Found %d experiences", len(rows))
+
+    next_cursor = None
+    if len(rows) > limit:
+        rows = rows[:limit]
+        next_cursor = encode_cursor(rows[-1]["start_date"].isoformat(), rows[-1]["id"])
+
+    return [{field: row[field] for field in output_fields} for row in rows], next_cursor
 
 
 async def get_experience(
-    db: Session,
+    db: AsyncSession,
     experience_id: uuid.UUID,
     user_id: uuid.UUID
 ) -> Experience:
     """
     Retrieve a specific experience for a user.
     """
-    experience = db.query(Experience).filter(
-        and_(
-            Experience.id == experience_id,
-            Experience.user_id == user_id
+    result = await db.execute(
+        select(Experience).where(
+            and_(
+                Experience.id == experience_id,
+                Experience.user_id == user_id
+            )
         )
-    ).first()
+    )
+    experience = result.scalars().first()
     
     if not experience:
         raise HTTPException(status_code=404, detail="Experience not found")
@@ -100,7 +189,7 @@ async def get_experience(
 
 
 async def update_experience(
-    db: Session,
+    db: AsyncSession,
     experience_id: uuid.UUID,
     user_id: uuid.UUID,
     company_name: Optional[str] = None,
@@ -109,7 +198,8 @@ async def update_experience(
     start_date: Optional[date] = None,
     end_date: Optional[date] = None,
     is_current: Optional[bool] = None,
-    description: Optional[str] = None
+    description: Optional[str] = None,
+    model=None
 ) -> Experience:
     """
     Update an existing experience entry for a user.
@@ -136,16 +226,19 @@ async def update_experience(
     # Update content for embedding if any field changed
     if any(x is not None for x in [company_name, title, location, description]):
         experience.content_for_embedding = f"{experience.company_name} {experience.title} {experience.location or ''} {experience.description}"
+        await tag_experience_skills(db, experience)
+        await write_experience_chunks(db, experience, model)
     
     # Commit changes
-    db.commit()
-    db.refresh(experience)
+    await db.commit()
+    await db.refresh(experience)
+    invalidate_embedding_cache(user_id)
     
     return experience
 
 
 async def delete_experience(
-    db: Session,
+    db: AsyncSession,
     experience_id: uuid.UUID,
     user_id: uuid.UUID
 ) -> bool:
@@ -156,71 +249,388 @@ async def delete_experience(
     experience = await get_experience(db, experience_id, user_id)
     
     # Delete the experience
-    db.delete(experience)
-    db.commit()
+    await db.delete(experience)
+    await db.commit()
+    invalidate_embedding_cache(user_id)
     
     return True
 
 
-async def get_top_experiences(db: Session, user_id: str, job_description: str, top_k: int = 2) -> List[Dict[str, Any]]:
+def experience_content(exp: Experience) -> str:
+    """Text embedded for an experience: content_for_embedding if available, otherwise the description."""
+    return exp.content_for_embedding if exp.content_for_embedding else exp.description
+
+
+def score_experiences(job_embedding, experience_embeddings, boosts=None) -> np.ndarray:
     """
-    Retrieve the top k experiences for a user based on semantic similarity to a job description.
+    Cosine similarity of each experience embedding to a job embedding.
     
     Args:
-        db: Database session
-        user_id: User ID
-        job_description: Job description to match against
-        top_k: Number of top experiences to return (default: 2)
+        job_embedding: Vector for the job description
+        experience_embeddings: One row per experience
+        boosts: Optional score added to each row's similarity, e.g. for matching skills
         
     Returns:
-        List of top experiences with similarity scores
+        One score per row
     """
-    # Get all experiences for the user
-    experiences = db.query(Experience).filter(Experience.user_id == user_id).all()
+    matrix = np.asarray(experience_embeddings, dtype=np.float32)
+    query = np.asarray(job_embedding, dtype=np.float32)
+    if len(matrix) == 0:
+        return np.zeros(0, dtype=np.float32)
     
-    if not experiences:
+    norms = np.linalg.norm(matrix, axis=1) * np.linalg.norm(query)
+    scores = (matrix @ query) / np.where(norms == 0, 1, norms)
+    if boosts is not None:
+        scores = scores + np.asarray(boosts, dtype=np.float32)
+    return scores
+
+
+def top_k_indices(scores, top_k: int) -> List[int]:
+    """Indices of the top k scores, highest first."""
+    scores = np.asarray(scores)
+    k = min(top_k, len(scores))
+    if k <= 0:
         return []
+    # Select the top k without sorting every score, then order just those
+    top = np.argpartition(-scores, k - 1)[:k]
+    top = top[np.argsort(-scores[top], kind="stable")]
+    return [int(index) for index in top]
+
+
+def reciprocal_rank_fusion(score_lists, k: int = 60) -> np.ndarray:
+    """
+    Fuse several scorings of the same rows with reciprocal rank fusion.
+    
+    Each scoring contributes 1 / (k + rank) per row, with rank starting at 1.
+    Rows scoring zero or less in a scoring get nothing from it, so a lexical
+    scoring only rewards rows that actually share terms with the query.
+    
+    Args:
+        score_lists: Sequences of scores, one per scoring, all the same length
+        k: Damping constant; larger values flatten the difference between ranks
+        
+    Returns:
+        The fused score per row
+    """
+    fused = None
+    for scores in score_lists:
+        scores = np.asarray(scores, dtype=np.float64)
+        if fused is None:
+            fused = np.zeros(len(scores))
+        order = np.argsort(-scores, kind="stable")
+        ranks = np.empty(len(scores))
+        ranks[order] = np.arange(1, len(scores) + 1)
+        fused += np.where(scores > 0, 1.0 / (k + ranks), 0.0)
+    return fused if fused is not None else np.zeros(0)
+
+
+def experience_chunk_texts(exp: Experience) -> List[str]:
+    """
+    Texts embedded for an experience: its description in chunks, each prefixed with the role.
+    
+    Chunks keep every part of a long description within the embedding model's
+    input limit, and the prefix keeps each chunk meaningful on its own.
+    """
+    header = " ".join(part for part in (exp.company_name, exp.title, exp.location) if part)
+    chunks = chunk_text(exp.description or "", settings.EMBEDDING_CHUNK_WORDS)
+    if not chunks:
+        return [experience_content(exp)]
+    return [f"{header} {chunk}" for chunk in chunks]
+
+
+async def write_experience_chunks(db: AsyncSession, experience: Experience, model=None) -> int:
+    """
+    Replace an experience's stored chunks and their embeddings, encoded in one batch.
+    
+    The caller commits; the experience must already have been flushed.
+    
+    Returns:
+        The number of chunks written
+    """
+    if model is None:
+        model = get_embedding_model()
+    texts = experience_chunk_texts(experience)
+    with track_stage("embedding_encode"):
+        embeddings = await asyncio.to_thread(model.encode, texts)
+    
+    await db.execute(delete(ExperienceChunk).where(ExperienceChunk.experience_id == experience.id))
+    await db.execute(insert(ExperienceChunk), [
+        {
+            "experience_id": experience.id,
+            "chunk_index": index,
+            "content": text,
+            "embedding": embedding
+        }
+        for index, (text, embedding) in enumerate(zip(texts, embeddings))
+    ])
+    return len(texts)
+
+
+def aggregate_chunk_scores(chunk_scores, owners, count: int, method: str = "max") -> np.ndarray:
+    """
+    Combine chunk scores into one score per experience.
     
-    # Initialize the sentence transformer model
-    model = SentenceTransformer('all-MiniLM-L6-v2')
+    Args:
+        chunk_scores: Score of each chunk
+        owners: Index of the experience each chunk belongs to
+        count: Number of experiences
+        method: "max" rewards the single best-matching part of an experience,
+            "mean" rewards experiences that match throughout
+        
+    Returns:
+        One score per experience; experiences without chunks score 0
+    """
+    chunk_scores = np.asarray(chunk_scores, dtype=np.float32)
+    owners = np.asarray(owners, dtype=np.intp)
+    if method == "mean":
+        totals = np.zeros(count, dtype=np.float32)
+        np.add.at(totals, owners, chunk_scores)
+        return totals / np.maximum(np.bincount(owners, minlength=count), 1)
     
-    # Generate embeddings for the job description
-    job_embedding = model.encode(job_description)
+    scores = np.full(count, -np.inf, dtype=np.float32)
+    np.maximum.at(scores, owners, chunk_scores)
+    return np.where(np.isneginf(scores), 0, scores).astype(np.float32)
+
+
+def experience_set_version(experiences: List[Experience]) -> frozenset:
+    """
+    Identity of a set of experiences: adding, removing or editing any of them changes it.
     
-    # Calculate similarity scores for each experience
-    experience_scores = []
-    for exp in experiences:
-        # Use the content_for_embedding field if available, otherwise use description
-        content = exp.content_for_embedding if exp.content_for_embedding else exp.description
+    Every content edit moves the experience's updated_at, so this also catches
+    writes made by other processes.
+    """
+    return frozenset((exp.id, exp.updated_at) for exp in experiences)
+
+
+async def get_chunk_embedding_matrix(
+    db: AsyncSession,
+    user_id,
+    experiences: List[Experience],
+    model
+) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Chunk embeddings of a user's experiences as one contiguous matrix.
+    
+    The matrix is kept per user in EMBEDDING_CACHE_DTYPE, with the ID of each
+    row's experience in a parallel array, and reused while the user's experiences
+    are unchanged, so repeated ranking needs neither the chunk query nor encoding
+    of legacy experiences.
+    
+    Args:
+        db: Database session
+        user_id: User ID
+        experiences: All of the user's experiences
+        model: Sentence transformer for experiences without stored chunks
         
-        # Generate embedding for the experience
-        exp_embedding = model.encode(content)
+    Returns:
+        The matrix and, per row, the index in experiences of the experience it belongs to
+    """
+    index_by_id = {exp.id: index for index, exp in enumerate(experiences)}
+    version = experience_set_version(experiences)
+    cache_key = str(user_id)
+    entry = _embedding_matrix_cache.get(cache_key)
+    if entry is not None and entry["version"] == version:
+        owners = np.fromiter((index_by_id[experience_id] for experience_id in entry["ids"]), dtype=np.intp, count=len(entry["ids"]))
+        return entry["matrix"], owners[entry["owners"]]
+    
+    # Load the stored chunk embeddings of all the user's experiences in one query
+    result = await db.execute(
+        select(ExperienceChunk.experience_id, ExperienceChunk.embedding)
+        .join(Experience, Experience.id == ExperienceChunk.experience_id)
+        .where(Experience.user_id == user_id)
+        .order_by(ExperienceChunk.experience_id, ExperienceChunk.chunk_index)
+    )
+    chunk_owners, chunk_embeddings = [], []
+    for experience_id, embedding in result.all():
+        # Chunks of an experience added since the experiences were loaded are skipped
+        if experience_id in index_by_id:
+            chunk_owners.append(index_by_id[experience_id])
+            chunk_embeddings.append(embedding)
+    
+    # Experiences saved before chunking was introduced are chunked on the fly, in one batch
+    chunked = set(chunk_owners)
+    legacy_owners, legacy_texts = [], []
+    for index, exp in enumerate(experiences):
+        if index not in chunked:
+            texts = experience_chunk_texts(exp)
+            legacy_owners.extend([index] * len(texts))
+            legacy_texts.extend(texts)
+    if legacy_texts:
+        with track_stage("embedding_encode"):
+            chunk_owners.extend(legacy_owners)
+            chunk_embeddings.extend(await asyncio.to_thread(model.encode, legacy_texts))
+    
+    matrix = np.ascontiguousarray(np.stack(chunk_embeddings), dtype=np.dtype(settings.EMBEDDING_CACHE_DTYPE))
+    owners = np.asarray(chunk_owners, dtype=np.intp)
+    _embedding_matrix_cache.set(cache_key, {
+        "version": version,
+        "ids": [exp.id for exp in experiences],
+        "owners": owners,
+        "matrix": matrix
+    })
+    return matrix, owners
+
+
+def invalidate_embedding_cache(user_id) -> None:
+    """Drop a user's cached chunk embeddings after their experiences change."""
+    _embedding_matrix_cache.pop(str(user_id))
+
+
+def clear_embedding_cache() -> None:
+    """Drop all cached chunk embeddings."""
+    _embedding_matrix_cache.clear()
+
+
+def rank_experience_chunks(
+    job_embedding,
+    chunk_matrix,
+    chunk_owners,
+    count: int,
+    top_k: int,
+    boosts=None,
+    text_ranks=None,
+    aggregation: str = "max",
+    rrf_k: int = 60
+) -> Tuple[List[int], np.ndarray, np.ndarray]:
+    """
+    Rank experiences from their chunk embeddings, the scoring half of get_top_experiences.
+    
+    Args:
+        job_embedding: Vector for the job description
+        chunk_matrix: One embedding row per chunk
+        chunk_owners: Index of the experience each chunk belongs to
+        count: Number of experiences
+        top_k: Number of experiences to return
+        boosts: Optional score added to each experience's similarity, e.g. for matching skills
+        text_ranks: Optional full-text rank per experience, fused in by reciprocal rank fusion
+        aggregation: How chunk scores combine per experience, see aggregate_chunk_scores
+        rrf_k: Reciprocal rank fusion constant
         
-        # Calculate cosine similarity
-        similarity = np.dot(job_embedding, exp_embedding) / (np.linalg.norm(job_embedding) * np.linalg.norm(exp_embedding))
+    Returns:
+        The top k experience indices, best first, with every experience's similarity
+        and fused scores
+    """
+    chunk_scores = score_experiences(job_embedding, chunk_matrix)
+    similarity_scores = aggregate_chunk_scores(chunk_scores, chunk_owners, count, aggregation)
+    if boosts is not None:
+        similarity_scores = similarity_scores + np.asarray(boosts, dtype=np.float32)
+    if text_ranks is not None:
+        fused_scores = reciprocal_rank_fusion([similarity_scores, text_ranks], rrf_k)
+    else:
+        fused_scores = similarity_scores
+    return top_k_indices(fused_scores, top_k), similarity_scores, fused_scores
+
+
+def job_text_search_query(job_description: str):
+    """
+    Full-text query matching any of the job description's terms.
+    
+    plainto_tsquery ANDs every term, which a long job description never fully
+    matches, so its operators are swapped for OR and ts_rank_cd does the weighting.
+    """
+    return cast(
+        func.replace(cast(func.plainto_tsquery(text_search_config(), job_description), Text), "&", "|"),
+        TSQUERY
+    )
+
+
+async def get_top_experiences(
+    db: AsyncSession,
+    user_id: str,
+    job_description: str,
+    top_k: int = 2,
+    model=None
+) -> List[Dict[str, Any]]:
+    """
+    Retrieve the top k experiences for a user that best match a job description.
+    
+    Each experience's semantic similarity is aggregated from its chunk scores
+    (CHUNK_SCORE_AGGREGATION) and boosted by skill overlap, then fused with its
+    full-text rank by reciprocal rank fusion, so exact keyword matches such as specific
+    frameworks or certifications are not lost to the embedding. The text rank is
+    computed by the same query that loads the experiences.
+    
+    Args:
+        db: Database session
+        user_id: User ID
+        job_description: Job description to match against
+        top_k: Number of top experiences to return (default: 2)
+        model: Sentence transformer to use (default: the shared model)
         
-        experience_scores.append({
-            "experience": exp,
-            "similarity_score": float(similarity)
-        })
-    
-    # Sort experiences by similarity score (descending)
-    experience_scores.sort(key=lambda x: x["similarity_score"], reverse=True)
-    
-    # Return the top k experiences
-    top_experiences = []
-    for i, exp_score in enumerate(experience_scores[:top_k]):
-        exp = exp_score["experience"]
-        top_experiences.append({
-            "id": str(exp.id),
-            "company_name": exp.company_name,
-            "title": exp.title,
-            "location": exp.location,
-            "start_date": exp.start_date,
-            "end_date": exp.end_date,
-            "is_current": exp.is_current,
-            "description": exp.description,
-            "similarity_score": exp_score["similarity_score"]
-        })
-    
-    return top_experiences
+    Returns:
+        List of top experiences with similarity, text rank and fused scores
+    """
+    with tracer.start_as_current_span("get_top_experiences") as span:
+        span.set_attribute("experience.top_k", top_k)
+        # Match against the requirement sections only, without boilerplate or markup
+        job_description = job_requirements(job_description)
+        # Get all experiences for the user, each with its full-text rank against the job description
+        if settings.HYBRID_RETRIEVAL_ENABLED:
+            text_rank = func.ts_rank_cd(experience_search_vector(), job_text_search_query(job_description))
+        else:
+            text_rank = literal(0.0)
+        result = await db.execute(
+            select(Experience, text_rank.label("text_rank")).where(Experience.user_id == user_id)
+        )
+        rows = result.all()
+        experiences = [row.Experience for row in rows]
+        text_ranks = [row.text_rank or 0.0 for row in rows]
+        span.set_attribute("experience.count", len(experiences))
+    
+        if not experiences:
+            return []
+    
+        # Use the shared sentence transformer model unless one was injected
+        if model is None:
+            model = get_embedding_model()
+    
+        chunk_matrix, chunk_owners = await get_chunk_embedding_matrix(db, user_id, experiences, model)
+        span.set_attribute("experience.chunk_count", len(chunk_owners))
+    
+        # Encoding is CPU-bound, so it runs in a worker thread to keep the event loop free
+        with track_stage("embedding_encode"):
+            job_embedding = await asyncio.to_thread(model.encode, job_description)
+    
+        # Experiences tagged with skills the job asks for get a boost proportional to the overlap
+        job_skill_ids = await extract_skill_ids(db, job_description)
+        overlap = await get_experience_skill_overlap(db, user_id, job_skill_ids)
+        span.set_attribute("experience.job_skill_count", len(job_skill_ids))
+        boosts = None
+        if overlap:
+            boosts = [
+                settings.SKILL_MATCH_BOOST * overlap.get(exp.id, 0) / len(job_skill_ids)
+                for exp in experiences
+            ]
+    
+        with track_stage("similarity_scoring"):
+            ranked, similarity_scores, fused_scores = rank_experience_chunks(
+                job_embedding,
+                chunk_matrix,
+                chunk_owners,
+                len(experiences),
+                top_k,
+                boosts=boosts,
+                text_ranks=text_ranks if settings.HYBRID_RETRIEVAL_ENABLED else None,
+                aggregation=settings.CHUNK_SCORE_AGGREGATION,
+                rrf_k=settings.HYBRID_RRF_K
+            )
+    
+        # Return the top k experiences
+        top_experiences = []
+        for index in ranked:
+            exp = experiences[index]
+            top_experiences.append({
+                "id": str(exp.id),
+                "company_name": exp.company_name,
+                "title": exp.title,
+                "location": exp.location,
+                "start_date": exp.start_date,
+                "end_date": exp.end_date,
+                "is_current": exp.is_current,
+                "description": exp.description,
+                "similarity_score": float(similarity_scores[index]),
+                "text_rank": float(text_ranks[index]),
+                "relevance_score": float(fused_scores[index])
+            })
+    
+        return top_experiences
@@ -0,0 +1,314 @@
+from typing import List, Optional, Dict, Any
+import asyncio
+import re
+import uuid
+from fastapi import HTTPException
+from sqlalchemy import insert, select
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import selectinload
+from models.application import JobApplication, JobApplicationExperience, JobApplicationSkill
+from services.experience_service import get_embedding_model
+from services.skill_service import extract_ranked_skill_ids
+from services.job_description_service import clean_job_description
+from config.settings import settings
+from utils.metrics import track_stage
+from utils.simhash import hamming_distance, simhash, simhash_similarity
+from utils.tracing import tracer
+import logging
+
+# Configure logging
+logger = logging.getLogger(__name__)
+
+
+# Legal suffixes ignored when comparing company names
+_COMPANY_SUFFIXES = {"inc", "incorporated", "llc", "ltd", "limited", "corp", "corporation", "co", "company", "gmbh", "plc"}
+
+
+def normalize_company_name(company_name: str) -> str:
+    """Company name reduced for comparison: lowercase, no punctuation or legal suffix."""
+    words = re.sub(r"[^\w\s]", " ", company_name.lower()).split()
+    while len(words) > 1 and words[-1] in _COMPANY_SUFFIXES:
+        words.pop()
+    return " ".join(words)
+
+
+def job_application_content(job_title: str, job_description: str) -> str:
+    """Text embedded and fingerprinted for a job application: the title and cleaned description."""
+    return f"{job_title} {clean_job_description(job_description)}".strip()
+
+
+def embed_job_application(job_title: str, job_description: str, model=None) -> List[float]:
+    """
+    Embed a job posting with the shared sentence transformer.
+
+    Encoding is CPU-bound; async callers run this in a worker thread.
+
+    Args:
+        job_title: The title of the job
+        job_description: The full job description
+        model: Sentence transformer to use (default: the shared model)
+
+    Returns:
+        The embedding as a list of floats, ready for the pgvector column
+    """
+    if model is None:
+        model = get_embedding_model()
+    with track_stage("embedding_encode"):
+        return [float(value) for value in model.encode(job_application_content(job_title, job_description))]
+
+
+async def add_job_application(
+    db: AsyncSession,
+    user_id: uuid.UUID,
+    company_name: str,
+    job_title: str,
+    job_description: str,
+    cover_letter: Optional[str] = None,
+    status: str = "draft",
+    selected_experiences: Optional[List[Dict[str, Any]]] = None,
+    embedding: Optional[List[float]] = None,
+    model=None
+) -> JobApplication:
+    """
+    Add a job application, with its embedding, skills and selected experiences, to the session.
+
+    The caller commits, so the application can be saved in the same transaction
+    as the cover letter it was generated with.
+
+    Args:
+        db: Database session
+        user_id: User ID
+        company_name: The name of the company
+        job_title: The title of the job
+        job_description: The full job description
+        cover_letter: The cover letter sent with the application
+        status: Application status
+        selected_experiences: Dicts with experience_id, relevance_order and similarity_score
+        embedding: Precomputed embedding (default: computed here)
+        model: Sentence transformer to use when computing the embedding
+
+    Returns:
+        The flushed job application
+    """
+    if embedding is None:
+        embedding = await asyncio.to_thread(embed_job_application, job_title, job_description, model)
+
+    application = JobApplication(
+        id=uuid.uuid4(),
+        user_id=user_id,
+        company_name=company_name,
+        job_title=job_title,
+        job_description=job_description,
+        content_for_embedding=job_application_content(job_title, job_description),
+        embedding=embedding,
+        simhash=simhash(job_application_content(job_title, job_description)),
+        cover_letter=cover_letter,
+        status=status
+    )
+    db.add(application)
+    # Flush the parent row so the links can reference it within the same transaction
+    await db.flush()
+
+    if selected_experiences:
+        await db.execute(insert(JobApplicationExperience), [
+            {
+                "job_application_id": application.id,
+                "experience_id": exp["experience_id"],
+                "relevance_order": exp["relevance_order"],
+                "similarity_score": exp.get("similarity_score")
+            }
+            for exp in selected_experiences
+        ])
+
+    # Skills the posting mentions most often come first
+    skill_ids = await extract_ranked_skill_ids(db, application.content_for_embedding)
+    if skill_ids:
+        await db.execute(insert(JobApplicationSkill), [
+            {"job_application_id": application.id, "skill_id": skill_id, "relevance_order": order}
+            for order, skill_id in enumerate(skill_ids, start=1)
+        ])
+
+    return application
+
+
+async def create_job_application(
+    db: AsyncSession,
+    user_id: uuid.UUID,
+    company_name: str,
+    job_title: str,
+    job_description: str,
+    cover_letter: Optional[str] = None,
+    status: str = "draft",
+    model=None
+) -> JobApplication:
+    """
+    Create and commit a job application for a user.
+    """
+    application = await add_job_application(
+        db,
+        user_id=user_id,
+        company_name=company_name,
+        job_title=job_title,
+        job_description=job_description,
+        cover_letter=cover_letter,
+        status=status,
+        model=model
+    )
+    await db.commit()
+    await db.refresh(application, attribute_names=["created_at", "updated_at"])
+    return application
+
+
+async def get_job_application(
+    db: AsyncSession,
+    job_application_id: uuid.UUID,
+    user_id: uuid.UUID
+) -> JobApplication:
+    """
+    Retrieve a specific job application for a user.
+    """
+    result = await db.execute(
+        select(JobApplication).where(
+            JobApplication.id == job_application_id,
+            JobApplication.user_id == user_id
+        )
+    )
+    application = result.scalars().first()
+
+    if not application:
+        raise HTTPException(status_code=404, detail="Job application not found")
+
+    return application
+
+
+async def find_similar_job_applications(
+    db: AsyncSession,
+    user_id: uuid.UUID,
+    embedding: List[float],
+    limit: int = 5,
+    min_similarity: Optional[float] = None,
+    exclude_id: Optional[uuid.UUID] = None
+) -> List[Dict[str, Any]]:
+    """
+    Find the user's past applications nearest to an embedding by cosine distance.
+
+    Args:
+        db: Database session
+        user_id: User ID
+        embedding: Embedding of the posting to compare against
+        limit: Maximum number of applications to return
+        min_similarity: Drop applications less similar than this
+        exclude_id: Application to leave out, e.g. the one being compared
+
+    Returns:
+        Applications with their similarity and selected experience IDs, most similar first
+    """
+    with tracer.start_as_current_span("find_similar_job_applications") as span:
+        # Exact search over the user's rows, found through the user_id index; a user's
+        # history is small enough that scanning it beats an approximate index
+        distance = JobApplication.embedding.cosine_distance(embedding)
+        query = (
+            select(JobApplication, distance.label("distance"))
+            .where(JobApplication.user_id == user_id, JobApplication.embedding.is_not(None))
+            .options(selectinload(JobApplication.selected_experiences))
+            .order_by(distance)
+            .limit(limit)
+        )
+        if exclude_id is not None:
+            query = query.where(JobApplication.id != exclude_id)
+        if min_similarity is not None:
+            query = query.where(distance <= 1 - min_similarity)
+
+        with track_stage("similar_job_search"):
+            rows = (await db.execute(query)).all()
+        span.set_attribute("job_application.match_count", len(rows))
+
+        return [
+            {
+                "id": application.id,
+                "user_id": application.user_id,
+                "company_name": application.company_name,
+                "job_title": application.job_title,
+                "job_description": application.job_description,
+                "cover_letter": application.cover_letter,
+                "status": application.status,
+                "created_at": application.created_at,
+                "updated_at": application.updated_at,
+                "similarity": 1 - float(distance_value),
+                "experience_ids": [
+                    link.experience_id
+                    for link in sorted(application.selected_experiences, key=lambda link: link.relevance_order)
+                ]
+            }
+            for application, distance_value in rows
+        ]
+
+
+async def find_near_duplicate_application(
+    db: AsyncSession,
+    user_id: uuid.UUID,
+    job_title: str,
+    job_description: str,
+    max_distance: Optional[int] = None
+) -> Optional[Dict[str, Any]]:
+    """
+    Find the user's closest earlier application for a nearly identical posting.
+
+    SimHash signatures of the user's most recent applications are compared in
+    process; only applications with a saved cover letter are considered.
+
+    Args:
+        db: Database session
+        user_id: User ID
+        job_title: The title of the new job
+        job_description: The new job description
+        max_distance: Most signature bits allowed to differ (default: NEAR_DUPLICATE_MAX_DISTANCE)
+
+    Returns:
+        The matching application's id, company_name, cover_letter, job_description,
+        similarity and experience_ids, or None if there is no near duplicate
+    """
+    if max_distance is None:
+        max_distance = settings.NEAR_DUPLICATE_MAX_DISTANCE
+    signature = simhash(job_application_content(job_title, job_description))
+
+    with track_stage("near_duplicate_search"):
+        result = await db.execute(
+            select(JobApplication.id, JobApplication.simhash)
+            .where(
+                JobApplication.user_id == user_id,
+                JobApplication.simhash.is_not(None),
+                JobApplication.cover_letter.is_not(None)
+            )
+            .order_by(JobApplication.created_at.desc())
+            .limit(settings.NEAR_DUPLICATE_CANDIDATES)
+        )
+        best_id, best_distance = None, max_distance + 1
+        for application_id, candidate in result.all():
+            distance = hamming_distance(signature, candidate)
+            # Ties go to the most recent application
+            if distance < best_distance:
+                best_id, best_distance = application_id, distance
+
+    if best_id is None:
+        return None
+
+    result = await db.execute(
+        select(JobApplication)
+        .where(JobApplication.id == best_id)
+        .options(selectinload(JobApplication.selected_experiences))
+    )
+    application = result.scalars().one()
+    return {
+        "id": application.id,
+        "company_name": application.company_name,
+        "job_title": application.job_title,
+        "job_description": application.job_description,
+        "cover_letter": application.cover_letter,
+        "created_at": application.created_at,
+        "similarity": simhash_similarity(signature, application.simhash),
+        "experience_ids": [
+            link.experience_id
+            for link in sorted(application.selected_experiences, key=lambda link: link.relevance_order)
+        ]
+    }
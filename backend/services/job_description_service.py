@@ -0,0 +1,196 @@
+from typing import Dict, Any, List, Optional, Tuple
+import hashlib
+import html
+import re
+from config.settings import settings
+from utils.cache import TTLCache
+from utils.metrics import track_stage
+
+# Preprocessed job descriptions keyed by content hash; the same posting is used for
+# ranking, the prompt and the job application record, often across several requests
+_preprocessed_cache = TTLCache(
+    maxsize=settings.JOB_DESCRIPTION_CACHE_SIZE,
+    ttl=settings.JOB_DESCRIPTION_CACHE_TTL
+)
+
+_BLOCK_TAG = re.compile(r"<\s*(br|/p|/div|/tr|/ul|/ol)\b[^>]*>", re.IGNORECASE)
+_HEADING_END_TAG = re.compile(r"<\s*/h[1-6]\s*>", re.IGNORECASE)
+_LIST_ITEM_TAG = re.compile(r"<\s*li\b[^>]*>", re.IGNORECASE)
+_SCRIPT_STYLE = re.compile(r"<\s*(script|style)\b.*?<\s*/\s*\1\s*>", re.IGNORECASE | re.DOTALL)
+_TAG = re.compile(r"<[^>]+>")
+_MARKDOWN_EMPHASIS = re.compile(r"(\*\*|__|`)")
+_BULLET = re.compile(r"^\s*(?:[-*•·▪◦●]|\d+[.)])\s+")
+_SPACES = re.compile(r"[ \t\u00a0]+")
+
+# Section headings, matched against a whole short line with any trailing colon removed
+_REQUIREMENT_HEADINGS = re.compile(
+    r"^(requirements?|qualifications?|(minimum|basic|preferred|required) qualifications?|"
+    r"what you('ll| will)? (bring|need|have)|who you are|about you|you have|must[- ]haves?|"
+    r"nice[- ]to[- ]haves?|skills( and experience)?|experience|(key |your )?responsibilities|"
+    r"what you('ll| will) do|the role|role overview|your impact|in this role)$",
+    re.IGNORECASE
+)
+_BOILERPLATE_HEADINGS = re.compile(
+    r"^(benefits|perks( and benefits)?|what we offer|we offer|compensation( and benefits)?|"
+    r"(equal (employment )?opportunity|eeo)( statement| employer)?|diversity( and inclusion)?( statement)?|"
+    r"accommodations?|privacy( notice| policy)?|how to apply|application process|legal)$",
+    re.IGNORECASE
+)
+# Paragraphs dropped wherever they appear
+_BOILERPLATE_PARAGRAPH = re.compile(
+    r"equal (employment )?opportunity|without regard to (race|age|sex)|reasonable accommodation|"
+    r"e-?verify|affirmative action|protected veteran|applicant privacy|privacy notice|"
+    r"recruit(ing|ment) agencies|unsolicited resumes?",
+    re.IGNORECASE
+)
+
+
+def content_hash(text: str) -> str:
+    """Cache key for a job description."""
+    return hashlib.sha256(text.encode()).hexdigest()
+
+
+def strip_markup(text: str) -> str:
+    """Convert HTML and markdown remnants to plain text, keeping line and list structure."""
+    text = _SCRIPT_STYLE.sub(" ", text)
+    text = _LIST_ITEM_TAG.sub("\n- ", text)
+    # HTML headings become "Heading:" lines so they are recognized as sections
+    text = _HEADING_END_TAG.sub(":\n", text)
+    text = _BLOCK_TAG.sub("\n", text)
+    text = _TAG.sub(" ", text)
+    text = html.unescape(text)
+    return _MARKDOWN_EMPHASIS.sub("", text)
+
+
+def _normalize_lines(text: str) -> List[str]:
+    """Trim lines, collapse whitespace, unify bullets and keep single blank lines between blocks."""
+    lines = []
+    for raw_line in text.replace("\r\n", "\n").replace("\r", "\n").split("\n"):
+        line = _SPACES.sub(" ", raw_line).strip()
+        if _BULLET.match(line):
+            line = "- " + _BULLET.sub("", line)
+        if line or (lines and lines[-1]):
+            lines.append(line)
+    while lines and not lines[-1]:
+        lines.pop()
+    return lines
+
+
+def _heading(line: str, previous: str = "", following: str = "") -> Optional[str]:
+    """
+    The line as a heading, or None if it reads like content.
+
+    Known section names are headings with or without a colon. Any other short colon
+    line is a heading only when it opens a block: after a blank line and followed by
+    a list. Otherwise it is a lead-in such as "You will work with the following tools:"
+    and its list stays in the enclosing section.
+    """
+    candidate = line.rstrip(":").strip().lstrip("#").strip()
+    if not candidate or line.startswith("- ") or len(candidate.split()) > 8:
+        return None
+    if _REQUIREMENT_HEADINGS.match(candidate) or _BOILERPLATE_HEADINGS.match(candidate):
+        return candidate
+    if line.endswith(":") and not previous and following.startswith("- "):
+        return candidate
+    return None
+
+
+def _split_sections(lines: List[str]) -> List[Tuple[Optional[str], List[str]]]:
+    """Group lines under the heading that precedes them; text before any heading has no heading."""
+    sections = [(None, [])]
+    for index, line in enumerate(lines):
+        previous = lines[index - 1] if index > 0 else ""
+        following = lines[index + 1] if index + 1 < len(lines) else ""
+        heading = _heading(line, previous, following)
+        if heading is not None:
+            sections.append((heading, []))
+        else:
+            sections[-1][1].append(line)
+    return [(heading, body) for heading, body in sections if heading or any(body)]
+
+
+def _drop_boilerplate_paragraphs(lines: List[str]) -> List[str]:
+    kept, paragraph = [], []
+    for line in lines + [""]:
+        if line:
+            paragraph.append(line)
+            continue
+        if paragraph and not _BOILERPLATE_PARAGRAPH.search(" ".join(paragraph)):
+            kept.extend(paragraph + [""])
+        paragraph = []
+    while kept and not kept[-1]:
+        kept.pop()
+    return kept
+
+
+def _render(sections: List[Tuple[Optional[str], List[str]]]) -> str:
+    blocks = []
+    for heading, body in sections:
+        text = "\n".join(body).strip()
+        if heading and text:
+            blocks.append(f"{heading}:\n{text}")
+        elif text:
+            blocks.append(text)
+    return "\n\n".join(blocks)
+
+
+def _preprocess(job_description: str) -> Dict[str, Any]:
+    lines = _normalize_lines(strip_markup(job_description))
+    sections = []
+    for heading, body in _split_sections(lines):
+        if heading and _BOILERPLATE_HEADINGS.match(heading):
+            continue
+        body = _drop_boilerplate_paragraphs(body)
+        if body:
+            sections.append((heading, body))
+
+    cleaned = _render(sections)
+    # Once a posting has requirement sections, matching uses every headed section left
+    # after the boilerplate; only the untitled preamble (usually about the company) goes.
+    # Postings without recognizable sections are used whole.
+    if any(heading and _REQUIREMENT_HEADINGS.match(heading) for heading, _ in sections):
+        requirements = _render([(heading, body) for heading, body in sections if heading])
+    else:
+        requirements = cleaned
+
+    return {
+        "cleaned": cleaned or job_description.strip(),
+        "requirements": requirements or cleaned or job_description.strip(),
+        "original_length": len(job_description),
+        "cleaned_length": len(cleaned)
+    }
+
+
+def preprocess_job_description(job_description: str) -> Dict[str, Any]:
+    """
+    Normalize a job description and strip boilerplate, served from the cache when possible.
+
+    HTML and markdown remnants are converted to plain text, benefits/EEO/privacy
+    sections and paragraphs are removed, and requirement and responsibility
+    sections are extracted for matching.
+
+    Args:
+        job_description: The job description as pasted by the user
+
+    Returns:
+        A dictionary with the cleaned description (for prompts), the requirements
+        (for embeddings and skill matching) and the original and cleaned lengths.
+        Callers must not modify it; it is shared through the cache.
+    """
+    key = content_hash(job_description)
+    processed = _preprocessed_cache.get(key)
+    if processed is None:
+        with track_stage("job_description_preprocess"):
+            processed = _preprocess(job_description)
+        _preprocessed_cache.set(key, processed)
+    return processed
+
+
+def clean_job_description(job_description: str) -> str:
+    """The cleaned form of a job description, for prompts and stored content."""
+    return preprocess_job_description(job_description)["cleaned"]
+
+
+def job_requirements(job_description: str) -> str:
+    """The requirement sections of a job description, for embeddings and skill matching."""
+    return preprocess_job_description(job_description)["requirements"]
@@ -0,0 +1,117 @@
+from typing import Dict, List, Optional, Set
+import asyncio
+import time
+import uuid
+from sqlalchemy import delete, func, select
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.ext.asyncio import AsyncSession
+from models.experience import Experience, ExperienceSkill
+from models.skills import Skill
+from config.settings import settings
+from utils.skill_matcher import SkillMatcher
+from utils.metrics import track_stage
+import logging
+
+# Configure logging
+logger = logging.getLogger(__name__)
+
+# Matcher over the skills table, built once and rebuilt when the vocabulary TTL passes
+_skill_matcher: Optional[SkillMatcher] = None
+_skill_matcher_loaded_at = 0.0
+_skill_matcher_lock = asyncio.Lock()
+
+
+async def get_skill_matcher(db: AsyncSession) -> SkillMatcher:
+    """
+    Return the shared skill matcher, loading the vocabulary from the skills table on first use.
+    """
+    global _skill_matcher, _skill_matcher_loaded_at
+    if _skill_matcher is not None and time.monotonic() - _skill_matcher_loaded_at < settings.SKILL_VOCABULARY_TTL:
+        return _skill_matcher
+
+    async with _skill_matcher_lock:
+        if _skill_matcher is None or time.monotonic() - _skill_matcher_loaded_at >= settings.SKILL_VOCABULARY_TTL:
+            result = await db.execute(select(Skill.name, Skill.id))
+            vocabulary = {name: skill_id for name, skill_id in result.all()}
+            _skill_matcher = SkillMatcher(vocabulary)
+            _skill_matcher_loaded_at = time.monotonic()
+            logger.info("Loaded skill vocabulary with %d skills", len(_skill_matcher))
+    return _skill_matcher
+
+
+def reset_skill_matcher() -> None:
+    """Force the vocabulary to be reloaded, e.g. after skills are added."""
+    global _skill_matcher
+    _skill_matcher = None
+
+
+async def extract_skill_ids(db: AsyncSession, text: str) -> Set[uuid.UUID]:
+    """
+    Find the IDs of all vocabulary skills mentioned in a text.
+    """
+    matcher = await get_skill_matcher(db)
+    with track_stage("skill_extraction"):
+        return matcher.find(text)
+
+
+async def extract_ranked_skill_ids(db: AsyncSession, text: str) -> List[uuid.UUID]:
+    """
+    Find the IDs of all vocabulary skills mentioned in a text, most frequently
+    mentioned first, then by first mention.
+    """
+    matcher = await get_skill_matcher(db)
+    with track_stage("skill_extraction"):
+        return matcher.find_ranked(text)
+
+
+async def tag_experience_skills(db: AsyncSession, experience: Experience) -> Set[uuid.UUID]:
+    """
+    Replace an experience's ExperienceSkill rows with the skills found in its content.
+
+    The caller commits; the experience must already have been flushed.
+
+    Returns:
+        The IDs of the tagged skills
+    """
+    skill_ids = await extract_skill_ids(db, experience.content_for_embedding)
+
+    # Drop tags the content no longer mentions, then add the new ones
+    stale = delete(ExperienceSkill).where(ExperienceSkill.experience_id == experience.id)
+    if skill_ids:
+        stale = stale.where(ExperienceSkill.skill_id.not_in(skill_ids))
+    await db.execute(stale)
+    if skill_ids:
+        await db.execute(
+            pg_insert(ExperienceSkill)
+            .values([{"experience_id": experience.id, "skill_id": skill_id} for skill_id in skill_ids])
+            .on_conflict_do_nothing(index_elements=[ExperienceSkill.experience_id, ExperienceSkill.skill_id])
+        )
+    return skill_ids
+
+
+async def get_experience_skill_overlap(
+    db: AsyncSession,
+    user_id: uuid.UUID,
+    skill_ids: Set[uuid.UUID]
+) -> Dict[uuid.UUID, int]:
+    """
+    Count how many of the given skills each of a user's experiences is tagged with.
+
+    Args:
+        db: Database session
+        user_id: User ID
+        skill_ids: Skills to look for, e.g. those extracted from a job description
+
+    Returns:
+        Matching skill count per experience ID; experiences without a match are omitted
+    """
+    if not skill_ids:
+        return {}
+    result = await db.execute(
+        select(ExperienceSkill.experience_id, func.count())
+        .join(Experience, Experience.id == ExperienceSkill.experience_id)
+        .where(Experience.user_id == user_id, ExperienceSkill.skill_id.in_(skill_ids))
+        .group_by(ExperienceSkill.experience_id)
+    )
+    return {experience_id: count for experience_id, count in result.all()}
+
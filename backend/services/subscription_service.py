@@ -0,0 +1,220 @@
+from contextlib import asynccontextmanager
+from datetime import datetime, timezone
+from typing import Optional, Dict, Any
+import uuid
+from fastapi import HTTPException, status
+from sqlalchemy import event, func, select, update
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session, object_session
+from models.subscription import SubscriptionTier, UserSubscription, UserUsage
+from config.settings import settings
+from utils.cache import TTLCache
+import logging
+
+# Configure logging
+logger = logging.getLogger(__name__)
+
+# Tier limits keyed by tier id, plus the default tier under None; tiers change rarely
+_tier_cache = TTLCache(maxsize=256, ttl=settings.SUBSCRIPTION_TIER_CACHE_TTL)
+# Tier id of each user's active subscription (None for no subscription), keyed by user id
+_user_tier_cache = TTLCache(maxsize=settings.AUTH_USER_CACHE_SIZE, ttl=settings.SUBSCRIPTION_TIER_CACHE_TTL)
+_MISSING = object()
+
+
+def current_usage_period(now: Optional[datetime] = None) -> datetime:
+    """Start of the current monthly usage period (UTC)."""
+    now = now or datetime.now(timezone.utc)
+    return now.replace(day=1, hour=0, minute=0, second=0, microsecond=0)
+
+
+def _tier_to_dict(tier: SubscriptionTier) -> Dict[str, Any]:
+    return {
+        "id": str(tier.id),
+        "name": tier.name,
+        "max_cover_letters": tier.max_cover_letters
+    }
+
+
+async def get_tier(db: AsyncSession, tier_id: Optional[uuid.UUID]) -> Dict[str, Any]:
+    """
+    Get a subscription tier's limits, served from the tier cache when possible.
+
+    Args:
+        db: Database session
+        tier_id: Tier ID, or None for the default tier
+
+    Returns:
+        The tier's id, name and monthly cover letter limit
+    """
+    cache_key = str(tier_id) if tier_id else None
+    tier = _tier_cache.get(cache_key)
+    if tier is not None:
+        return tier
+
+    if tier_id:
+        query = select(SubscriptionTier).where(SubscriptionTier.id == tier_id)
+    else:
+        query = select(SubscriptionTier).where(
+            SubscriptionTier.name == settings.DEFAULT_SUBSCRIPTION_TIER,
+            SubscriptionTier.is_active.is_(True)
+        )
+    result = await db.execute(query)
+    tier_row = result.scalars().first()
+
+    if tier_row is not None:
+        tier = _tier_to_dict(tier_row)
+    else:
+        logger.warning("Subscription tier %s not found, using the default limit", tier_id or settings.DEFAULT_SUBSCRIPTION_TIER)
+        tier = {
+            "id": None,
+            "name": settings.DEFAULT_SUBSCRIPTION_TIER,
+            "max_cover_letters": settings.DEFAULT_MAX_COVER_LETTERS
+        }
+    _tier_cache.set(cache_key, tier)
+    return tier
+
+
+async def get_user_tier(db: AsyncSession, user_id: uuid.UUID) -> Dict[str, Any]:
+    """
+    Get the tier of the user's active subscription, or the default tier if they have none.
+
+    Both lookups are cached, so a warm check costs no queries. ORM writes to
+    UserSubscription invalidate the user's entry; other writers are picked up
+    when the entry expires.
+    """
+    cache_key = str(user_id)
+    tier_id = _user_tier_cache.get(cache_key, _MISSING)
+    if tier_id is _MISSING:
+        result = await db.execute(
+            select(UserSubscription.tier_id)
+            .where(UserSubscription.user_id == user_id, UserSubscription.status == 'active')
+            .order_by(UserSubscription.start_date.desc())
+            .limit(1)
+        )
+        tier_id = result.scalar()
+        _user_tier_cache.set(cache_key, tier_id)
+    return await get_tier(db, tier_id)
+
+
+async def consume_cover_letter_quota(
+    db: AsyncSession,
+    user_id: uuid.UUID,
+    usage_period: Optional[datetime] = None
+) -> int:
+    """
+    Count one cover letter generation against the user's monthly limit.
+
+    The check and the increment are a single INSERT ... ON CONFLICT DO UPDATE
+    whose update only applies below the limit, so parallel requests can never
+    push the count past it. A limit of 0 or less means unlimited; usage is
+    still counted.
+
+    Args:
+        db: Database session
+        user_id: User ID
+        usage_period: Period to count against (default: the current one)
+
+    Returns:
+        The user's cover letter count for the period, including this one
+
+    Raises:
+        HTTPException: 429 if the monthly limit has been reached
+    """
+    tier = await get_user_tier(db, user_id)
+    limit = tier["max_cover_letters"]
+
+    insert_usage = pg_insert(UserUsage).values(
+        id=uuid.uuid4(),
+        user_id=user_id,
+        usage_period=usage_period or current_usage_period(),
+        cover_letters_generated=1
+    )
+    upsert = insert_usage.on_conflict_do_update(
+        index_elements=[UserUsage.user_id, UserUsage.usage_period],
+        set_={"cover_letters_generated": func.coalesce(UserUsage.cover_letters_generated, 0) + 1},
+        where=func.coalesce(UserUsage.cover_letters_generated, 0) < limit if limit > 0 else None
+    ).returning(UserUsage.cover_letters_generated)
+    count = (await db.execute(upsert)).scalar()
+    # Commit right away so the row lock is not held while the letter is generated
+    await db.commit()
+
+    if count is None:
+        raise HTTPException(
+            status_code=status.HTTP_429_TOO_MANY_REQUESTS,
+            detail=f"Monthly limit of {limit} cover letters reached for the {tier['name']} plan"
+        )
+    return count
+
+
+async def release_cover_letter_quota(
+    db: AsyncSession,
+    user_id: uuid.UUID,
+    usage_period: Optional[datetime] = None
+) -> None:
+    """Give back a generation consumed by a request that then failed."""
+    await db.execute(
+        update(UserUsage)
+        .where(
+            UserUsage.user_id == user_id,
+            UserUsage.usage_period == (usage_period or current_usage_period()),
+            UserUsage.cover_letters_generated > 0
+        )
+        .values(cover_letters_generated=UserUsage.cover_letters_generated - 1)
+    )
+    await db.commit()
+
+
+@asynccontextmanager
+async def cover_letter_quota(db: AsyncSession, user_id: uuid.UUID):
+    """
+    Consume one generation for the duration of a block, releasing it if the block raises.
+    """
+    # Pin the period so a release near midnight on the 1st hits the same row
+    usage_period = current_usage_period()
+    await consume_cover_letter_quota(db, user_id, usage_period)
+    try:
+        yield
+    except BaseException:
+        try:
+            # The block may have left the session mid-transaction
+            await db.rollback()
+            await release_cover_letter_quota(db, user_id, usage_period)
+        except Exception as e:
+            logger.error("Failed to release cover letter quota for user %s: %s", user_id, e)
+        raise
+
+
+def invalidate_user_tier_cache(user_id: uuid.UUID) -> None:
+    """Drop the cached subscription tier after the user's subscription changes."""
+    _user_tier_cache.pop(str(user_id))
+
+
+def clear_tier_cache() -> None:
+    """Drop all cached tiers and user subscriptions, e.g. after tier limits are changed."""
+    _tier_cache.clear()
+    _user_tier_cache.clear()
+
+
+@event.listens_for(UserSubscription, "after_insert")
+@event.listens_for(UserSubscription, "after_update")
+@event.listens_for(UserSubscription, "after_delete")
+def _subscription_changed(mapper, connection, target: UserSubscription) -> None:
+    # Invalidate now, and again once the change is committed, so a lookup
+    # racing the transaction cannot leave the old tier cached
+    invalidate_user_tier_cache(target.user_id)
+    session = object_session(target)
+    if session is not None:
+        session.info.setdefault("changed_subscription_users", set()).add(target.user_id)
+
+
+@event.listens_for(Session, "after_commit")
+def _invalidate_committed_subscriptions(session: Session) -> None:
+    for user_id in session.info.pop("changed_subscription_users", ()):
+        invalidate_user_tier_cache(user_id)
+
+
+@event.listens_for(Session, "after_soft_rollback")
+def _discard_rolled_back_subscriptions(session: Session, previous_transaction) -> None:
+    for user_id in session.info.pop("changed_subscription_users", ()):
+        invalidate_user_tier_cache(user_id)
@@ -0,0 +1,148 @@
+"""
+Shared fixtures for the API tests.
+
+The tests drive the app in-process through httpx's ASGI transport, with the
+stubbed providers from benchmarks/stubs.py, and authenticate with the DEV_MODE
+test token. They need a disposable Postgres database migrated to head
+(alembic upgrade head) at DATABASE_URL; without one they are skipped.
+
+Usage (from the backend directory):
+    DATABASE_URL=postgresql://localhost/coverletter_test python -m pytest tests
+"""
+import os
+import sys
+from contextlib import contextmanager
+
+import pytest
+
+BACKEND_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# Must be in place before config.settings is imported
+os.environ.setdefault("DATABASE_URL", "postgresql://localhost/coverletter_test")
+os.environ.setdefault("DEV_MODE", "true")
+os.environ.setdefault("TEST_USER_ID", "test-user")
+os.environ.setdefault("TEST_USER_EMAIL", "test@example.com")
+os.environ.setdefault("TEST_USER_NAME", "Test User")
+os.environ.setdefault("LOG_LEVEL", "WARNING")
+os.environ.setdefault("OTEL_TRACES_EXPORTER", "none")
+sys.path.insert(0, BACKEND_DIR)
+
+AUTH_HEADERS = {"Authorization": "Bearer dev_test_token"}
+
+
+@pytest.fixture
+def anyio_backend():
+    return "asyncio"
+
+
+@pytest.fixture
+async def app():
+    from sqlalchemy import text
+    from sqlalchemy.exc import DBAPIError
+    from main import app
+    from database import engine
+    from benchmarks.stubs import StubBedrockClient, StubSearchClient, StubEmbeddingModel
+
+    try:
+        async with engine.connect() as connection:
+            await connection.execute(text("SELECT 1"))
+    except (OSError, DBAPIError) as e:
+        await engine.dispose()
+        pytest.skip(f"No test database at DATABASE_URL: {e}")
+
+    # Replace the lifespan-managed providers; the lifespan itself would initialize Firebase
+    app.state.bedrock_client = StubBedrockClient()
+    app.state.search_client = StubSearchClient()
+    app.state.embedding_model = StubEmbeddingModel()
+    try:
+        yield app
+    finally:
+        # Pooled connections belong to this test's event loop
+        await engine.dispose()
+
+
+@pytest.fixture
+async def client(app):
+    import httpx
+
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://test", headers=AUTH_HEADERS) as client:
+        response = await client.post("/api/auth/register", json={"full_name": "Test User"})
+        response.raise_for_status()
+        yield client
+
+
+@pytest.fixture
+async def db(app):
+    from database import SessionLocal
+
+    async with SessionLocal() as session:
+        yield session
+
+
+@pytest.fixture
+def count_queries(app):
+    """
+    Context manager counting the SQL statements the app sends while it is open.
+
+    Usage:
+        with count_queries() as queries:
+            ...
+        assert len(queries) == 3
+    """
+    from sqlalchemy import event
+    from database import engine
+
+    @contextmanager
+    def counter():
+        statements = []
+
+        def record(conn, cursor, statement, parameters, context, executemany):
+            statements.append(statement)
+
+        event.listen(engine.sync_engine, "before_cursor_execute", record)
+        try:
+            yield statements
+        finally:
+            event.remove(engine.sync_engine, "before_cursor_execute", record)
+
+    return counter
+
+
+@pytest.fixture
+def make_experience(client):
+    """Create an experience for the test user through the API and return it."""
+    async def create(**fields):
+        body = {
+            "company_name": "Acme",
+            "title": "Software Engineer",
+            "location": "Remote",
+            "start_date": "2020-01-01",
+            "is_current": False,
+            "description": "Built Python APIs with FastAPI and PostgreSQL."
+        }
+        body.update(fields)
+        response = await client.post("/api/experiences/", json=body)
+        assert response.status_code == 201, response.text
+        return response.json()
+
+    return create
+
+
+@pytest.fixture
+def make_cover_letter(client):
+    """Create a cover letter for the test user through the API and return it."""
+    async def create(**fields):
+        body = {
+            "job_title": "Backend Engineer",
+            "company_name": "Acme",
+            "job_description": "Build Python APIs with FastAPI and PostgreSQL.",
+            "tone": "professional",
+            "max_length": 400
+        }
+        body.update(fields)
+        response = await client.post("/api/cover-letters", json=body)
+        assert response.status_code == 200, response.text
+        return response.json()
+
+    return create
@@ -0,0 +1,85 @@
+"""
+Query counts of the cover letter endpoints.
+
+Each read path eager-loads a letter's experience links and experiences with
+selectinload, so the number of statements per request is fixed and must not
+grow with the number of letters or linked experiences.
+"""
+import pytest
+
+pytestmark = pytest.mark.anyio
+
+# cover letters + experience links + experiences
+EAGER_LOADED_READ_QUERIES = 3
+
+
+async def _link_experiences(client, cover_letter_id, experiences):
+    for order, experience in enumerate(experiences, start=1):
+        response = await client.post(
+            f"/api/cover-letters/{cover_letter_id}/experiences/{experience['id']}",
+            params={"relevance_order": order}
+        )
+        assert response.status_code == 200, response.text
+
+
+async def _request_queries(client, count_queries, method, path, **kwargs):
+    # Warm the auth caches first, so only the endpoint's own statements are counted
+    await client.get("/api/cover-letters/summaries", params={"limit": 1})
+    with count_queries() as queries:
+        response = await client.request(method, path, **kwargs)
+    assert response.status_code == 200, response.text
+    return len(queries)
+
+
+async def test_list_query_count_does_not_grow_with_experiences(client, count_queries, make_experience, make_cover_letter):
+    experiences = [await make_experience(company_name=f"Company {i}") for i in range(4)]
+    first = await make_cover_letter()
+    await _link_experiences(client, first["id"], experiences[:1])
+    baseline = await _request_queries(client, count_queries, "GET", "/api/cover-letters")
+
+    second = await make_cover_letter()
+    await _link_experiences(client, second["id"], experiences)
+    assert baseline == EAGER_LOADED_READ_QUERIES
+    assert await _request_queries(client, count_queries, "GET", "/api/cover-letters") == baseline
+
+
+async def test_detail_query_count(client, count_queries, make_experience, make_cover_letter):
+    cover_letter = await make_cover_letter()
+    await _link_experiences(client, cover_letter["id"], [await make_experience() for _ in range(3)])
+
+    queries = await _request_queries(client, count_queries, "GET", f"/api/cover-letters/{cover_letter['id']}")
+    assert queries == EAGER_LOADED_READ_QUERIES
+
+
+async def test_summaries_query_count(client, count_queries, make_experience, make_cover_letter):
+    cover_letter = await make_cover_letter()
+    await _link_experiences(client, cover_letter["id"], [await make_experience()])
+
+    # The summaries never load experiences, so they are a single query
+    assert await _request_queries(client, count_queries, "GET", "/api/cover-letters/summaries") == 1
+
+
+async def test_add_experience_query_count(client, count_queries, make_experience, make_cover_letter):
+    cover_letter = await make_cover_letter()
+    await _link_experiences(client, cover_letter["id"], [await make_experience() for _ in range(3)])
+    experience = await make_experience()
+
+    queries = await _request_queries(
+        client, count_queries, "POST", f"/api/cover-letters/{cover_letter['id']}/experiences/{experience['id']}"
+    )
+    # letter ownership + experience ownership + INSERT ... ON CONFLICT, then the eager-loaded reload
+    assert queries == 3 + EAGER_LOADED_READ_QUERIES
+
+
+async def test_add_existing_experience_keeps_one_link(client, count_queries, make_experience, make_cover_letter):
+    cover_letter = await make_cover_letter()
+    experience = await make_experience()
+    await _link_experiences(client, cover_letter["id"], [experience])
+
+    queries = await _request_queries(
+        client, count_queries, "POST", f"/api/cover-letters/{cover_letter['id']}/experiences/{experience['id']}"
+    )
+    assert queries == 3 + EAGER_LOADED_READ_QUERIES
+
+    response = await client.get(f"/api/cover-letters/{cover_letter['id']}")
+    assert len(response.json()["selected_experiences"]) == 1
@@ -0,0 +1,34 @@
+import uuid
+
+import pytest
+from sqlalchemy import func, select
+
+from models.experience import ExperienceChunk, ExperienceSkill
+
+pytestmark = pytest.mark.anyio
+
+
+async def _row_count(db, model, experience_id):
+    return await db.scalar(
+        select(func.count()).select_from(model).where(model.experience_id == uuid.UUID(experience_id))
+    )
+
+
+async def test_delete_experience_with_skill_tags(client, db, make_experience):
+    experience = await make_experience(description="Built Python APIs with FastAPI and PostgreSQL.")
+    assert await _row_count(db, ExperienceSkill, experience["id"]) > 0
+
+    response = await client.delete(f"/api/experiences/{experience['id']}")
+    assert response.status_code == 204, response.text
+    assert await _row_count(db, ExperienceSkill, experience["id"]) == 0
+
+
+async def test_delete_experience_with_chunks(client, db, make_experience):
+    # Long enough to be split into several chunks
+    description = " ".join(f"Shipped feature {i} for the billing platform." for i in range(60))
+    experience = await make_experience(description=description)
+    assert await _row_count(db, ExperienceChunk, experience["id"]) > 1
+
+    response = await client.delete(f"/api/experiences/{experience['id']}")
+    assert response.status_code == 204, response.text
+    assert await _row_count(db, ExperienceChunk, experience["id"]) == 0
@@ -0,0 +1,61 @@
+import jwt
+import pytest
+from cryptography.hazmat.primitives import serialization
+from cryptography.hazmat.primitives.asymmetric import rsa
+
+from utils.firebase_tokens import FirebaseTokenVerifier, GoogleCertKeySource
+
+pytestmark = pytest.mark.anyio
+
+
+class CountingCertKeySource(GoogleCertKeySource):
+    """Serves a local key set instead of Google's and counts the fetches."""
+
+    def __init__(self, certs, **kwargs):
+        super().__init__(**kwargs)
+        self.certs = certs
+        self.fetches = 0
+
+    def _fetch(self):
+        self.fetches += 1
+        return dict(self.certs), 3600
+
+
+@pytest.fixture
+def private_key():
+    return rsa.generate_private_key(public_exponent=65537, key_size=2048)
+
+
+@pytest.fixture
+def certs(private_key):
+    pem = private_key.public_key().public_bytes(
+        serialization.Encoding.PEM, serialization.PublicFormat.SubjectPublicKeyInfo
+    )
+    return {"known": pem.decode()}
+
+
+def unknown_kid_token(private_key):
+    return jwt.encode({"sub": "user"}, private_key, algorithm="RS256", headers={"kid": "unknown"})
+
+
+async def test_unknown_kids_refetch_at_most_once_per_interval(private_key, certs):
+    key_source = CountingCertKeySource(certs, min_forced_interval=60)
+    verifier = FirebaseTokenVerifier("project", key_source)
+
+    for _ in range(5):
+        with pytest.raises(ValueError, match="unknown key"):
+            await verifier.verify(unknown_kid_token(private_key))
+
+    # The initial load plus a single forced refresh
+    assert key_source.fetches == 2
+
+
+async def test_forced_refresh_allowed_again_after_interval(private_key, certs):
+    key_source = CountingCertKeySource(certs, min_forced_interval=0)
+    verifier = FirebaseTokenVerifier("project", key_source)
+
+    for _ in range(3):
+        with pytest.raises(ValueError, match="unknown key"):
+            await verifier.verify(unknown_kid_token(private_key))
+
+    assert key_source.fetches == 4
@@ -0,0 +1,57 @@
+import uuid
+
+import numpy as np
+import pytest
+from sqlalchemy import delete
+
+from models.application import JobApplication
+from models.auth import User
+from services.job_application_service import find_similar_job_applications
+
+pytestmark = pytest.mark.anyio
+
+DIMENSION = 384
+
+
+def _vector(rng, base, noise):
+    vector = base + noise * rng.standard_normal(DIMENSION)
+    return [float(value) for value in vector]
+
+
+def _user():
+    suffix = uuid.uuid4().hex
+    return User(email=f"{suffix}@example.com", firebase_uid=suffix, full_name="Similar Search", is_active=True)
+
+
+def _application(user, embedding, title):
+    return JobApplication(
+        user=user,
+        company_name="Acme",
+        job_title=title,
+        job_description="Build Python APIs.",
+        content_for_embedding=title,
+        embedding=embedding
+    )
+
+
+async def test_similar_applications_are_not_crowded_out_by_other_users(db):
+    rng = np.random.default_rng(0)
+    query = rng.standard_normal(DIMENSION)
+    user, other_user = _user(), _user()
+
+    # The other user's applications are all nearer the query than any of the user's,
+    # many more of them than the limit
+    db.add_all([_application(other_user, _vector(rng, query, 0.01), f"Other {i}") for i in range(100)])
+    db.add_all([_application(user, _vector(rng, query, 1.0), f"Own {i}") for i in range(3)])
+    await db.commit()
+
+    try:
+        results = await find_similar_job_applications(db, user.id, [float(value) for value in query], limit=5)
+        assert sorted(result["job_title"] for result in results) == ["Own 0", "Own 1", "Own 2"]
+        assert all(result["user_id"] == user.id for result in results)
+        similarities = [result["similarity"] for result in results]
+        assert similarities == sorted(similarities, reverse=True)
+    finally:
+        # Applications go with their users through ON DELETE CASCADE
+        await db.execute(delete(User).where(User.id.in_([user.id, other_user.id])))
+        await db.commit()
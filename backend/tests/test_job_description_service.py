@@ -0,0 +1,40 @@
+from services.job_description_service import preprocess_job_description
+
+POSTING = """About Acme
+We build developer tools.
+
+Requirements:
+- Python
+- PostgreSQL
+You will also work with the following tools:
+- Kubernetes
+- Terraform
+
+Tech stack:
+- FastAPI
+- Redis
+
+Benefits:
+- Health insurance
+- Equal opportunity employer"""
+
+
+def test_lead_in_lines_keep_their_list_in_the_section():
+    requirements = preprocess_job_description(POSTING)["requirements"]
+
+    assert "Requirements:\n- Python\n- PostgreSQL\nYou will also work with the following tools:" in requirements
+    assert "- Kubernetes\n- Terraform" in requirements
+
+
+def test_unrecognized_sections_stay_in_requirements():
+    requirements = preprocess_job_description(POSTING)["requirements"]
+
+    assert "Tech stack:\n- FastAPI\n- Redis" in requirements
+    assert "developer tools" not in requirements
+    assert "Health insurance" not in requirements
+
+
+def test_postings_without_sections_are_used_whole():
+    posting = "Build Python APIs with FastAPI.\nYou will work with:\n- Kubernetes"
+
+    assert preprocess_job_description(posting)["requirements"] == posting
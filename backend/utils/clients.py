@@ -0,0 +1,45 @@
+from fastapi import Request
+from config.settings import settings
+
+# Shared external clients. They are created once by the app lifespan in main.py,
+# stored on app.state and handed to routes through the dependencies below.
+
+
+def create_bedrock_client():
+    """Create the Bedrock runtime client shared by all requests in this process."""
+    import boto3
+    from botocore.config import Config
+
+    return boto3.client(
+        service_name='bedrock-runtime',
+        region_name=settings.AWS_REGION,
+        config=Config(
+            # One pooled HTTP connection per concurrent Bedrock call
+            max_pool_connections=settings.BEDROCK_MAX_POOL_CONNECTIONS,
+            retries={"max_attempts": settings.BEDROCK_MAX_ATTEMPTS, "mode": "adaptive"},
+            connect_timeout=settings.BEDROCK_CONNECT_TIMEOUT,
+            read_timeout=settings.BEDROCK_READ_TIMEOUT,
+        ),
+    )
+
+
+def create_search_client():
+    """Create the SerpAPI search utility."""
+    from langchain_community.utilities import SerpAPIWrapper
+
+    return SerpAPIWrapper()
+
+
+def get_bedrock_client_dependency(request: Request):
+    """Dependency returning the shared Bedrock runtime client."""
+    return request.app.state.bedrock_client
+
+
+def get_search_client_dependency(request: Request):
+    """Dependency returning the shared SerpAPI search utility."""
+    return request.app.state.search_client
+
+
+def get_embedding_model_dependency(request: Request):
+    """Dependency returning the shared sentence transformer."""
+    return request.app.state.embedding_model
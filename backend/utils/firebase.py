@@ -1,20 +1,29 @@
-import os
-import firebase_admin
-from firebase_admin import credentials, firestore, auth
+import threading
 from config.settings import settings
 
-# Initialize Firebase Admin SDK only once for the entire application
-# The service account requires a JSON file, not client-side config
-try:
-    # Check if already initialized
-    firebase_app = firebase_admin.get_app()
-except ValueError:
-    # If not initialized, initialize with service account
-    cred = credentials.Certificate(settings.FIREBASE_SERVICE_ACCOUNT_PATH)
-    firebase_app = firebase_admin.initialize_app(cred)
+# The Firebase Admin SDK is initialized on first use (or by the app lifespan),
+# so importing this module needs neither the SDK's startup cost nor credentials
+_init_lock = threading.Lock()
 
-# Create clients to use in other modules
-firestore_db = firestore.client()
-firebase_auth = auth
 
-# Export the initialized app and clients
\ No newline at end of file
+def get_firebase_app():
+    """Return the Firebase app, initializing it with the service account on first use."""
+    import firebase_admin
+    from firebase_admin import credentials
+
+    with _init_lock:
+        try:
+            # Check if already initialized
+            return firebase_admin.get_app()
+        except ValueError:
+            # If not initialized, initialize with service account
+            cred = credentials.Certificate(settings.FIREBASE_SERVICE_ACCOUNT_PATH)
+            return firebase_admin.initialize_app(cred)
+
+
+def get_firebase_auth():
+    """Return the firebase_admin.auth module bound to the initialized app."""
+    from firebase_admin import auth
+
+    get_firebase_app()
+    return auth
@@ -0,0 +1,171 @@
+import asyncio
+import json
+import logging
+import re
+import time
+import urllib.request
+from typing import Any, Dict, Optional, Tuple
+
+import jwt
+from cryptography.hazmat.primitives.serialization import load_pem_public_key
+from cryptography.x509 import load_pem_x509_certificate
+
+from config.settings import settings
+
+logger = logging.getLogger(__name__)
+
+# Public certificates Google uses to sign Firebase ID tokens
+GOOGLE_CERTS_URL = "https://www.googleapis.com/robot/v1/metadata/x509/securetoken@system.gserviceaccount.com"
+DEFAULT_MAX_AGE = 3600  # Seconds, used when the response has no Cache-Control max-age
+
+
+def load_public_key(pem: str):
+    """Load a public key from a PEM encoded X.509 certificate or public key."""
+    data = pem.encode()
+    if b"BEGIN CERTIFICATE" in data:
+        return load_pem_x509_certificate(data).public_key()
+    return load_pem_public_key(data)
+
+
+def resolve_project_id() -> Optional[str]:
+    """Firebase project ID from settings, falling back to the service account file."""
+    if settings.FIREBASE_PROJECT_ID:
+        return settings.FIREBASE_PROJECT_ID
+    if settings.FIREBASE_SERVICE_ACCOUNT_PATH:
+        try:
+            with open(settings.FIREBASE_SERVICE_ACCOUNT_PATH) as f:
+                return json.load(f).get("project_id")
+        except (OSError, ValueError) as e:
+            logger.warning("Could not read project_id from service account: %s", e)
+    return None
+
+
+class KeySource:
+    """Source of the public keys used to verify ID tokens, keyed by key ID."""
+
+    async def get_keys(self, force_refresh: bool = False) -> Dict[str, Any]:
+        raise NotImplementedError
+
+
+class StaticKeySource(KeySource):
+    """Fixed key set, e.g. a locally generated key pair for tests."""
+
+    def __init__(self, keys: Dict[str, str]):
+        self._keys = {kid: load_public_key(pem) for kid, pem in keys.items()}
+
+    async def get_keys(self, force_refresh: bool = False) -> Dict[str, Any]:
+        return self._keys
+
+
+class GoogleCertKeySource(KeySource):
+    """
+    Google's published signing certificates, cached for the Cache-Control max-age.
+
+    Keys close to expiry are served while a background task refreshes them, so
+    only the very first request (or one after a long idle period) waits on the network.
+    Forced refreshes, requested for tokens with an unknown key ID, happen at most
+    once per min_forced_interval, so garbage tokens cannot make every request fetch.
+    """
+
+    def __init__(
+        self,
+        url: str = GOOGLE_CERTS_URL,
+        refresh_margin: float = 300.0,
+        timeout: float = 10.0,
+        min_forced_interval: float = 60.0
+    ):
+        self.url = url
+        self.refresh_margin = refresh_margin
+        self.timeout = timeout
+        self.min_forced_interval = min_forced_interval
+        self._keys: Dict[str, Any] = {}
+        self._expires_at = 0.0
+        self._forced_at: Optional[float] = None
+        self._lock = asyncio.Lock()
+        self._refresh_task: Optional[asyncio.Task] = None
+
+    async def get_keys(self, force_refresh: bool = False) -> Dict[str, Any]:
+        now = time.monotonic()
+        if force_refresh and self._keys and not self._forced_refresh_allowed(now):
+            # Refetched recently; the key set cannot have rotated again since
+            force_refresh = False
+        if force_refresh or not self._keys or now >= self._expires_at:
+            await self._refresh(force=force_refresh)
+        elif now >= self._expires_at - self.refresh_margin and self._refresh_task is None:
+            self._refresh_task = asyncio.create_task(self._background_refresh())
+        return self._keys
+
+    def _forced_refresh_allowed(self, now: float) -> bool:
+        return self._forced_at is None or now - self._forced_at >= self.min_forced_interval
+
+    async def _background_refresh(self) -> None:
+        try:
+            await self._refresh()
+        except Exception as e:
+            logger.warning("Background refresh of Firebase signing keys failed: %s", e)
+        finally:
+            self._refresh_task = None
+
+    async def _refresh(self, force: bool = False) -> None:
+        async with self._lock:
+            # Another request may have refreshed the keys while this one waited
+            now = time.monotonic()
+            if self._keys and now < self._expires_at - self.refresh_margin:
+                if not force or not self._forced_refresh_allowed(now):
+                    return
+            if force:
+                # Counted from the attempt, so a failing endpoint is not retried on every request
+                self._forced_at = now
+            certs, max_age = await asyncio.to_thread(self._fetch)
+            self._keys = {kid: load_public_key(pem) for kid, pem in certs.items()}
+            self._expires_at = time.monotonic() + max_age
+            logger.info("Loaded %d Firebase signing keys, valid for %ds", len(self._keys), max_age)
+
+    def _fetch(self) -> Tuple[Dict[str, str], int]:
+        with urllib.request.urlopen(self.url, timeout=self.timeout) as response:
+            certs = json.loads(response.read())
+            cache_control = response.headers.get("Cache-Control", "")
+        match = re.search(r"max-age=(\d+)", cache_control)
+        return certs, int(match.group(1)) if match else DEFAULT_MAX_AGE
+
+
+class FirebaseTokenVerifier:
+    """Verifies Firebase ID tokens locally against a KeySource."""
+
+    def __init__(self, project_id: str, key_source: KeySource, leeway: int = 60):
+        self.project_id = project_id
+        self.key_source = key_source
+        self.leeway = leeway
+
+    async def verify(self, token: str) -> Dict[str, Any]:
+        """Verify the token signature and claims, returning the decoded claims with a uid field."""
+        header = jwt.get_unverified_header(token)
+        if header.get("alg") != "RS256":
+            raise ValueError("ID token must be signed with RS256")
+
+        kid = header.get("kid")
+        keys = await self.key_source.get_keys()
+        if kid not in keys:
+            # Keys may have rotated since they were cached
+            keys = await self.key_source.get_keys(force_refresh=True)
+        if kid not in keys:
+            raise ValueError("ID token signed with an unknown key")
+
+        claims = jwt.decode(
+            token,
+            key=keys[kid],
+            algorithms=["RS256"],
+            audience=self.project_id,
+            issuer=f"https://securetoken.google.com/{self.project_id}",
+            leeway=self.leeway,
+            options={"require": ["exp", "iat", "aud", "iss", "sub"]},
+        )
+
+        subject = claims.get("sub")
+        if not isinstance(subject, str) or not subject or len(subject) > 128:
+            raise ValueError("ID token has an invalid subject")
+        if claims.get("auth_time", 0) > time.time() + self.leeway:
+            raise ValueError("ID token has an auth_time in the future")
+
+        claims["uid"] = subject
+        return claims
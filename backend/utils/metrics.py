@@ -0,0 +1,68 @@
+import time
+from contextlib import contextmanager
+from typing import Callable
+
+from prometheus_client import CONTENT_TYPE_LATEST, Gauge, Histogram, generate_latest
+from sqlalchemy import event
+
+# Latency buckets in seconds, from fast DB queries up to slow LLM generations
+LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0)
+
+REQUEST_LATENCY = Histogram(
+    "http_request_duration_seconds",
+    "HTTP request latency by route",
+    ["method", "route", "status"],
+    buckets=LATENCY_BUCKETS,
+)
+STAGE_LATENCY = Histogram(
+    "pipeline_stage_duration_seconds",
+    "Latency of individual stages (DB queries, embedding, SerpAPI, Bedrock)",
+    ["stage"],
+    buckets=LATENCY_BUCKETS,
+)
+DB_POOL_WAIT = Histogram(
+    "db_pool_wait_seconds",
+    "Time spent waiting for a database connection from the pool",
+    buckets=LATENCY_BUCKETS,
+)
+
+
+@contextmanager
+def track_stage(stage: str):
+    """Record the duration of the enclosed block under the given stage label."""
+    started = time.perf_counter()
+    try:
+        yield
+    finally:
+        STAGE_LATENCY.labels(stage).observe(time.perf_counter() - started)
+
+
+def instrument_engine(engine) -> None:
+    """Time every statement executed through the engine as the db_query stage."""
+    sync_engine = getattr(engine, "sync_engine", engine)
+
+    @event.listens_for(sync_engine, "before_cursor_execute")
+    def _before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+        conn.info.setdefault("query_started", []).append(time.perf_counter())
+
+    @event.listens_for(sync_engine, "after_cursor_execute")
+    def _after_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+        started = conn.info["query_started"].pop()
+        STAGE_LATENCY.labels("db_query").observe(time.perf_counter() - started)
+
+
+def register_pool_metrics(get_pool_metrics: Callable[[], dict]) -> None:
+    """Export the connection pool state as gauges read at scrape time."""
+    for key, description in (
+        ("pool_size", "Configured connection pool size"),
+        ("checked_out", "Connections currently checked out"),
+        ("checked_in", "Idle connections in the pool"),
+        ("overflow", "Connections open beyond the pool size"),
+    ):
+        gauge = Gauge(f"db_pool_{key}", description)
+        gauge.set_function(lambda key=key: get_pool_metrics()[key])
+
+
+def render_metrics():
+    """Return the Prometheus exposition body and its content type."""
+    return generate_latest(), CONTENT_TYPE_LATEST
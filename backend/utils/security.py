@@ -1,10 +1,11 @@
 from fastapi import Depends, HTTPException, Header
-from sqlalchemy.orm import Session
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
 from firebase_admin import auth as firebase_auth
 from database import get_db
 from models.user import User
 
-async def get_current_user(authorization: str = Header(None), db: Session = Depends(get_db)):
+async def get_current_user(authorization: str = Header(None), db: AsyncSession = Depends(get_db)):
     """Dependency to get the current user from Firebase token"""
     if not authorization or not authorization.startswith("Bearer "):
         raise HTTPException(status_code=401, detail="Invalid authentication credentials")
@@ -17,7 +18,8 @@ async def get_current_user(authorization: str = Header(None), db: Session = Depe
         email = decoded_token.get("email")
         
         # Find user in your database
-        user = db.query(User).filter(User.email == email).first()
+        result = await db.execute(select(User).where(User.email == email))
+        user = result.scalars().first()
         
         if not user:
             raise HTTPException(status_code=404, detail="User not found")
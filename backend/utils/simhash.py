@@ -0,0 +1,45 @@
+import hashlib
+import re
+
+SIMHASH_BITS = 64
+_MASK = (1 << SIMHASH_BITS) - 1
+_TOKEN = re.compile(r"[a-z0-9]+")
+
+
+def _shingles(text: str, size: int = 3):
+    """Overlapping word n-grams of the normalized text (the words themselves for short texts)."""
+    words = _TOKEN.findall(text.lower())
+    if len(words) < size:
+        return words
+    return [" ".join(words[i:i + size]) for i in range(len(words) - size + 1)]
+
+
+def simhash(text: str) -> int:
+    """
+    64-bit SimHash of a text's word shingles, as a signed integer for a BIGINT column.
+
+    Texts differing by small edits (whitespace, punctuation, a changed sentence)
+    get signatures only a few bits apart.
+    """
+    weights = [0] * SIMHASH_BITS
+    for shingle in _shingles(text):
+        value = int.from_bytes(hashlib.blake2b(shingle.encode(), digest_size=8).digest(), "little")
+        for bit in range(SIMHASH_BITS):
+            weights[bit] += 1 if value >> bit & 1 else -1
+
+    signature = 0
+    for bit, weight in enumerate(weights):
+        if weight > 0:
+            signature |= 1 << bit
+    # Two's complement so the value fits a signed 64-bit column
+    return signature - (1 << SIMHASH_BITS) if signature >> (SIMHASH_BITS - 1) else signature
+
+
+def hamming_distance(a: int, b: int) -> int:
+    """Number of differing bits between two signatures."""
+    return bin((a ^ b) & _MASK).count("1")
+
+
+def simhash_similarity(a: int, b: int) -> float:
+    """Fraction of matching bits between two signatures, from 0 to 1."""
+    return 1 - hamming_distance(a, b) / SIMHASH_BITS
@@ -0,0 +1,88 @@
+from collections import deque
+from typing import Any, Dict, Hashable, Iterator, List, Set, Tuple
+
+
+def _is_boundary(text: str, index: int) -> bool:
+    """Whether position index is outside the text or not part of a word."""
+    return index < 0 or index >= len(text) or not text[index].isalnum()
+
+
+class SkillMatcher:
+    """
+    Aho-Corasick matcher that finds every vocabulary term in a text in one pass.
+
+    Matching is case-insensitive and only counts whole words, so "java" does not
+    match inside "javascript" while terms with punctuation like "c++" or
+    "node.js" still match.
+    """
+
+    def __init__(self, terms: Dict[str, Hashable]):
+        # Trie transitions, failure links and (term length, value) outputs per state
+        self._goto = [{}]
+        self._fail = [0]
+        self._output = [[]]
+        self._size = 0
+
+        for term, value in terms.items():
+            key = term.strip().lower()
+            if not key:
+                continue
+            state = 0
+            for char in key:
+                next_state = self._goto[state].get(char)
+                if next_state is None:
+                    next_state = len(self._goto)
+                    self._goto[state][char] = next_state
+                    self._goto.append({})
+                    self._fail.append(0)
+                    self._output.append([])
+                state = next_state
+            self._output[state].append((len(key), value))
+            self._size += 1
+
+        # Breadth-first so each failure link points at an already-linked state
+        queue = deque(self._goto[0].values())
+        while queue:
+            state = queue.popleft()
+            for char, child in self._goto[state].items():
+                queue.append(child)
+                fallback = self._fail[state]
+                while fallback and char not in self._goto[fallback]:
+                    fallback = self._fail[fallback]
+                self._fail[child] = self._goto[fallback].get(char, 0)
+                self._output[child].extend(self._output[self._fail[child]])
+
+    def __len__(self) -> int:
+        return self._size
+
+    def _matches(self, text: str) -> Iterator[Tuple[int, Any]]:
+        """Yield (start index, value) for every whole-word term occurrence in text."""
+        text = text.lower()
+        state = 0
+        for index, char in enumerate(text):
+            while state and char not in self._goto[state]:
+                state = self._fail[state]
+            state = self._goto[state].get(char, 0)
+            for length, value in self._output[state]:
+                if _is_boundary(text, index - length) and _is_boundary(text, index + 1):
+                    yield index + 1 - length, value
+
+    def find(self, text: str) -> Set[Any]:
+        """Return the values of all terms found in text."""
+        if not text:
+            return set()
+        return {value for _, value in self._matches(text)}
+
+    def find_ranked(self, text: str) -> List[Any]:
+        """
+        Return the values of all terms found in text, most frequently mentioned
+        first; ties go to the term mentioned earliest.
+        """
+        if not text:
+            return []
+        counts: Dict[Any, int] = {}
+        first_seen: Dict[Any, int] = {}
+        for start, value in self._matches(text):
+            counts[value] = counts.get(value, 0) + 1
+            first_seen[value] = min(start, first_seen.get(value, start))
+        return sorted(counts, key=lambda value: (-counts[value], first_seen[value]))
@@ -0,0 +1,44 @@
+import re
+from typing import List
+
+_PARAGRAPH_BREAK = re.compile(r"\n\s*\n")
+_SENTENCE_END = re.compile(r"(?<=[.!?])\s+|\n+")
+
+
+def split_sentences(text: str) -> List[str]:
+    """Split text into sentences and bullet points, paragraph by paragraph."""
+    sentences = []
+    for paragraph in _PARAGRAPH_BREAK.split(text or ""):
+        sentences.extend(part.strip() for part in _SENTENCE_END.split(paragraph) if part and part.strip())
+    return sentences
+
+
+def chunk_text(text: str, max_words: int = 120) -> List[str]:
+    """
+    Pack consecutive sentences into chunks of at most max_words words.
+
+    Sentences longer than max_words are split on word boundaries. Chunks stay
+    well under the 256-token input limit of all-MiniLM-L6-v2 at the default size,
+    so no part of a long text is silently truncated.
+    """
+    chunks = []
+    current: List[str] = []
+    current_words = 0
+    for sentence in split_sentences(text):
+        words = sentence.split()
+        while len(words) > max_words:
+            if current:
+                chunks.append(" ".join(current))
+                current, current_words = [], 0
+            chunks.append(" ".join(words[:max_words]))
+            words = words[max_words:]
+        if not words:
+            continue
+        if current_words + len(words) > max_words:
+            chunks.append(" ".join(current))
+            current, current_words = [], 0
+        current.append(" ".join(words))
+        current_words += len(words)
+    if current:
+        chunks.append(" ".join(current))
+    return chunks
@@ -0,0 +1,45 @@
+import logging
+from typing import Optional
+
+from opentelemetry import trace
+from opentelemetry.sdk.resources import Resource
+from opentelemetry.sdk.trace import TracerProvider
+from opentelemetry.sdk.trace.export import BatchSpanProcessor, ConsoleSpanExporter
+
+from config.settings import settings
+
+logger = logging.getLogger(__name__)
+
+# Spans are no-ops until setup_tracing() installs an SDK tracer provider
+tracer = trace.get_tracer("coverletter-ai")
+
+
+def setup_tracing() -> Optional[TracerProvider]:
+    """
+    Install a tracer provider exporting spans as configured by OTEL_TRACES_EXPORTER:
+    "console" prints spans to stdout, "otlp" sends them to a collector over OTLP/HTTP,
+    and "none" (the default) leaves tracing disabled.
+    """
+    exporter_name = settings.OTEL_TRACES_EXPORTER.lower()
+    if exporter_name == "none":
+        return None
+
+    if exporter_name == "console":
+        exporter = ConsoleSpanExporter()
+    elif exporter_name == "otlp":
+        from opentelemetry.exporter.otlp.proto.http.trace_exporter import OTLPSpanExporter
+        exporter = OTLPSpanExporter(endpoint=settings.OTEL_EXPORTER_OTLP_ENDPOINT)
+    else:
+        logger.warning("Unknown OTEL_TRACES_EXPORTER '%s', tracing disabled", exporter_name)
+        return None
+
+    provider = TracerProvider(resource=Resource.create({"service.name": settings.OTEL_SERVICE_NAME}))
+    provider.add_span_processor(BatchSpanProcessor(exporter))
+    trace.set_tracer_provider(provider)
+    logger.info("Tracing enabled with the %s exporter", exporter_name)
+    return provider
+
+
+def estimate_token_count(text: str) -> int:
+    """Rough token count for a prompt (about four characters per token)."""
+    return max(1, len(text) // 4)
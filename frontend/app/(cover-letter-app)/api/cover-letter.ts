@@ -1,5 +1,5 @@
 import { getAuthFromStorage } from '@/lib/sessionStorage';
-import { authenticatedRequest } from '@/lib/apiClient';
+import { authenticatedListRequest, authenticatedRequest } from '@/lib/apiClient';
 
 const API_URL = process.env.NEXT_PUBLIC_API_URL || 'http://localhost:8000/api';
 
@@ -50,10 +50,10 @@ export const createCoverLetter = async (coverLetter: CoverLetterCreate): Promise
   }
 };
 
-// Get all cover letters for the current user
+// Get all cover letters for the current user, following every page of the listing
 export const getUserCoverLetters = async (): Promise<CoverLetter[]> => {
   try {
-    return await authenticatedRequest<CoverLetter[]>('cover-letters', {
+    return await authenticatedListRequest<CoverLetter>('cover-letters?limit=200', {
       method: 'GET'
     });
   } catch (error) {
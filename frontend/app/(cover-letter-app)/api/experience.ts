@@ -1,5 +1,5 @@
 import { getAuthFromStorage } from '@/lib/sessionStorage';
-import { authenticatedRequest } from '@/lib/apiClient';
+import { authenticatedListRequest, authenticatedRequest } from '@/lib/apiClient';
 
 const API_URL = process.env.NEXT_PUBLIC_API_URL || 'http://localhost:8000/api';
 
@@ -55,10 +55,10 @@ export const createExperience = async (experience: ExperienceCreate): Promise<Ex
   }
 };
 
-// Get all experiences for the current user
+// Get all experiences for the current user, following every page of the listing
 export const getUserExperiences = async (): Promise<Experience[]> => {
   try {
-    return await authenticatedRequest<Experience[]>('experiences', {
+    return await authenticatedListRequest<Experience>('experiences?limit=500', {
       method: 'GET'
     });
   } catch (error) {
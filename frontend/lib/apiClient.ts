@@ -23,49 +23,61 @@ export const getAuthHeaders = () => {
 };
 
 /**
- * Fetch API wrapper that handles authentication errors
+ * Fetch wrapper that handles authentication errors and returns the raw response
  */
-export const apiRequest = async <T>(
+const apiFetch = async (
   endpoint: string,
   options: ApiRequestOptions = {}
-): Promise<T> => {
+): Promise<Response> => {
   const { skipAuthCheck = false, headers, ...restOptions } = options;
   
-  try {
-    // Get full URL
-    const url = endpoint.startsWith('http') ? endpoint : `${API_URL}${endpoint.startsWith('/') ? endpoint : `/${endpoint}`}`;
-    
-    // Make the request
-    const response = await fetch(url, {
-      ...restOptions,
-      headers: {
-        ...headers
+  // Get full URL
+  const url = endpoint.startsWith('http') ? endpoint : `${API_URL}${endpoint.startsWith('/') ? endpoint : `/${endpoint}`}`;
+  
+  // Make the request
+  const response = await fetch(url, {
+    ...restOptions,
+    headers: {
+      ...headers
+    }
+  });
+  
+  // Handle non-OK responses
+  if (!response.ok) {
+    // Check for authentication errors unless skipAuthCheck is true
+    if (!skipAuthCheck) {
+      const authErrorHandled = await handleApiError(response);
+      if (authErrorHandled) {
+        throw new Error('Authentication error');
       }
-    });
+    }
     
-    // Handle non-OK responses
-    if (!response.ok) {
-      // Check for authentication errors unless skipAuthCheck is true
-      if (!skipAuthCheck) {
-        const authErrorHandled = await handleApiError(response);
-        if (authErrorHandled) {
-          throw new Error('Authentication error');
-        }
-      }
-      
-      // Try to get detailed error message
-      let errorDetail = 'An error occurred';
-      try {
-        const errorData = await response.json();
-        errorDetail = errorData.detail || errorData.message || 'An error occurred';
-      } catch (e) {
-        // If response is not JSON, use status text
-        errorDetail = response.statusText;
-      }
-      
-      throw new Error(errorDetail);
+    // Try to get detailed error message
+    let errorDetail = 'An error occurred';
+    try {
+      const errorData = await response.json();
+      errorDetail = errorData.detail || errorData.message || 'An error occurred';
+    } catch (e) {
+      // If response is not JSON, use status text
+      errorDetail = response.statusText;
     }
     
+    throw new Error(errorDetail);
+  }
+  
+  return response;
+};
+
+/**
+ * Fetch API wrapper that handles authentication errors
+ */
+export const apiRequest = async <T>(
+  endpoint: string,
+  options: ApiRequestOptions = {}
+): Promise<T> => {
+  try {
+    const response = await apiFetch(endpoint, options);
+    
     // Parse and return the response
     if (response.status === 204) {
       // No content
@@ -102,4 +114,40 @@ export const authenticatedRequest = async <T>(
     console.error(`Authenticated request error: ${error}`);
     throw error;
   }
-}; 
\ No newline at end of file
+}; 
+
+/**
+ * Fetch every page of a cursor-paginated list endpoint, following the
+ * X-Next-Cursor header until the last page
+ */
+export const authenticatedListRequest = async <T>(
+  endpoint: string,
+  options: ApiRequestOptions = {}
+): Promise<T[]> => {
+  const { headers, ...restOptions } = options;
+  const items: T[] = [];
+  let cursor: string | null = null;
+  
+  try {
+    const authHeaders = getAuthHeaders();
+    
+    do {
+      const separator = endpoint.includes('?') ? '&' : '?';
+      const pageEndpoint: string = cursor ? `${endpoint}${separator}cursor=${encodeURIComponent(cursor)}` : endpoint;
+      const response = await apiFetch(pageEndpoint, {
+        ...restOptions,
+        headers: {
+          ...authHeaders,
+          ...headers
+        }
+      });
+      items.push(...(await response.json() as T[]));
+      cursor = response.headers.get('X-Next-Cursor');
+    } while (cursor);
+    
+    return items;
+  } catch (error) {
+    console.error(`Authenticated list request error: ${error}`);
+    throw error;
+  }
+};